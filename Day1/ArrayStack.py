@@ -1,35 +1,96 @@
 class ArrayStack:
-    def __init__(self, capacity=10):
-        self.arr = [None] * capacity
+    def __init__(self, capacity=10, growable=False):
+        if growable and capacity <= 0:
+            raise ValueError("Chunk size must be positive")
+        if capacity < 0:
+            raise ValueError(f"Illegal Capacity: {capacity}")
+        # A growable stack adds fixed-size chunks of `capacity` slots instead
+        # of reallocating, so existing elements are never copied.
+        self.capacity = None if growable else capacity
+        self.chunk_size = max(capacity, 1)
+        self.chunks = [[None] * capacity]
         self.size = 0
 
     def is_empty(self):
         return self.size == 0
 
+    def is_full(self):
+        return self.capacity is not None and self.size == self.capacity
+
+    def _release_chunks(self):
+        # Keep one spare chunk past the top so push/pop at a chunk boundary
+        # does not allocate and free a chunk on every call.
+        needed = -(-self.size // self.chunk_size) + 1
+        while len(self.chunks) > needed:
+            self.chunks.pop()
+
     def push(self, elem):
-        if self.size == len(self.arr):
+        if self.is_full():
             raise RuntimeError("Stack is full")
-        self.arr[self.size] = elem
+        chunk, offset = divmod(self.size, self.chunk_size)
+        if chunk == len(self.chunks):
+            self.chunks.append([None] * self.chunk_size)
+        self.chunks[chunk][offset] = elem
         self.size += 1
 
+    def push_many(self, items):
+        items = list(items)
+        if self.capacity is not None and self.size + len(items) > self.capacity:
+            raise RuntimeError("Stack is full")
+        pos = 0
+        while pos < len(items):
+            chunk, offset = divmod(self.size, self.chunk_size)
+            if chunk == len(self.chunks):
+                self.chunks.append([None] * self.chunk_size)
+            count = min(self.chunk_size - offset, len(items) - pos)
+            self.chunks[chunk][offset:offset + count] = items[pos:pos + count]
+            pos += count
+            self.size += count
+
     def pop(self):
         if self.is_empty():
             raise IndexError("Pop from empty stack")
         self.size -= 1
-        elem = self.arr[self.size]
-        self.arr[self.size] = None
+        chunk, offset = divmod(self.size, self.chunk_size)
+        elem = self.chunks[chunk][offset]
+        self.chunks[chunk][offset] = None
+        if offset == 0 and len(self.chunks) > chunk + 2:
+            self.chunks.pop()
         return elem
 
+    def pop_many(self, n):
+        if n < 0:
+            raise ValueError("Count must be non-negative")
+        if n > self.size:
+            raise IndexError("Pop from empty stack")
+        result = []
+        while n:
+            chunk, offset = divmod(self.size - 1, self.chunk_size)
+            count = min(offset + 1, n)
+            start = offset + 1 - count
+            segment = self.chunks[chunk][start:offset + 1]
+            segment.reverse()
+            result.extend(segment)
+            self.chunks[chunk][start:offset + 1] = [None] * count
+            self.size -= count
+            n -= count
+        self._release_chunks()
+        return result
+
     def peek(self):
         if self.is_empty():
             raise IndexError("Peek from empty stack")
-        return self.arr[self.size - 1]
+        chunk, offset = divmod(self.size - 1, self.chunk_size)
+        return self.chunks[chunk][offset]
 
     def __len__(self):
         return self.size
 
     def __str__(self):
-        return "[ " + ", ".join(str(self.arr[i]) for i in range(self.size)) + " ]"
+        vals = []
+        for chunk in self.chunks:
+            vals.extend(str(elem) for elem in chunk[:self.size - len(vals)])
+        return "[ " + ", ".join(vals) + " ]"
 
 
 def test_array_stack():
@@ -76,6 +137,51 @@ def test_array_stack():
     except IndexError as e:
         print(f"Expected error when popping empty stack: {e}")
     
+    print("Testing growable ArrayStack...")
+    stack = ArrayStack(4, growable=True)
+    for i in range(10):
+        stack.push(i)
+    print(f"After pushing 0..9 with chunk size 4: {stack}")
+    print(f"Size: {len(stack)}, Chunks: {len(stack.chunks)}, Top: {stack.peek()}")
+    assert len(stack.chunks) == 3
+
+    stack.push_many(range(10, 20))
+    print(f"After push_many(10..19): {stack}")
+    popped = stack.pop_many(7)
+    print(f"pop_many(7): {popped}, Stack: {stack}")
+    assert popped == [19, 18, 17, 16, 15, 14, 13]
+    assert stack.pop() == 12
+
+    print(f"pop_many(12): {stack.pop_many(12)}, Chunks kept: {len(stack.chunks)}")
+    assert stack.is_empty()
+    assert len(stack.chunks) == 1
+
+    bounded = ArrayStack(3)
+    bounded.push_many([1, 2])
+    try:
+        bounded.push_many([3, 4])
+    except RuntimeError as e:
+        print(f"Expected error when push_many overflows: {e}, Stack: {bounded}")
+
+    try:
+        bounded.pop_many(5)
+    except IndexError as e:
+        print(f"Expected error when pop_many exceeds size: {e}")
+
+    try:
+        ArrayStack(0, growable=True)
+    except ValueError as e:
+        print(f"Expected error with zero chunk size: {e}")
+
+    try:
+        ArrayStack(-1)
+    except ValueError as e:
+        print(f"Expected error with negative capacity: {e}")
+
+    empty = ArrayStack(0)
+    print(f"Zero-capacity stack is full: {empty.is_full()}")
+    assert empty.is_full() and empty.is_empty()
+
     print("ArrayStack tests completed successfully!\n")
 
 
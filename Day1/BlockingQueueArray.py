@@ -0,0 +1,310 @@
+import asyncio
+import queue
+import threading
+import time
+from collections import deque
+
+from Day1.QueueArray import QueueArray
+
+
+class BlockingQueueArray:
+    def __init__(self, capacity=10):
+        self.queue = QueueArray(capacity)
+        lock = threading.Lock()
+        self.not_empty = threading.Condition(lock)
+        self.not_full = threading.Condition(lock)
+
+    def _remaining(self, deadline):
+        if deadline is None:
+            return None
+        return max(0.0, deadline - time.monotonic())
+
+    def put(self, elem, timeout=None):
+        with self.not_full:
+            if self.queue.is_full() and not self.not_full.wait_for(lambda: not self.queue.is_full(), timeout):
+                raise TimeoutError("Timed out waiting for a free slot")
+            self.queue.offer(elem)
+            self.not_empty.notify()
+
+    def put_many(self, items, timeout=None):
+        # Items larger than the free space go in as space opens up, so a
+        # batch bigger than the capacity still completes.
+        items = list(items)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        pos = 0
+        with self.not_full:
+            while pos < len(items):
+                if not self.not_full.wait_for(lambda: not self.queue.is_full(), self._remaining(deadline)):
+                    raise TimeoutError(f"Timed out after putting {pos} of {len(items)} items")
+                count = min(self.queue.capacity - len(self.queue), len(items) - pos)
+                self.queue.offer_many(items[pos:pos + count])
+                pos += count
+                self.not_empty.notify(count)
+
+    def get(self, timeout=None):
+        with self.not_empty:
+            if self.queue.is_empty() and not self.not_empty.wait_for(lambda: not self.queue.is_empty(), timeout):
+                raise TimeoutError("Timed out waiting for an item")
+            elem = self.queue.poll()
+            self.not_full.notify()
+            return elem
+
+    def get_many(self, n, timeout=None):
+        # Blocks until at least one item is available, then returns up to n.
+        with self.not_empty:
+            if not self.not_empty.wait_for(lambda: not self.queue.is_empty(), timeout):
+                raise TimeoutError("Timed out waiting for an item")
+            items = self.queue.poll_many(min(n, len(self.queue)))
+            self.not_full.notify(len(items))
+            return items
+
+    def is_empty(self):
+        with self.not_empty:
+            return self.queue.is_empty()
+
+    def is_full(self):
+        with self.not_empty:
+            return self.queue.is_full()
+
+    def __len__(self):
+        with self.not_empty:
+            return len(self.queue)
+
+    def __str__(self):
+        with self.not_empty:
+            return str(self.queue)
+
+
+class AsyncQueueArray:
+    def __init__(self, capacity=10):
+        self.queue = QueueArray(capacity)
+        # Futures of coroutines parked until the queue is non-empty / non-full.
+        self.getters = deque()
+        self.putters = deque()
+
+    def _wakeup_next(self, waiters, count=1):
+        while waiters and count:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                count -= 1
+
+    async def _wait_while(self, blocked, waiters):
+        while blocked():
+            waiter = asyncio.get_running_loop().create_future()
+            waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()
+                try:
+                    waiters.remove(waiter)
+                except ValueError:
+                    pass
+                # Pass on a wakeup this cancelled waiter already received.
+                if not blocked() and not waiter.cancelled():
+                    self._wakeup_next(waiters)
+                raise
+
+    async def offer(self, elem):
+        await self._wait_while(self.queue.is_full, self.putters)
+        self.queue.offer(elem)
+        self._wakeup_next(self.getters)
+
+    async def offer_many(self, items):
+        items = list(items)
+        pos = 0
+        while pos < len(items):
+            await self._wait_while(self.queue.is_full, self.putters)
+            count = min(self.queue.capacity - len(self.queue), len(items) - pos)
+            self.queue.offer_many(items[pos:pos + count])
+            pos += count
+            self._wakeup_next(self.getters, count)
+
+    async def poll(self):
+        await self._wait_while(self.queue.is_empty, self.getters)
+        elem = self.queue.poll()
+        self._wakeup_next(self.putters)
+        return elem
+
+    async def poll_many(self, n):
+        # Waits until at least one item is available, then returns up to n.
+        await self._wait_while(self.queue.is_empty, self.getters)
+        items = self.queue.poll_many(min(n, len(self.queue)))
+        self._wakeup_next(self.putters, len(items))
+        return items
+
+    def offer_nowait(self, elem):
+        self.queue.offer(elem)
+        self._wakeup_next(self.getters)
+
+    def poll_nowait(self):
+        elem = self.queue.poll()
+        self._wakeup_next(self.putters)
+        return elem
+
+    def peek(self):
+        return self.queue.peek()
+
+    def is_empty(self):
+        return self.queue.is_empty()
+
+    def is_full(self):
+        return self.queue.is_full()
+
+    def __len__(self):
+        return len(self.queue)
+
+    def __str__(self):
+        return str(self.queue)
+
+
+def test_blocking_queue_array():
+    print("Testing BlockingQueueArray...")
+
+    bq = BlockingQueueArray(3)
+    bq.put(1)
+    bq.put_many([2, 3])
+    print(f"After put 1, put_many [2, 3]: {bq}, Is full: {bq.is_full()}")
+
+    try:
+        bq.put(4, timeout=0.01)
+    except TimeoutError as e:
+        print(f"Expected error putting into a full queue: {e}")
+
+    print(f"get(): {bq.get()}, get_many(5): {bq.get_many(5)}")
+
+    try:
+        bq.get(timeout=0.01)
+    except TimeoutError as e:
+        print(f"Expected error getting from an empty queue: {e}")
+
+    producers, consumers, per_producer = 3, 2, 2000
+    received = []
+    received_lock = threading.Lock()
+
+    def produce(base):
+        for i in range(0, per_producer, 100):
+            bq.put_many(range(base + i, base + i + 100))
+
+    def consume(count):
+        got = []
+        while len(got) < count:
+            got.extend(bq.get_many(count - len(got)))
+        with received_lock:
+            received.extend(got)
+
+    total = producers * per_producer
+    threads = [threading.Thread(target=produce, args=(p * per_producer,)) for p in range(producers)]
+    threads += [threading.Thread(target=consume, args=(total // consumers,)) for _ in range(consumers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    print(f"{producers} producers / {consumers} consumers moved {len(received)} items through capacity 3")
+    assert sorted(received) == list(range(total))
+    assert bq.is_empty()
+
+    print("Testing AsyncQueueArray...")
+
+    async def run_async():
+        aq = AsyncQueueArray(4)
+        await aq.offer(1)
+        aq.offer_nowait(2)
+        print(f"Async queue: {aq}, Peek: {aq.peek()}")
+        assert await aq.poll() == 1
+        assert aq.poll_nowait() == 2
+
+        results = []
+
+        async def producer(base):
+            await aq.offer_many(range(base, base + 50))
+
+        async def consumer():
+            while len(results) < 100:
+                results.extend(await aq.poll_many(8))
+
+        await asyncio.gather(producer(0), producer(50), consumer())
+        print(f"Async producers moved {len(results)} items through capacity 4")
+        assert sorted(results) == list(range(100))
+
+        try:
+            await asyncio.wait_for(aq.poll(), timeout=0.01)
+        except asyncio.TimeoutError:
+            print("Expected timeout polling an empty async queue")
+
+    asyncio.run(run_async())
+
+    print("BlockingQueueArray tests completed successfully!\n")
+
+
+def _run_threads(make_queue, put, get, items, producers, consumers):
+    q = make_queue()
+    per_producer = items // producers
+    per_consumer = per_producer * producers // consumers
+
+    def produce():
+        for i in range(per_producer):
+            put(q, i)
+
+    def consume():
+        for _ in range(per_consumer):
+            get(q)
+
+    threads = [threading.Thread(target=produce) for _ in range(producers)]
+    threads += [threading.Thread(target=consume) for _ in range(consumers)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return time.perf_counter() - start
+
+
+async def _run_tasks(q, offer, poll, items, producers, consumers):
+    per_producer = items // producers
+    per_consumer = per_producer * producers // consumers
+
+    async def produce():
+        for i in range(per_producer):
+            await offer(q, i)
+
+    async def consume():
+        for _ in range(per_consumer):
+            await poll(q)
+
+    start = time.perf_counter()
+    await asyncio.gather(*[produce() for _ in range(producers)], *[consume() for _ in range(consumers)])
+    return time.perf_counter() - start
+
+
+def benchmark_blocking_queue_array(items=100_000, producers=2, consumers=2, capacity=1024):
+    print(f"Benchmarking {producers} producers / {consumers} consumers, {items} items, capacity {capacity}...")
+    thread_cases = (
+        ("BlockingQueueArray put/get", lambda: BlockingQueueArray(capacity),
+         lambda q, x: q.put(x), lambda q: q.get()),
+        ("queue.Queue put/get", lambda: queue.Queue(capacity),
+         lambda q, x: q.put(x), lambda q: q.get()),
+    )
+    for name, make_queue, put, get in thread_cases:
+        elapsed = _run_threads(make_queue, put, get, items, producers, consumers)
+        print(f"  {name}: {items / elapsed:,.0f} items/s")
+
+    async def run_async_cases():
+        async_cases = (
+            ("AsyncQueueArray offer/poll", AsyncQueueArray(capacity),
+             lambda q, x: q.offer(x), lambda q: q.poll()),
+            ("asyncio.Queue put/get", asyncio.Queue(capacity),
+             lambda q, x: q.put(x), lambda q: q.get()),
+        )
+        for name, q, offer, poll in async_cases:
+            elapsed = await _run_tasks(q, offer, poll, items, producers, consumers)
+            print(f"  {name}: {items / elapsed:,.0f} items/s")
+
+    asyncio.run(run_async_cases())
+    print()
+
+
+if __name__ == "__main__":
+    test_blocking_queue_array()
+    benchmark_blocking_queue_array()
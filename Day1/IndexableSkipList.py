@@ -0,0 +1,237 @@
+import random
+import time
+
+from Day1.SinglyLinkedList import SinglyLinkedList
+
+
+class Node:
+    __slots__ = ("data", "next", "width")
+
+    def __init__(self, data, level):
+        self.data = data
+        # next[i] is the successor on express lane i and width[i] is how many
+        # bottom-level steps that link spans (unused while next[i] is None).
+        self.next = [None] * level
+        self.width = [0] * level
+
+    def __str__(self):
+        return str(self.data)
+
+
+class IndexableSkipList:
+    MAX_LEVEL = 32
+
+    def __init__(self):
+        self.head = Node(None, self.MAX_LEVEL)
+        self.level = 1
+        self.size = 0
+
+    def clear(self):
+        self.head = Node(None, self.MAX_LEVEL)
+        self.level = 1
+        self.size = 0
+
+    def is_empty(self):
+        return self.size == 0
+
+    def _random_level(self):
+        level = 1
+        while level < self.MAX_LEVEL and random.random() < 0.5:
+            level += 1
+        return level
+
+    def _predecessors(self, position):
+        # Positions are 1-based with the head sentinel at 0. Returns, per
+        # lane, the last node before `position` and that node's position.
+        update = [self.head] * self.level
+        update_pos = [0] * self.level
+        node, pos = self.head, 0
+        for lvl in range(self.level - 1, -1, -1):
+            while node.next[lvl] is not None and pos + node.width[lvl] < position:
+                pos += node.width[lvl]
+                node = node.next[lvl]
+            update[lvl] = node
+            update_pos[lvl] = pos
+        return update, update_pos
+
+    def _node_at(self, index):
+        if index < 0 or index >= self.size:
+            raise IndexError("Index out of bounds")
+        node, pos = self.head, 0
+        target = index + 1
+        for lvl in range(self.level - 1, -1, -1):
+            while node.next[lvl] is not None and pos + node.width[lvl] <= target:
+                pos += node.width[lvl]
+                node = node.next[lvl]
+            if pos == target:
+                return node
+        return node
+
+    def get(self, index):
+        return self._node_at(index).data
+
+    def set(self, index, elem):
+        self._node_at(index).data = elem
+
+    def insert_at(self, index, elem):
+        if index < 0 or index > self.size:
+            raise IndexError("Index out of bounds")
+        level = self._random_level()
+        if level > self.level:
+            for lvl in range(self.level, level):
+                self.head.next[lvl] = None
+            self.level = level
+        update, update_pos = self._predecessors(index + 1)
+        node = Node(elem, level)
+        for lvl in range(self.level):
+            prev, pos = update[lvl], update_pos[lvl]
+            if lvl < level:
+                nxt = prev.next[lvl]
+                node.next[lvl] = nxt
+                node.width[lvl] = pos + prev.width[lvl] - index if nxt is not None else 0
+                prev.next[lvl] = node
+                prev.width[lvl] = index + 1 - pos
+            else:
+                prev.width[lvl] += 1
+        self.size += 1
+
+    def add(self, elem):
+        self.insert_at(self.size, elem)
+
+    def add_first(self, elem):
+        self.insert_at(0, elem)
+
+    def remove_at(self, index):
+        if index < 0 or index >= self.size:
+            raise IndexError("Index out of bounds")
+        update, _ = self._predecessors(index + 1)
+        target = update[0].next[0]
+        for lvl in range(self.level):
+            prev = update[lvl]
+            if prev.next[lvl] is target:
+                prev.next[lvl] = target.next[lvl]
+                prev.width[lvl] += target.width[lvl] - 1
+            else:
+                prev.width[lvl] -= 1
+        while self.level > 1 and self.head.next[self.level - 1] is None:
+            self.level -= 1
+        self.size -= 1
+        return target.data
+
+    def peek_first(self):
+        if self.is_empty():
+            raise RuntimeError("Empty list")
+        return self.head.next[0].data
+
+    def peek_last(self):
+        if self.is_empty():
+            raise RuntimeError("Empty list")
+        return self.get(self.size - 1)
+
+    def remove_first(self):
+        if self.is_empty():
+            raise RuntimeError("Empty list")
+        return self.remove_at(0)
+
+    def remove_last(self):
+        if self.is_empty():
+            raise RuntimeError("Empty list")
+        return self.remove_at(self.size - 1)
+
+    def index_of(self, obj):
+        for index, elem in enumerate(self):
+            if elem == obj:
+                return index
+        return -1
+
+    def contains(self, obj):
+        return self.index_of(obj) != -1
+
+    def __iter__(self):
+        trav = self.head.next[0]
+        while trav:
+            yield trav.data
+            trav = trav.next[0]
+
+    def __len__(self):
+        return self.size
+
+    def __str__(self):
+        return "[ " + ", ".join(str(elem) for elem in self) + " ]"
+
+
+def test_indexable_skip_list():
+    print("Testing IndexableSkipList...")
+
+    sl = IndexableSkipList()
+    print(f"Empty list: {sl}")
+    print(f"Is empty: {sl.is_empty()}")
+
+    sl.add(10)
+    sl.add(20)
+    sl.add(30)
+    sl.add_first(5)
+    print(f"After adding 10, 20, 30 and 5 first: {sl}, Size: {len(sl)}")
+    print(f"get(2): {sl.get(2)}, First: {sl.peek_first()}, Last: {sl.peek_last()}")
+
+    sl.insert_at(2, 15)
+    print(f"After insert_at(2, 15): {sl}")
+    sl.set(0, 1)
+    print(f"After set(0, 1): {sl}")
+    print(f"Index of 20: {sl.index_of(20)}, Contains 99: {sl.contains(99)}")
+
+    print(f"Removed at 1: {sl.remove_at(1)}, List: {sl}")
+    print(f"Removed first: {sl.remove_first()}, Removed last: {sl.remove_last()}, List: {sl}")
+    assert list(sl) == [15, 20]
+
+    random.seed(7)
+    expected = []
+    sl.clear()
+    for step in range(3000):
+        op = random.random()
+        if op < 0.55 or not expected:
+            index = random.randint(0, len(expected))
+            sl.insert_at(index, step)
+            expected.insert(index, step)
+        elif op < 0.85:
+            index = random.randrange(len(expected))
+            assert sl.remove_at(index) == expected.pop(index)
+        else:
+            index = random.randrange(len(expected))
+            assert sl.get(index) == expected[index]
+    assert list(sl) == expected
+    assert all(sl.get(i) == expected[i] for i in range(len(expected)))
+    print(f"3000 random positional edits match a Python list (size {len(sl)}, levels {sl.level})")
+
+    try:
+        sl.get(len(sl))
+    except IndexError as e:
+        print(f"Expected error: {e}")
+
+    sl.clear()
+    try:
+        sl.remove_first()
+    except RuntimeError as e:
+        print(f"Expected error: {e}")
+
+    print("IndexableSkipList tests completed successfully!\n")
+
+
+def benchmark_indexable_skip_list(n=20_000, edits=2_000):
+    print(f"Benchmarking {edits} random remove_at + add_first on {n} elements...")
+    random.seed(1)
+    indices = [random.randrange(n - 1) for _ in range(edits)]
+    for name, ll in (("SinglyLinkedList", SinglyLinkedList()), ("IndexableSkipList", IndexableSkipList())):
+        for i in range(n):
+            ll.add(i)
+        start = time.perf_counter()
+        for index in indices:
+            ll.add_first(ll.remove_at(index))
+        elapsed = time.perf_counter() - start
+        print(f"  {name}: {elapsed * 1e6 / edits:.1f} us/edit")
+    print()
+
+
+if __name__ == "__main__":
+    test_indexable_skip_list()
+    benchmark_indexable_skip_list()
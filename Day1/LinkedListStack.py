@@ -1,27 +1,47 @@
+import time
+import tracemalloc
+
+
 class Node:
+    __slots__ = ("data", "next")
+
     def __init__(self, data, nxt=None):
         self.data = data
         self.next = nxt
 
 
 class LinkedListStack:
-    def __init__(self):
+    def __init__(self, node_pool_size=0):
         self.top = None
         self.size = 0
+        # Up to node_pool_size popped nodes are kept for reuse by later pushes.
+        self.node_pool_size = node_pool_size
+        self.free_nodes = []
 
     def is_empty(self):
         return self.size == 0
 
     def push(self, elem):
-        self.top = Node(elem, self.top)
+        if self.free_nodes:
+            node = self.free_nodes.pop()
+            node.data = elem
+            node.next = self.top
+            self.top = node
+        else:
+            self.top = Node(elem, self.top)
         self.size += 1
 
     def pop(self):
         if self.is_empty():
             raise IndexError("Pop from empty stack")
-        data = self.top.data
-        self.top = self.top.next
+        node = self.top
+        data = node.data
+        self.top = node.next
         self.size -= 1
+        if len(self.free_nodes) < self.node_pool_size:
+            node.data = None
+            node.next = None
+            self.free_nodes.append(node)
         return data
 
     def peek(self):
@@ -105,8 +125,51 @@ def test_linked_list_stack():
     print()
     print(f"Size after popping 10 elements: {len(stack)}")
     
+    pooled = LinkedListStack(node_pool_size=4)
+    for i in range(10):
+        pooled.push(i)
+    for _ in range(10):
+        pooled.pop()
+    print(f"Pooled stack after 10 pops - Free nodes: {len(pooled.free_nodes)}")
+    assert len(pooled.free_nodes) == 4
+    pooled.push("a")
+    pooled.push("b")
+    print(f"Pooled stack after reusing nodes: {pooled}, Free nodes: {len(pooled.free_nodes)}")
+    assert len(pooled.free_nodes) == 2
+
     print("LinkedListStack tests completed successfully!\n")
 
 
+class DictNode:
+    # Plain-attribute node with a per-instance __dict__, for comparison.
+    def __init__(self, data, nxt=None):
+        self.data = data
+        self.next = nxt
+
+
+def benchmark_linked_list_stack(cycles=1_000_000, depth=100_000):
+    print(f"Benchmarking LinkedListStack ({cycles} push/pop cycles, {depth} nodes for memory)...")
+    for name, node_cls in (("__dict__ nodes", DictNode), ("__slots__ nodes", Node)):
+        tracemalloc.start()
+        top = None
+        for i in range(depth):
+            top = node_cls(i, top)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del top
+        print(f"  {name}: {peak / depth:.0f} bytes/node")
+
+    for pool in (0, 1024):
+        stack = LinkedListStack(node_pool_size=pool)
+        start = time.perf_counter()
+        for i in range(cycles):
+            stack.push(i)
+            stack.pop()
+        elapsed = time.perf_counter() - start
+        print(f"  node_pool_size={pool}: {elapsed * 1e9 / cycles:.0f} ns/cycle")
+    print()
+
+
 if __name__ == "__main__":
     test_linked_list_stack()
+    benchmark_linked_list_stack()
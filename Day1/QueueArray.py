@@ -1,10 +1,18 @@
+import time
+
+
 class QueueArray:
-    def __init__(self, capacity=10):
+    def __init__(self, capacity=10, growable=False):
         if capacity <= 0:
             raise ValueError("Capacity must be positive")
-        
+        # A growable queue keeps its capacity a power of two so indices can
+        # wrap with a bit mask, and doubles instead of raising when full.
+        self.growable = growable
+        if growable:
+            capacity = 1 << (capacity - 1).bit_length()
         self.data = [None] * capacity
         self.capacity = capacity
+        self.mask = capacity - 1 if capacity & (capacity - 1) == 0 else None
         self.front = 0
         self.rear = 0
         self.size = 0
@@ -15,22 +23,71 @@ class QueueArray:
     def is_full(self):
         return self.size == self.capacity
 
+    def _wrap(self, index):
+        if self.mask is not None:
+            return index & self.mask
+        return index % self.capacity
+
+    def _resize(self, new_capacity):
+        # Unroll the ring so the oldest element lands at index 0.
+        head = self.data[self.front:self.front + self.size]
+        tail = self.data[:self.size - len(head)]
+        self.data = head + tail + [None] * (new_capacity - self.size)
+        self.capacity = new_capacity
+        self.mask = new_capacity - 1
+        self.front = 0
+        self.rear = self.size & self.mask
+
+    def _reserve(self, count):
+        needed = self.size + count
+        if needed <= self.capacity:
+            return
+        if not self.growable:
+            raise OverflowError("Queue is full")
+        self._resize(1 << (needed - 1).bit_length())
+
     def offer(self, elem):
         if self.is_full():
-            raise OverflowError("Queue is full")
+            if not self.growable:
+                raise OverflowError("Queue is full")
+            self._resize(self.capacity * 2)
         self.data[self.rear] = elem
-        self.rear = (self.rear + 1) % self.capacity
+        self.rear = self._wrap(self.rear + 1)
         self.size += 1
 
+    def offer_many(self, items):
+        items = list(items)
+        count = len(items)
+        self._reserve(count)
+        first = min(count, self.capacity - self.rear)
+        self.data[self.rear:self.rear + first] = items[:first]
+        self.data[:count - first] = items[first:]
+        self.rear = self._wrap(self.rear + count)
+        self.size += count
+
     def poll(self):
         if self.is_empty():
             raise IndexError("Queue is empty")
         elem = self.data[self.front]
         self.data[self.front] = None
-        self.front = (self.front + 1) % self.capacity
+        self.front = self._wrap(self.front + 1)
         self.size -= 1
         return elem
 
+    def poll_many(self, n):
+        if n < 0:
+            raise ValueError("Count must be non-negative")
+        if n > self.size:
+            raise IndexError("Queue is empty")
+        first = min(n, self.capacity - self.front)
+        result = self.data[self.front:self.front + first]
+        result += self.data[:n - first]
+        self.data[self.front:self.front + first] = [None] * first
+        self.data[:n - first] = [None] * (n - first)
+        self.front = self._wrap(self.front + n)
+        self.size -= n
+        return result
+
     def peek(self):
         if self.is_empty():
             raise IndexError("Queue is empty")
@@ -130,8 +187,65 @@ def test_queue_array():
             item = test_queue.poll()
             print(f"  Polled: {item}, Queue: {test_queue}")
     
+    print("\nTesting growable QueueArray...")
+    growing = QueueArray(3, growable=True)
+    print(f"Requested capacity 3, actual: {growing.capacity}")
+    assert growing.capacity == 4
+    for i in range(3):
+        growing.offer(i)
+    growing.poll()
+    for i in range(3, 8):
+        growing.offer(i)
+    print(f"After wrapping and growing: {growing}, Capacity: {growing.capacity}")
+    assert growing.capacity == 8
+    assert growing.poll_many(7) == [1, 2, 3, 4, 5, 6, 7]
+
+    growing.offer_many(range(6))
+    print(f"After offer_many(0..5) across the wrap point: {growing}, front={growing.front}")
+    polled = growing.poll_many(4)
+    print(f"poll_many(4): {polled}, Queue: {growing}")
+    assert polled == [0, 1, 2, 3]
+    growing.offer_many(range(6, 20))
+    print(f"After offer_many(6..19): Size {len(growing)}, Capacity {growing.capacity}")
+    assert growing.capacity == 16
+    assert growing.poll_many(len(growing)) == list(range(4, 20))
+    assert growing.is_empty()
+
+    bounded = QueueArray(3)
+    bounded.offer_many([1, 2])
+    try:
+        bounded.offer_many([3, 4])
+    except OverflowError as e:
+        print(f"Expected error when offer_many overflows: {e}, Queue: {bounded}")
+
+    try:
+        bounded.poll_many(3)
+    except IndexError as e:
+        print(f"Expected error when poll_many exceeds size: {e}")
+
     print("QueueArray tests completed successfully!\n")
 
 
+def benchmark_queue_array(n=500_000, batch=1000):
+    print(f"Benchmarking QueueArray ({n} elements, batches of {batch})...")
+    queue = QueueArray(growable=True)
+    start = time.perf_counter()
+    for i in range(n):
+        queue.offer(i)
+        queue.poll()
+    elapsed = time.perf_counter() - start
+    print(f"  offer/poll: {elapsed * 1e9 / n:.0f} ns/element")
+
+    items = list(range(batch))
+    start = time.perf_counter()
+    for _ in range(n // batch):
+        queue.offer_many(items)
+        queue.poll_many(batch)
+    elapsed = time.perf_counter() - start
+    print(f"  offer_many/poll_many: {elapsed * 1e9 / n:.0f} ns/element")
+    print()
+
+
 if __name__ == "__main__":
     test_queue_array()
+    benchmark_queue_array()
@@ -0,0 +1,284 @@
+import multiprocessing
+import struct
+import time
+from multiprocessing import shared_memory
+
+
+class SharedQueueArray:
+    # Block layout: a header with the geometry, then head and tail counters
+    # on their own 64-byte lines so producer and consumer do not share a
+    # cache line, then `capacity` fixed-size slots.
+    HEADER = struct.Struct("<4s4xQQ32s")
+    MAGIC = b"SQA1"
+    HEAD_OFFSET = 64
+    TAIL_OFFSET = 128
+    DATA_OFFSET = 192
+    LENGTH = struct.Struct("<I")
+
+    def __init__(self, shm, lock=None):
+        # Use create() or attach(); this wraps an already laid out block.
+        magic, capacity, slot_size, record_format = self.HEADER.unpack_from(shm.buf)
+        if magic != self.MAGIC:
+            raise ValueError(f"{shm.name} is not a shared queue block")
+        self.shm = shm
+        self.buf = shm.buf
+        self.name = shm.name
+        self.capacity = capacity
+        self.slot_size = slot_size
+        self.record_format = record_format.rstrip(b"\0").decode() or None
+        self.record = struct.Struct(self.record_format) if self.record_format else None
+        self.lock = lock
+        # Native 8-byte views so each counter update is a single aligned
+        # store; struct's "<Q" packer writes byte by byte, and a reader in
+        # another process could see a half-written value.
+        self.head = shm.buf[self.HEAD_OFFSET:self.HEAD_OFFSET + 8].cast("Q")
+        self.tail = shm.buf[self.TAIL_OFFSET:self.TAIL_OFFSET + 8].cast("Q")
+
+    @classmethod
+    def create(cls, capacity, record_format=None, max_bytes=None, lock=None, name=None):
+        # Slots hold either struct records (record_format) or byte strings of
+        # up to max_bytes. Without a lock the queue is single-producer /
+        # single-consumer; share one multiprocessing.Lock between all
+        # handles for multiple producers or consumers.
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+        if (record_format is None) == (max_bytes is None):
+            raise ValueError("Give exactly one of record_format or max_bytes")
+        if record_format is not None:
+            slot_size = struct.calcsize(record_format)
+            encoded_format = record_format.encode()
+        else:
+            slot_size = cls.LENGTH.size + max_bytes
+            encoded_format = b""
+        if len(encoded_format) > 32:
+            raise ValueError("Record format must be at most 32 characters")
+        shm = shared_memory.SharedMemory(name=name, create=True, size=cls.DATA_OFFSET + capacity * slot_size)
+        cls.HEADER.pack_into(shm.buf, 0, cls.MAGIC, capacity, slot_size, encoded_format)
+        return cls(shm, lock)
+
+    @classmethod
+    def attach(cls, name, lock=None):
+        return cls(shared_memory.SharedMemory(name=name), lock)
+
+    # head and tail only ever increase; the slot is counter % capacity and
+    # the size is tail - head, so a full ring and an empty one differ.
+    def _head(self):
+        return self.head[0]
+
+    def _tail(self):
+        return self.tail[0]
+
+    def _slot(self, counter):
+        return self.DATA_OFFSET + (counter % self.capacity) * self.slot_size
+
+    def _write(self, offset, elem):
+        if self.record is not None:
+            if not isinstance(elem, tuple):
+                elem = (elem,)
+            self.record.pack_into(self.buf, offset, *elem)
+            return
+        elem = bytes(elem)
+        if len(elem) > self.slot_size - self.LENGTH.size:
+            raise ValueError(f"Item of {len(elem)} bytes does not fit a {self.slot_size - self.LENGTH.size}-byte slot")
+        self.LENGTH.pack_into(self.buf, offset, len(elem))
+        start = offset + self.LENGTH.size
+        self.buf[start:start + len(elem)] = elem
+
+    def _read(self, offset):
+        if self.record is not None:
+            values = self.record.unpack_from(self.buf, offset)
+            return values[0] if len(values) == 1 else values
+        length = self.LENGTH.unpack_from(self.buf, offset)[0]
+        start = offset + self.LENGTH.size
+        return bytes(self.buf[start:start + length])
+
+    def _offer(self, elem):
+        tail = self._tail()
+        if tail - self._head() == self.capacity:
+            raise OverflowError("Queue is full")
+        self._write(self._slot(tail), elem)
+        # Publish the slot only after its contents are written.
+        self.tail[0] = tail + 1
+
+    def _poll(self):
+        head = self._head()
+        if head == self._tail():
+            raise IndexError("Queue is empty")
+        elem = self._read(self._slot(head))
+        self.head[0] = head + 1
+        return elem
+
+    def offer(self, elem):
+        if self.lock is None:
+            return self._offer(elem)
+        with self.lock:
+            return self._offer(elem)
+
+    def poll(self):
+        if self.lock is None:
+            return self._poll()
+        with self.lock:
+            return self._poll()
+
+    def peek(self):
+        head = self._head()
+        if head == self._tail():
+            raise IndexError("Queue is empty")
+        return self._read(self._slot(head))
+
+    def is_empty(self):
+        return len(self) == 0
+
+    def is_full(self):
+        return len(self) == self.capacity
+
+    def __len__(self):
+        return self._tail() - self._head()
+
+    def __str__(self):
+        head, tail = self._head(), self._tail()
+        if head == tail:
+            return "[]"
+        return "[ " + ", ".join(str(self._read(self._slot(i))) for i in range(head, tail)) + " ]"
+
+    def close(self):
+        self.head.release()
+        self.tail.release()
+        self.buf = None
+        self.shm.close()
+
+    def unlink(self):
+        self.shm.unlink()
+
+
+def _consume(name, count, result):
+    queue = SharedQueueArray.attach(name)
+    total = 0
+    received = 0
+    while received < count:
+        try:
+            total += queue.poll()
+            received += 1
+        except IndexError:
+            time.sleep(0)
+    result.send(total)
+    queue.close()
+
+
+def _consume_with_lock(name, lock, results):
+    queue = SharedQueueArray.attach(name, lock)
+    total = 0
+    while True:
+        try:
+            item = queue.poll()
+        except IndexError:
+            time.sleep(0)
+            continue
+        if item == b"stop":
+            break
+        total += int(item)
+    results.put(total)
+    queue.close()
+
+
+def _offer_waiting(queue, item, workers):
+    while True:
+        try:
+            queue.offer(item)
+            return
+        except OverflowError:
+            if not any(w.is_alive() for w in workers):
+                raise RuntimeError("Consumers exited before draining the queue")
+            time.sleep(0)
+
+
+def test_shared_queue_array():
+    print("Testing SharedQueueArray...")
+
+    queue = SharedQueueArray.create(3, record_format="<qd")
+    try:
+        print(f"Empty queue: {queue}, Is empty: {queue.is_empty()}")
+        queue.offer((1, 0.5))
+        queue.offer((2, 1.5))
+        queue.offer((3, 2.5))
+        print(f"After offering 3 records: {queue}, Is full: {queue.is_full()}")
+        try:
+            queue.offer((4, 3.5))
+        except OverflowError as e:
+            print(f"Expected error when queue is full: {e}")
+        print(f"Peek: {queue.peek()}, Poll: {queue.poll()}")
+        queue.offer((4, 3.5))
+        print(f"After wrapping around: {queue}, Size: {len(queue)}")
+        assert [queue.poll() for _ in range(3)] == [(2, 1.5), (3, 2.5), (4, 3.5)]
+        try:
+            queue.poll()
+        except IndexError as e:
+            print(f"Expected error when queue is empty: {e}")
+
+        other = SharedQueueArray.attach(queue.name)
+        queue.offer((5, 4.5))
+        print(f"Second handle sees: {other.poll()}, record format: {other.record_format}")
+        other.close()
+    finally:
+        queue.close()
+        queue.unlink()
+
+    byte_queue = SharedQueueArray.create(4, max_bytes=8)
+    try:
+        byte_queue.offer(b"hi")
+        byte_queue.offer(b"")
+        print(f"Byte queue: {byte_queue}")
+        assert byte_queue.poll() == b"hi" and byte_queue.poll() == b""
+        try:
+            byte_queue.offer(b"too long for slot")
+        except ValueError as e:
+            print(f"Expected error with oversized item: {e}")
+    finally:
+        byte_queue.close()
+        byte_queue.unlink()
+
+    count = 20_000
+    queue = SharedQueueArray.create(256, record_format="<q")
+    try:
+        receiver, sender = multiprocessing.Pipe(duplex=False)
+        consumer = multiprocessing.Process(target=_consume, args=(queue.name, count, sender))
+        consumer.start()
+        for i in range(count):
+            _offer_waiting(queue, i, [consumer])
+        if not receiver.poll(60):
+            raise RuntimeError("Consumer did not report a result")
+        total = receiver.recv()
+        consumer.join()
+        print(f"SPSC across processes: consumer summed {total}")
+        assert total == count * (count - 1) // 2
+    finally:
+        queue.close()
+        queue.unlink()
+
+    lock = multiprocessing.Lock()
+    queue = SharedQueueArray.create(16, max_bytes=8, lock=lock)
+    try:
+        results = multiprocessing.Queue()
+        consumers = [
+            multiprocessing.Process(target=_consume_with_lock, args=(queue.name, lock, results))
+            for _ in range(2)
+        ]
+        for c in consumers:
+            c.start()
+        items = [str(i).encode() for i in range(2000)] + [b"stop", b"stop"]
+        for item in items:
+            _offer_waiting(queue, item, consumers)
+        total = results.get(timeout=60) + results.get(timeout=60)
+        for c in consumers:
+            c.join()
+        print(f"MPMC with a shared lock: consumers summed {total}")
+        assert total == sum(range(2000))
+    finally:
+        queue.close()
+        queue.unlink()
+
+    print("SharedQueueArray tests completed successfully!\n")
+
+
+if __name__ == "__main__":
+    test_shared_queue_array()
@@ -1,4 +1,6 @@
 class Node:
+    __slots__ = ("data", "next")
+
     def __init__(self, data, nxt=None):
         self.data = data
         self.next = nxt
@@ -8,10 +10,27 @@ class Node:
 
 
 class SinglyLinkedList:
-    def __init__(self):
+    def __init__(self, node_pool_size=0):
         self.size = 0
         self.head = None
         self.tail = None
+        # Up to node_pool_size removed nodes are kept for reuse by later adds.
+        self.node_pool_size = node_pool_size
+        self.free_nodes = []
+
+    def _new_node(self, data, nxt=None):
+        if self.free_nodes:
+            node = self.free_nodes.pop()
+            node.data = data
+            node.next = nxt
+            return node
+        return Node(data, nxt)
+
+    def _recycle(self, node):
+        if len(self.free_nodes) < self.node_pool_size:
+            node.data = None
+            node.next = None
+            self.free_nodes.append(node)
 
     def clear(self):
         self.head = None
@@ -23,17 +42,17 @@ class SinglyLinkedList:
 
     def add(self, elem):
         if self.is_empty():
-            self.head = self.tail = Node(elem)
+            self.head = self.tail = self._new_node(elem)
         else:
-            self.tail.next = Node(elem)
+            self.tail.next = self._new_node(elem)
             self.tail = self.tail.next
         self.size += 1
 
     def add_first(self, elem):
         if self.is_empty():
-            self.head = self.tail = Node(elem)
+            self.head = self.tail = self._new_node(elem)
         else:
-            self.head = Node(elem, self.head)
+            self.head = self._new_node(elem, self.head)
         self.size += 1
 
     def peek_first(self):
@@ -49,17 +68,20 @@ class SinglyLinkedList:
     def remove_first(self):
         if self.is_empty():
             raise RuntimeError("Empty list")
-        data = self.head.data
-        self.head = self.head.next
+        node = self.head
+        data = node.data
+        self.head = node.next
         self.size -= 1
         if self.is_empty():
             self.tail = None
+        self._recycle(node)
         return data
 
     def remove_last(self):
         if self.is_empty():
             raise RuntimeError("Empty list")
-        data = self.tail.data
+        node = self.tail
+        data = node.data
         if self.head == self.tail:
             self.head = self.tail = None
         else:
@@ -69,6 +91,7 @@ class SinglyLinkedList:
             self.tail = trav
             self.tail.next = None
         self.size -= 1
+        self._recycle(node)
         return data
 
     def remove_at(self, index):
@@ -79,11 +102,13 @@ class SinglyLinkedList:
         prev = self.head
         for _ in range(index - 1):
             prev = prev.next
-        data = prev.next.data
-        prev.next = prev.next.next
+        node = prev.next
+        data = node.data
+        prev.next = node.next
         if index == self.size - 1:
             self.tail = prev
         self.size -= 1
+        self._recycle(node)
         return data
 
     def index_of(self, obj):
@@ -176,6 +201,21 @@ def test_singly_linked_list():
     removed = ll.remove_last()
     print(f"Removed last: {removed}, List: {ll}")
 
+    pooled = SinglyLinkedList(node_pool_size=2)
+    for i in range(4):
+        pooled.add(i)
+    first_node = pooled.head
+    pooled.remove_first()
+    pooled.remove_at(1)
+    pooled.remove_last()
+    print(f"Pooled list after removals: {pooled}, Free nodes: {len(pooled.free_nodes)}")
+    assert len(pooled.free_nodes) == 2
+    pooled.add_first(7)
+    pooled.add(8)
+    print(f"Pooled list after reusing nodes: {pooled}, Free nodes: {len(pooled.free_nodes)}")
+    assert list(pooled) == [7, 1, 8]
+    assert first_node in (pooled.head, pooled.tail)
+
     print("SinglyLinkedList tests completed successfully!\n")
 
 
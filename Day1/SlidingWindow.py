@@ -0,0 +1,239 @@
+import random
+import time
+from collections import deque
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from Day1.QueueArray import QueueArray
+
+
+class SlidingWindow:
+    # Batches at least this long are aggregated with NumPy when it is
+    # installed; shorter ones go through push().
+    VECTORIZE_THRESHOLD = 1024
+
+    def __init__(self, size):
+        if size <= 0:
+            raise ValueError("Window size must be positive")
+        self.size = size
+        self.samples = QueueArray(size)
+        # Samples are numbered as they arrive; the window holds numbers
+        # count - len .. count - 1. The min/max deques hold (number, value)
+        # pairs with values increasing (min) or decreasing (max) from the
+        # front, so the front is always the current extreme.
+        self.count = 0
+        self.min_candidates = deque()
+        self.max_candidates = deque()
+        self.total = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def is_empty(self):
+        return self.samples.is_empty()
+
+    def is_full(self):
+        return self.samples.is_full()
+
+    def __len__(self):
+        return len(self.samples)
+
+    def __str__(self):
+        return str(self.samples)
+
+    def clear(self):
+        self.samples = QueueArray(self.size)
+        self.min_candidates.clear()
+        self.max_candidates.clear()
+        self.total = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def _evict(self):
+        value = self.samples.poll()
+        number = self.count - len(self.samples) - 1
+        if self.min_candidates[0][0] == number:
+            self.min_candidates.popleft()
+        if self.max_candidates[0][0] == number:
+            self.max_candidates.popleft()
+        # Reverse Welford update.
+        n = len(self.samples)
+        self.total -= value
+        if n == 0:
+            self._mean = 0.0
+            self._m2 = 0.0
+        else:
+            delta = value - self._mean
+            self._mean -= delta / n
+            self._m2 = max(self._m2 - delta * (value - self._mean), 0.0)
+        return value
+
+    def push(self, value):
+        # Returns the evicted oldest sample, or None if the window had room.
+        evicted = self._evict() if self.is_full() else None
+        number = self.count
+        self.count += 1
+        self.samples.offer(value)
+        while self.min_candidates and self.min_candidates[-1][1] >= value:
+            self.min_candidates.pop()
+        self.min_candidates.append((number, value))
+        while self.max_candidates and self.max_candidates[-1][1] <= value:
+            self.max_candidates.pop()
+        self.max_candidates.append((number, value))
+        n = len(self.samples)
+        self.total += value
+        delta = value - self._mean
+        self._mean += delta / n
+        self._m2 += delta * (value - self._mean)
+        return evicted
+
+    def push_many(self, values):
+        values = list(values)
+        if len(values) >= self.size:
+            # Only the last `size` values survive, so rebuild from them
+            # instead of pushing and evicting each one.
+            self.count += len(values) - self.size
+            self.clear()
+            values = values[-self.size:]
+            if np is not None and self.size >= self.VECTORIZE_THRESHOLD:
+                self._rebuild_vectorized(values)
+                return
+        for value in values:
+            self.push(value)
+
+    def _rebuild_vectorized(self, values):
+        window = np.asarray(values)
+        first = self.count
+        self.count += len(values)
+        self.samples.offer_many(values)
+        self.total = sum(values) if window.dtype == object else window.sum().item()
+        self._mean = float(window.mean())
+        self._m2 = float(((window - self._mean) ** 2).sum())
+        # A sample stays a min candidate while it is strictly below every
+        # later sample (and a max candidate while strictly above), which is
+        # exactly what push() would have left in the deques.
+        later_min = np.minimum.accumulate(window[::-1])[::-1]
+        later_max = np.maximum.accumulate(window[::-1])[::-1]
+        keep_min = np.append(window[:-1] < later_min[1:], True)
+        keep_max = np.append(window[:-1] > later_max[1:], True)
+        self.min_candidates.extend((first + i, values[i]) for i in np.flatnonzero(keep_min).tolist())
+        self.max_candidates.extend((first + i, values[i]) for i in np.flatnonzero(keep_max).tolist())
+
+    def _check_not_empty(self):
+        if self.is_empty():
+            raise IndexError("Window is empty")
+
+    def min(self):
+        self._check_not_empty()
+        return self.min_candidates[0][1]
+
+    def max(self):
+        self._check_not_empty()
+        return self.max_candidates[0][1]
+
+    def sum(self):
+        return self.total
+
+    def mean(self):
+        self._check_not_empty()
+        return self._mean
+
+    def variance(self):
+        # Population variance of the samples currently in the window.
+        self._check_not_empty()
+        return self._m2 / len(self.samples)
+
+
+def test_sliding_window():
+    print("Testing SlidingWindow...")
+
+    window = SlidingWindow(3)
+    print(f"Empty window: {window}, Is empty: {window.is_empty()}, Sum: {window.sum()}")
+
+    for value in (5, 1, 4):
+        window.push(value)
+    print(f"After pushing 5, 1, 4: {window}, Is full: {window.is_full()}")
+    print(f"min={window.min()}, max={window.max()}, sum={window.sum()}, mean={window.mean():.3f}")
+    assert (window.min(), window.max(), window.sum()) == (1, 5, 10)
+
+    evicted = window.push(2)
+    print(f"Pushed 2, evicted {evicted}: {window}, min={window.min()}, max={window.max()}")
+    assert evicted == 5 and window.max() == 4
+    window.push(3)
+    print(f"Pushed 3: {window}, min={window.min()}, variance={window.variance():.4f}")
+    assert window.min() == 2 and abs(window.variance() - 2 / 3) < 1e-9
+
+    window.push_many([9, 8, 7, 6])
+    print(f"push_many([9, 8, 7, 6]): {window}, min={window.min()}, max={window.max()}")
+    assert str(window) == "[ 8, 7, 6 ]" and window.max() == 8 and window.count == 9
+
+    # Random data against recomputing from scratch
+    random.seed(2)
+    window = SlidingWindow(50)
+    recent = []
+    for _ in range(2000):
+        value = random.randint(-100, 100)
+        window.push(value)
+        recent = (recent + [value])[-50:]
+        mean = sum(recent) / len(recent)
+        assert window.min() == min(recent) and window.max() == max(recent)
+        assert window.sum() == sum(recent)
+        assert abs(window.variance() - sum((x - mean) ** 2 for x in recent) / len(recent)) < 1e-6
+    print("2000 random pushes match min/max/sum/variance recomputed over the window")
+
+    big = SlidingWindow(2000)
+    values = [random.random() for _ in range(5000)]
+    big.push_many(values)
+    big.push_many(values[:10])
+    recent = (values + values[:10])[-2000:]
+    assert big.min() == min(recent) and big.max() == max(recent)
+    assert abs(big.sum() - sum(recent)) < 1e-6
+    print(f"push_many over a 2000-sample window (NumPy {'used' if np is not None else 'not installed'}) matches")
+
+    window.clear()
+    try:
+        window.min()
+    except IndexError as e:
+        print(f"Expected error: {e}")
+
+    try:
+        SlidingWindow(0)
+    except ValueError as e:
+        print(f"Expected error: {e}")
+
+    print("SlidingWindow tests completed successfully!\n")
+
+
+def benchmark_sliding_window(n=100_000, size=1000):
+    print(f"Benchmarking {n} pushes into a {size}-sample window...")
+    random.seed(4)
+    values = [random.random() for _ in range(n)]
+
+    queue = QueueArray(size)
+    checksum = 0.0
+    start = time.perf_counter()
+    for value in values[:n // 100]:
+        if queue.is_full():
+            queue.poll()
+        queue.offer(value)
+        recent = [x for x in queue.data if x is not None]
+        checksum += min(recent) + max(recent) + sum(recent) / len(recent)
+    elapsed = time.perf_counter() - start
+    print(f"  QueueArray + recompute: {elapsed * 1e6 / (n // 100):.1f} us/push, checksum={checksum:.3f}")
+
+    window = SlidingWindow(size)
+    checksum = 0.0
+    start = time.perf_counter()
+    for value in values:
+        window.push(value)
+        checksum += window.min() + window.max() + window.mean() + window.variance()
+    elapsed = time.perf_counter() - start
+    print(f"  SlidingWindow: {elapsed * 1e6 / n:.2f} us/push, checksum={checksum:.3f}")
+    print()
+
+
+if __name__ == "__main__":
+    test_sliding_window()
+    benchmark_sliding_window()
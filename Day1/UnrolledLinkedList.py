@@ -0,0 +1,231 @@
+import time
+from itertools import chain
+
+from Day1.SinglyLinkedList import SinglyLinkedList
+
+
+class Node:
+    __slots__ = ("items", "next")
+
+    def __init__(self, items, nxt=None):
+        self.items = items
+        self.next = nxt
+
+    def __str__(self):
+        return str(self.items)
+
+
+class UnrolledLinkedList:
+    def __init__(self, node_capacity=64):
+        if node_capacity < 2:
+            raise ValueError("Node capacity must be at least 2")
+        # Each node holds up to node_capacity elements in a list, so scans
+        # run over contiguous lists and node overhead is paid once per block.
+        self.node_capacity = node_capacity
+        self.size = 0
+        self.head = None
+        self.tail = None
+
+    def clear(self):
+        self.head = None
+        self.tail = None
+        self.size = 0
+
+    def is_empty(self):
+        return self.size == 0
+
+    def add(self, elem):
+        if self.is_empty():
+            self.head = self.tail = Node([elem])
+        elif len(self.tail.items) == self.node_capacity:
+            self.tail.next = Node([elem])
+            self.tail = self.tail.next
+        else:
+            self.tail.items.append(elem)
+        self.size += 1
+
+    def add_first(self, elem):
+        if self.is_empty():
+            self.head = self.tail = Node([elem])
+        elif len(self.head.items) == self.node_capacity:
+            self.head = Node([elem], self.head)
+        else:
+            self.head.items.insert(0, elem)
+        self.size += 1
+
+    def peek_first(self):
+        if self.is_empty():
+            raise RuntimeError("Empty list")
+        return self.head.items[0]
+
+    def peek_last(self):
+        if self.is_empty():
+            raise RuntimeError("Empty list")
+        return self.tail.items[-1]
+
+    def _unlink_empty(self, prev, node):
+        if prev is None:
+            self.head = node.next
+        else:
+            prev.next = node.next
+        if node is self.tail:
+            self.tail = prev
+
+    def _merge_with_next(self, node):
+        # Keep nodes at least half full so scans stay dense.
+        nxt = node.next
+        if nxt is None or len(node.items) >= self.node_capacity // 2:
+            return
+        if len(node.items) + len(nxt.items) <= self.node_capacity:
+            node.items.extend(nxt.items)
+            node.next = nxt.next
+            if nxt is self.tail:
+                self.tail = node
+
+    def remove_first(self):
+        if self.is_empty():
+            raise RuntimeError("Empty list")
+        data = self.head.items.pop(0)
+        self.size -= 1
+        if not self.head.items:
+            self._unlink_empty(None, self.head)
+        else:
+            self._merge_with_next(self.head)
+        return data
+
+    def remove_last(self):
+        if self.is_empty():
+            raise RuntimeError("Empty list")
+        data = self.tail.items.pop()
+        self.size -= 1
+        if not self.tail.items:
+            prev = None
+            if self.head is not self.tail:
+                prev = self.head
+                while prev.next is not self.tail:
+                    prev = prev.next
+            self._unlink_empty(prev, self.tail)
+        return data
+
+    def remove_at(self, index):
+        if index < 0 or index >= self.size:
+            raise IndexError("Index out of bounds")
+        prev, node = None, self.head
+        while index >= len(node.items):
+            index -= len(node.items)
+            prev, node = node, node.next
+        data = node.items.pop(index)
+        self.size -= 1
+        if not node.items:
+            self._unlink_empty(prev, node)
+        else:
+            self._merge_with_next(node)
+        return data
+
+    def index_of(self, obj):
+        offset = 0
+        node = self.head
+        while node:
+            try:
+                return offset + node.items.index(obj)
+            except ValueError:
+                offset += len(node.items)
+                node = node.next
+        return -1
+
+    def contains(self, obj):
+        return self.index_of(obj) != -1
+
+    def _blocks(self):
+        node = self.head
+        while node:
+            yield node.items
+            node = node.next
+
+    def __iter__(self):
+        # One Python-level step per node; elements within a node are
+        # produced by chain's C loop.
+        return chain.from_iterable(self._blocks())
+
+    def __len__(self):
+        return self.size
+
+    def __str__(self):
+        return "[ " + ", ".join(str(elem) for elem in self) + " ]"
+
+
+def test_unrolled_linked_list():
+    print("Testing UnrolledLinkedList...")
+
+    ll = UnrolledLinkedList(node_capacity=4)
+    print(f"Empty list: {ll}")
+    print(f"Is empty: {ll.is_empty()}")
+
+    for i in range(10):
+        ll.add(i)
+    print(f"After adding 0..9: {ll}, Size: {len(ll)}")
+
+    ll.add_first(-1)
+    print(f"After add_first(-1): {ll}")
+    print(f"First element: {ll.peek_first()}, Last element: {ll.peek_last()}")
+
+    print(f"Index of 7: {ll.index_of(7)}")
+    print(f"Contains 9: {ll.contains(9)}, Contains 99: {ll.contains(99)}")
+    assert ll.index_of(7) == 8
+
+    print(f"Removed first: {ll.remove_first()}, List: {ll}")
+    print(f"Removed last: {ll.remove_last()}, List: {ll}")
+    print(f"Removed at 4: {ll.remove_at(4)}, List: {ll}")
+    assert list(ll) == [0, 1, 2, 3, 5, 6, 7, 8]
+
+    expected = list(ll)
+    while not ll.is_empty():
+        index = len(ll) // 2
+        assert ll.remove_at(index) == expected.pop(index)
+        assert list(ll) == expected
+    print(f"After removing everything from the middle: {ll}, Head: {ll.head}, Tail: {ll.tail}")
+
+    for i in range(6):
+        ll.add_first(i)
+    print(f"After add_first 0..5: {ll}")
+    assert list(ll) == [5, 4, 3, 2, 1, 0]
+    while not ll.is_empty():
+        ll.remove_last()
+    assert ll.head is None and ll.tail is None
+
+    try:
+        ll.peek_first()
+    except RuntimeError as e:
+        print(f"Expected error: {e}")
+
+    try:
+        ll.remove_at(0)
+    except IndexError as e:
+        print(f"Expected error: {e}")
+
+    try:
+        UnrolledLinkedList(1)
+    except ValueError as e:
+        print(f"Expected error: {e}")
+
+    print("UnrolledLinkedList tests completed successfully!\n")
+
+
+def benchmark_unrolled_linked_list(n=1_000_000):
+    print(f"Benchmarking scans over {n} elements...")
+    for name, ll in (("SinglyLinkedList", SinglyLinkedList()), ("UnrolledLinkedList", UnrolledLinkedList())):
+        for i in range(n):
+            ll.add(i)
+        start = time.perf_counter()
+        total = sum(ll)
+        iterate = time.perf_counter() - start
+        start = time.perf_counter()
+        ll.contains(-1)
+        search = time.perf_counter() - start
+        print(f"  {name}: iterate {iterate * 1e3:.1f} ms, contains(miss) {search * 1e3:.1f} ms, sum={total}")
+    print()
+
+
+if __name__ == "__main__":
+    test_unrolled_linked_list()
+    benchmark_unrolled_linked_list()
@@ -1,10 +1,64 @@
+import time
+from array import array
+from bisect import bisect_left, insort
+
+
 class MyDynamicArray:
-    def __init__(self, capacity=16):
+    def __init__(self, capacity=16, growth_factor=2.0, shrink_threshold=0.25, typecode=None, indexed=False):
         if capacity < 0:
             raise ValueError(f"Illegal Capacity: {capacity}")
+        if growth_factor <= 1:
+            raise ValueError(f"Illegal growth factor: {growth_factor}")
+        # Shrinking must leave the array strictly below full, otherwise an
+        # add right after a shrink would grow it straight back (thrashing).
+        if shrink_threshold < 0 or shrink_threshold * growth_factor >= 1:
+            raise ValueError(f"Illegal shrink threshold: {shrink_threshold}")
         self.capacity = capacity
+        self.min_capacity = capacity
+        self.growth_factor = growth_factor
+        self.shrink_threshold = shrink_threshold
+        # typecode=None stores arbitrary objects in a list; an array module
+        # typecode ('i', 'q', 'd', ...) stores raw machine values instead.
+        self.typecode = typecode
         self.length = 0
-        self.arr = [None] * capacity
+        self.arr = self._blank(capacity)
+        self.empty_value = self._blank(1)[0]
+        # indexed=True keeps value -> sorted positions so index_of/contains
+        # are O(1) on average; elements must then be hashable.
+        self.positions = {} if indexed else None
+
+    @classmethod
+    def from_bytes(cls, typecode, data, **kwargs):
+        arr = cls(0, typecode=typecode, **kwargs)
+        arr.extend(data)
+        return arr
+
+    def _blank(self, n):
+        if self.typecode is None:
+            return [None] * n
+        return array(self.typecode, bytes(n * array(self.typecode).itemsize))
+
+    def _as_storage(self, items):
+        if self.typecode is None:
+            return list(items)
+        if isinstance(items, array) and items.typecode == self.typecode:
+            return items
+        if isinstance(items, (bytes, bytearray)):
+            # Raw bytes are machine values of this typecode: one memcpy.
+            typed = array(self.typecode)
+            typed.frombytes(items)
+            return typed
+        if isinstance(items, memoryview) or hasattr(items, "__array_interface__"):
+            view = memoryview(items)
+            if (view.format == self.typecode and view.itemsize == self.arr.itemsize
+                    and view.c_contiguous):
+                # A buffer of the same element type: one memcpy. Any other
+                # buffer (e.g. 'B' elements into an 'i' array) is converted
+                # element by element below.
+                typed = array(self.typecode)
+                typed.frombytes(view.cast("B"))
+                return typed
+        return array(self.typecode, items)
 
     def size(self):
         return self.length
@@ -20,38 +74,196 @@ class MyDynamicArray:
     def set(self, index, elem):
         if index < 0 or index >= self.length:
             raise IndexError("Index out of bounds")
+        # Store (and hash) before touching the index so a rejected value
+        # leaves the array and the index in agreement.
+        self._check_hashable((elem,))
+        old = self.arr[index]
         self.arr[index] = elem
+        if self.positions is not None:
+            self._unindex(old, index)
+            insort(self.positions.setdefault(self.arr[index], []), index)
 
     def clear(self):
-        for i in range(self.length):
-            self.arr[i] = None
+        self.arr[:self.length] = self._blank(self.length)
         self.length = 0
+        if self.positions is not None:
+            self.positions.clear()
+
+    def _unindex(self, elem, index):
+        found = self.positions[elem]
+        del found[bisect_left(found, index)]
+        if not found:
+            del self.positions[elem]
+
+    def _check_hashable(self, items):
+        if self.positions is not None:
+            for item in items:
+                hash(item)
+
+    def _rebuild_index(self):
+        if self.positions is None:
+            return
+        positions = {}
+        for i in range(self.length):
+            positions.setdefault(self.arr[i], []).append(i)
+        self.positions = positions
+
+    def _resize(self, new_capacity):
+        self.arr = self.arr[:self.length] + self._blank(new_capacity - self.length)
+        self.capacity = new_capacity
+
+    def _grown_capacity(self, capacity=None):
+        if capacity is None:
+            capacity = self.capacity
+        return max(int(capacity * self.growth_factor), capacity + 1)
+
+    def _ensure_capacity(self, needed):
+        # add() keeps one spare slot, so the array grows once needed reaches capacity.
+        if needed < self.capacity:
+            return
+        new_capacity = self.capacity
+        while needed >= new_capacity:
+            new_capacity = self._grown_capacity(new_capacity)
+        self._resize(new_capacity)
+
+    def _shrink_if_sparse(self):
+        new_capacity = self.capacity
+        while new_capacity > self.min_capacity and self.length < new_capacity * self.shrink_threshold:
+            new_capacity = max(int(new_capacity / self.growth_factor), self.min_capacity)
+        if new_capacity != self.capacity:
+            self._resize(new_capacity)
 
     def add(self, elem):
         if self.length + 1 >= self.capacity:
-            self.capacity = 2 * self.capacity if self.capacity > 0 else 1
-            new_arr = [None] * self.capacity
-            for i in range(self.length):
-                new_arr[i] = self.arr[i]
-            self.arr = new_arr
+            self._resize(self._grown_capacity())
+        self._check_hashable((elem,))
         self.arr[self.length] = elem
+        if self.positions is not None:
+            self.positions.setdefault(self.arr[self.length], []).append(self.length)
         self.length += 1
 
     def remove_at(self, index):
         if index < 0 or index >= self.length:
             raise IndexError("Index out of bounds")
         data = self.arr[index]
-        new_arr = [None] * (self.length - 1)
-        for i in range(self.length):
-            if i < index:
-                new_arr[i] = self.arr[i]
-            elif i > index:
-                new_arr[i - 1] = self.arr[i]
-        self.arr = new_arr
+        if self.positions is not None:
+            self._unindex(data, index)
+            # Every element after index moves down one slot.
+            for i in range(index + 1, self.length):
+                found = self.positions[self.arr[i]]
+                found[bisect_left(found, i)] = i - 1
+        self.arr[index:self.length - 1] = self.arr[index + 1:self.length]
         self.length -= 1
-        self.capacity = self.length
+        self.arr[self.length] = self.empty_value
+        self._shrink_if_sparse()
         return data
 
+    def extend(self, items):
+        items = self._as_storage(items)
+        self._check_hashable(items)
+        needed = self.length + len(items)
+        self._ensure_capacity(needed)
+        self.arr[self.length:needed] = items
+        if self.positions is not None:
+            for i in range(self.length, needed):
+                self.positions.setdefault(self.arr[i], []).append(i)
+        self.length = needed
+
+    def insert_many(self, index, items):
+        if index < 0 or index > self.length:
+            raise IndexError("Index out of bounds")
+        items = self._as_storage(items)
+        self._check_hashable(items)
+        count = len(items)
+        needed = self.length + count
+        self._ensure_capacity(needed)
+        self.arr[index + count:needed] = self.arr[index:self.length]
+        self.arr[index:index + count] = items
+        self.length = needed
+        self._rebuild_index()
+
+    def delete_range(self, start, stop):
+        if start < 0 or stop > self.length or start > stop:
+            raise IndexError("Range out of bounds")
+        count = stop - start
+        self.arr[start:self.length - count] = self.arr[stop:self.length]
+        self.arr[self.length - count:self.length] = self._blank(count)
+        self.length -= count
+        self._rebuild_index()
+        self._shrink_if_sparse()
+
+    def _normalize_index(self, index):
+        if index < 0:
+            index += self.length
+        if index < 0 or index >= self.length:
+            raise IndexError("Index out of bounds")
+        return index
+
+    def __getitem__(self, key):
+        if not isinstance(key, slice):
+            return self.arr[self._normalize_index(key)]
+        start, stop, step = key.indices(self.length)
+        if step == 1:
+            items = self.arr[start:max(start, stop)]
+        else:
+            items = self.arr[:self.length][key]
+        result = MyDynamicArray(0, self.growth_factor, self.shrink_threshold, self.typecode)
+        result.extend(items)
+        return result
+
+    def __setitem__(self, key, value):
+        if not isinstance(key, slice):
+            self.set(self._normalize_index(key), value)
+            return
+        items = self._as_storage(value)
+        self._check_hashable(items)
+        start, stop, step = key.indices(self.length)
+        if step != 1:
+            positions = range(start, stop, step)
+            if len(items) != len(positions):
+                raise ValueError(
+                    f"attempt to assign sequence of size {len(items)} to extended slice of size {len(positions)}"
+                )
+            for position, item in zip(positions, items):
+                self.arr[position] = item
+            self._rebuild_index()
+            return
+        stop = max(start, stop)
+        common = min(stop - start, len(items))
+        self.arr[start:start + common] = items[:common]
+        if common == stop - start == len(items):
+            self._rebuild_index()
+        elif common < stop - start:
+            self.delete_range(start + common, stop)
+        elif common < len(items):
+            self.insert_many(stop, items[common:])
+
+    def __delitem__(self, key):
+        if not isinstance(key, slice):
+            self.remove_at(self._normalize_index(key))
+            return
+        start, stop, step = key.indices(self.length)
+        if step != 1:
+            raise ValueError("delete with an extended slice is not supported")
+        self.delete_range(start, max(start, stop))
+
+    def __len__(self):
+        return self.length
+
+    def memoryview(self):
+        # The view aliases the current storage; growing or shrinking the
+        # array swaps in new storage, so take a fresh view after resizing.
+        # Writes through the view bypass the value index of indexed arrays.
+        if self.typecode is None:
+            raise TypeError("memoryview requires a typed array")
+        return memoryview(self.arr)[:self.length]
+
+    def __buffer__(self, flags):
+        return self.memoryview()
+
+    def to_bytes(self):
+        return self.memoryview().tobytes()
+
     def remove(self, obj):
         index = self.index_of(obj)
         if index == -1:
@@ -60,6 +272,9 @@ class MyDynamicArray:
         return True
 
     def index_of(self, obj):
+        if self.positions is not None:
+            found = self.positions.get(obj)
+            return found[0] if found else -1
         for i in range(self.length):
             if self.arr[i] == obj:
                 return i
@@ -68,6 +283,11 @@ class MyDynamicArray:
     def contains(self, obj):
         return self.index_of(obj) != -1
 
+    def indices_of(self, obj):
+        if self.positions is not None:
+            return list(self.positions.get(obj, ()))
+        return [i for i in range(self.length) if self.arr[i] == obj]
+
     def __iter__(self):
         for i in range(self.length):
             yield self.arr[i]
@@ -128,9 +348,237 @@ def test_dynamic_array():
         MyDynamicArray(-1)
     except ValueError as e:
         print(f"Expected error with negative capacity: {e}")
-    
+
+    try:
+        MyDynamicArray(4, growth_factor=2.0, shrink_threshold=0.5)
+    except ValueError as e:
+        print(f"Expected error with thrashing shrink threshold: {e}")
+
+    print("Testing shrink policy...")
+    arr = MyDynamicArray(4)
+    for i in range(64):
+        arr.add(i)
+    grown = arr.capacity
+    print(f"Capacity after 64 adds: {grown}")
+    while arr.size() > 4:
+        arr.remove_at(0)
+    print(f"Capacity after removing down to 4: {arr.capacity}, Array: {arr}")
+    assert arr.capacity < grown
+    assert arr.capacity >= arr.min_capacity
+    assert list(arr) == [60, 61, 62, 63]
+
+    capacity = arr.capacity
+    for _ in range(100):
+        arr.add(99)
+        arr.remove_at(arr.size() - 1)
+    print(f"Capacity after add/remove churn at the boundary: {arr.capacity}")
+    assert arr.capacity == capacity
+
+    arr = MyDynamicArray(1, growth_factor=1.5)
+    for i in range(10):
+        arr.add(i)
+    print(f"Growth factor 1.5 - Size: {arr.size()}, Capacity: {arr.capacity}")
+    assert list(arr) == list(range(10))
+
+    print("Testing bulk operations...")
+    arr = MyDynamicArray(2)
+    arr.extend(range(10))
+    print(f"After extend(range(10)): {arr}, Capacity: {arr.capacity}")
+    assert arr.capacity == 16
+    arr.insert_many(3, ["a", "b"])
+    print(f"After insert_many(3, ['a', 'b']): {arr}")
+    assert list(arr) == [0, 1, 2, "a", "b", 3, 4, 5, 6, 7, 8, 9]
+    arr.delete_range(3, 5)
+    print(f"After delete_range(3, 5): {arr}")
+    assert list(arr) == list(range(10))
+
+    print(f"Slice [2:5]: {arr[2:5]}, Slice [::3]: {arr[::3]}, Slice [::-1]: {arr[::-1]}")
+    assert list(arr[2:5]) == [2, 3, 4]
+    assert list(arr[::-1]) == list(range(9, -1, -1))
+    print(f"Last element via arr[-1]: {arr[-1]}, len: {len(arr)}")
+
+    arr[0:2] = [100, 101, 102, 103]
+    print(f"After arr[0:2] = [100, 101, 102, 103]: {arr}")
+    assert list(arr) == [100, 101, 102, 103] + list(range(2, 10))
+    arr[0:4] = [0]
+    print(f"After arr[0:4] = [0]: {arr}")
+    arr[1::2] = [-1] * 4
+    print(f"After arr[1::2] = [-1] * 4: {arr}")
+    assert list(arr) == [0, -1, 3, -1, 5, -1, 7, -1, 9]
+    del arr[1:8]
+    del arr[-1]
+    print(f"After del arr[1:8], del arr[-1]: {arr}")
+    assert list(arr) == [0]
+
+    try:
+        arr.insert_many(5, [1])
+    except IndexError as e:
+        print(f"Expected error inserting past the end: {e}")
+
+    try:
+        arr.delete_range(0, 5)
+    except IndexError as e:
+        print(f"Expected error deleting past the end: {e}")
+
+    try:
+        arr[::2] = [1, 2, 3]
+    except ValueError as e:
+        print(f"Expected error assigning to extended slice: {e}")
+
+    arr = MyDynamicArray(4)
+    arr.extend(range(1000))
+    arr.delete_range(0, 998)
+    print(f"Capacity after deleting 998 of 1000: {arr.capacity}")
+    assert arr.capacity < 16
+
+    print("Testing value index...")
+    arr = MyDynamicArray(2, indexed=True)
+    for value in ["a", "b", "a", "c", "b", "a"]:
+        arr.add(value)
+    print(f"Indexed array: {arr}")
+    print(f"Index of 'b': {arr.index_of('b')}, positions of 'a': {arr.indices_of('a')}")
+    assert arr.indices_of("a") == [0, 2, 5]
+    assert arr.contains("c") and not arr.contains("z")
+
+    arr.remove_at(0)
+    arr.set(0, "a")
+    print(f"After remove_at(0), set(0, 'a'): {arr}, positions of 'a': {arr.indices_of('a')}")
+    assert arr.indices_of("a") == [0, 1, 4]
+    assert arr.indices_of("b") == [3]
+
+    arr.remove("c")
+    arr.extend(["c", "c"])
+    arr.insert_many(1, ["d"])
+    arr[2:4] = ["e"]
+    del arr[0]
+    print(f"After bulk edits: {arr}")
+    for value in "abcde":
+        assert arr.indices_of(value) == [i for i, x in enumerate(arr) if x == value], value
+
+    arr.clear()
+    print(f"Contains 'a' after clear: {arr.contains('a')}")
+    assert arr.index_of("a") == -1
+
+    # Rejected values must leave the array and its index unchanged
+    arr = MyDynamicArray(typecode="i", indexed=True)
+    arr.add(1)
+    try:
+        arr.add(1.5)
+    except TypeError as e:
+        print(f"Expected error adding a float to an indexed 'i' array: {e}")
+    assert not arr.contains(1.5) and arr.positions == {1: [0]} and len(arr) == 1
+    arr = MyDynamicArray(indexed=True)
+    arr.extend([1, 2])
+    for bad_edit in (lambda: arr.set(0, [1]), lambda: arr.add([1]), lambda: arr.extend([3, [1]]),
+                     lambda: arr.insert_many(0, [[1]]), lambda: arr.__setitem__(slice(0, 1), [[1]])):
+        try:
+            bad_edit()
+        except TypeError:
+            pass
+        assert list(arr) == [1, 2] and arr.positions == {1: [0], 2: [1]}
+    assert arr.remove(1) and list(arr) == [2]
+    print("Unhashable values are rejected before the array or index changes")
+
+    print("Testing typed mode...")
+    typed = MyDynamicArray(2, typecode="q")
+    for i in range(5):
+        typed.add(i * 10)
+    print(f"Typed array: {typed}, Capacity: {typed.capacity}")
+    typed.extend(range(50, 53))
+    typed.extend(array("q", [60, 70]))
+    print(f"After extend: {typed}")
+    assert list(typed) == [0, 10, 20, 30, 40, 50, 51, 52, 60, 70]
+    removed = typed.remove_at(0)
+    print(f"Removed from typed array: {removed}, Array: {typed}")
+
+    view = typed.memoryview()
+    print(f"memoryview format: {view.format}, itemsize: {view.itemsize}, len: {len(view)}")
+    assert view.tolist() == list(typed)
+    view[0] = 11
+    assert typed.get(0) == 11
+    view.release()
+
+    raw = typed.to_bytes()
+    copy = MyDynamicArray.from_bytes("q", raw)
+    print(f"Round trip through {len(raw)} bytes: {copy}")
+    assert list(copy) == list(typed)
+
+    doubles = MyDynamicArray(typecode="d")
+    doubles.extend(memoryview(array("d", [0.5, 1.5])))
+    doubles.extend([2.5])
+    print(f"Double array: {doubles}")
+    assert list(doubles) == [0.5, 1.5, 2.5]
+
+    ints = MyDynamicArray(typecode="i")
+    ints.extend(memoryview(bytes([1, 2, 255])))
+    ints.extend(memoryview(array("B", [7])))
+    print(f"'B' buffers extended into an 'i' array convert per element: {ints}")
+    assert list(ints) == [1, 2, 255, 7]
+
+    try:
+        typed.add("not a number")
+    except TypeError as e:
+        print(f"Expected error adding a str to a typed array: {e}")
+
+    try:
+        MyDynamicArray().memoryview()
+    except TypeError as e:
+        print(f"Expected error viewing an untyped array: {e}")
+
+    typed.clear()
+    print(f"Typed array after clear: {typed}, Is empty: {typed.is_empty()}")
+
     print("MyDynamicArray tests completed successfully!\n")
 
 
+def benchmark_dynamic_array(n=200_000):
+    print(f"Benchmarking MyDynamicArray mixed add/remove ({n} ops per pattern)...")
+    patterns = {
+        "add then remove_at(last)": lambda arr, i: arr.remove_at(arr.size() - 1) if i % 2 else arr.add(i),
+        "add then remove_at(0) on small array": lambda arr, i: arr.remove_at(0) if i % 2 else arr.add(i),
+    }
+    for name, op in patterns.items():
+        arr = MyDynamicArray()
+        for i in range(1000):
+            arr.add(i)
+        start = time.perf_counter()
+        for i in range(n):
+            op(arr, i)
+        elapsed = time.perf_counter() - start
+        print(f"  {name}: {elapsed * 1e9 / n:.0f} ns/op (capacity {arr.capacity})")
+
+    arr = MyDynamicArray()
+    start = time.perf_counter()
+    for i in range(n):
+        arr.add(i)
+    while not arr.is_empty():
+        arr.remove_at(arr.size() - 1)
+    elapsed = time.perf_counter() - start
+    print(f"  fill then drain: {elapsed * 1e9 / (2 * n):.0f} ns/op (capacity {arr.capacity})")
+
+    batch = list(range(10_000))
+    for name, ingest in (
+        ("add per element", lambda arr: [arr.add(x) for x in batch]),
+        ("extend per batch", lambda arr: arr.extend(batch)),
+    ):
+        arr = MyDynamicArray()
+        start = time.perf_counter()
+        for _ in range(20):
+            ingest(arr)
+        elapsed = time.perf_counter() - start
+        print(f"  {name} (20 x 10k batches): {elapsed * 1e3 / 20:.2f} ms/batch")
+
+    for indexed in (False, True):
+        arr = MyDynamicArray(indexed=indexed)
+        arr.extend(range(10_000))
+        start = time.perf_counter()
+        for i in range(2_000):
+            arr.contains(i * 7)
+        elapsed = time.perf_counter() - start
+        print(f"  contains on 10k elements (indexed={indexed}): {elapsed * 1e6 / 2_000:.1f} us/op")
+    print()
+
+
 if __name__ == "__main__":
     test_dynamic_array()
+    benchmark_dynamic_array()
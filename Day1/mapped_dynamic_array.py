@@ -0,0 +1,254 @@
+import gc
+import mmap
+import os
+import struct
+import tempfile
+import warnings
+from array import array
+
+
+class MappedDynamicArray:
+    # File layout: magic, typecode, padding, length, capacity, then
+    # `capacity` raw elements. The header is 24 bytes so 8-byte elements
+    # stay aligned.
+    HEADER = struct.Struct("<4sc3xQQ")
+    MAGIC = b"MDA1"
+    LENGTH_OFFSET = 8
+    CAPACITY_OFFSET = 16
+
+    def __init__(self, path, typecode=None, capacity=16, readonly=False):
+        if capacity <= 0:
+            raise ValueError(f"Illegal Capacity: {capacity}")
+        self.path = path
+        self.readonly = readonly
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        if not exists:
+            if readonly:
+                raise FileNotFoundError(f"No array file at {path}")
+            if typecode is None:
+                raise ValueError("typecode is required to create a new array file")
+            with open(path, "wb") as f:
+                f.write(self.HEADER.pack(self.MAGIC, typecode.encode(), 0, capacity))
+                f.truncate(self.HEADER.size + capacity * array(typecode).itemsize)
+        self.file = open(path, "rb" if readonly else "r+b")
+        self.mm = None
+        self.view = None
+        try:
+            self._map()
+        except Exception:
+            self.file.close()
+            raise
+        if typecode is not None and typecode != self.typecode:
+            self.close()
+            raise ValueError(f"File holds typecode {self.typecode!r}, not {typecode!r}")
+
+    def _map(self):
+        access = mmap.ACCESS_READ if self.readonly else mmap.ACCESS_WRITE
+        self.mm = mmap.mmap(self.file.fileno(), 0, access=access)
+        try:
+            if len(self.mm) < self.HEADER.size:
+                raise ValueError(f"{self.path} is not a mapped array file")
+            magic, typecode, length, capacity = self.HEADER.unpack_from(self.mm)
+            if magic != self.MAGIC:
+                raise ValueError(f"{self.path} is not a mapped array file")
+            self.typecode = typecode.decode()
+            self.itemsize = array(self.typecode).itemsize
+            self.length = length
+            self.capacity = capacity
+            end = self.HEADER.size + capacity * self.itemsize
+            if len(self.mm) < end or length > capacity:
+                raise ValueError(f"{self.path} is truncated or corrupt")
+            self.view = memoryview(self.mm)[self.HEADER.size:end].cast(self.typecode)
+        except Exception:
+            self._unmap()
+            raise
+
+    def _unmap(self):
+        if self.view is not None:
+            self.view.release()
+            self.view = None
+        if self.mm is not None:
+            self.mm.close()
+            self.mm = None
+
+    def _check_writable(self):
+        if self.readonly:
+            raise PermissionError("Array is opened read-only")
+
+    def _store_length(self):
+        struct.pack_into("<Q", self.mm, self.LENGTH_OFFSET, self.length)
+
+    def _grow(self):
+        new_capacity = 2 * self.capacity
+        self._unmap()
+        self.file.truncate(self.HEADER.size + new_capacity * self.itemsize)
+        self.file.seek(self.CAPACITY_OFFSET)
+        self.file.write(struct.pack("<Q", new_capacity))
+        self.file.flush()
+        self._map()
+
+    def refresh(self):
+        # Readers map the file as it was when opened; call this to pick up
+        # elements appended (or growth done) by a writer since then.
+        self._unmap()
+        self._map()
+
+    def size(self):
+        return self.length
+
+    def is_empty(self):
+        return self.length == 0
+
+    def get(self, index):
+        if index < 0 or index >= self.length:
+            raise IndexError("Index out of bounds")
+        return self.view[index]
+
+    def set(self, index, elem):
+        self._check_writable()
+        if index < 0 or index >= self.length:
+            raise IndexError("Index out of bounds")
+        self.view[index] = elem
+
+    def add(self, elem):
+        self._check_writable()
+        if self.length == self.capacity:
+            self._grow()
+        self.view[self.length] = elem
+        self.length += 1
+        self._store_length()
+
+    def remove_at(self, index):
+        self._check_writable()
+        if index < 0 or index >= self.length:
+            raise IndexError("Index out of bounds")
+        data = self.view[index]
+        self.view[index:self.length - 1] = self.view[index + 1:self.length]
+        self.length -= 1
+        self._store_length()
+        return data
+
+    def clear(self):
+        self._check_writable()
+        self.length = 0
+        self._store_length()
+
+    def flush(self):
+        if not self.readonly:
+            self.mm.flush()
+
+    def close(self):
+        if self.file.closed:
+            return
+        self.flush()
+        self._unmap()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        for i in range(self.length):
+            yield self.view[i]
+
+    def __str__(self):
+        if self.length == 0:
+            return "[]"
+        return "[" + ", ".join(str(x) for x in self.view[:self.length].tolist()) + "]"
+
+
+def test_mapped_dynamic_array():
+    print("Testing MappedDynamicArray...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "samples.mda")
+
+        with MappedDynamicArray(path, "q", capacity=2) as arr:
+            print(f"Empty array: {arr}, Is empty: {arr.is_empty()}")
+            for i in range(5):
+                arr.add(i * 10)
+            print(f"After adding 0..40: {arr}")
+            print(f"Size: {arr.size()}, Capacity: {arr.capacity}")
+            assert arr.capacity == 8
+
+            arr.set(1, 11)
+            removed = arr.remove_at(0)
+            print(f"Removed element at index 0: {removed}, Array: {arr}")
+            print(f"File size: {os.path.getsize(path)} bytes")
+
+        with MappedDynamicArray(path) as arr:
+            print(f"Reopened array: {arr}, typecode: {arr.typecode}")
+            assert list(arr) == [11, 20, 30, 40]
+            arr.add(50)
+
+        reader_a = MappedDynamicArray(path, readonly=True)
+        reader_b = MappedDynamicArray(path, readonly=True)
+        print(f"Two concurrent readers: {reader_a}, {reader_b}")
+        assert list(reader_a) == list(reader_b) == [11, 20, 30, 40, 50]
+
+        try:
+            reader_a.add(60)
+        except PermissionError as e:
+            print(f"Expected error writing through a reader: {e}")
+
+        with MappedDynamicArray(path) as writer:
+            for i in range(10):
+                writer.add(i)
+            reader_a.refresh()
+            print(f"Reader after refresh: size {reader_a.size()}, capacity {reader_a.capacity}")
+            assert reader_a.size() == 15
+            assert reader_b.size() == 5
+        reader_a.close()
+        reader_b.close()
+
+        try:
+            MappedDynamicArray(path, "d")
+        except ValueError as e:
+            print(f"Expected error with mismatched typecode: {e}")
+
+        # Foreign, too short for a header, and cut off after the header
+        header = MappedDynamicArray.HEADER.pack(MappedDynamicArray.MAGIC, b"i", 0, 100)
+        bad_files = (("foreign", b"not an array file" * 4), ("short", b"MDA1i"), ("truncated", header + bytes(8)))
+        for name, contents in bad_files:
+            bad = os.path.join(tmp, name + ".bin")
+            with open(bad, "wb") as f:
+                f.write(contents)
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always", ResourceWarning)
+                try:
+                    MappedDynamicArray(bad)
+                    assert False, name
+                except ValueError as e:
+                    print(f"Expected error opening a {name} file: {e}")
+                gc.collect()
+            assert not [w for w in caught if issubclass(w.category, ResourceWarning)]
+
+        try:
+            MappedDynamicArray(os.path.join(tmp, "missing.mda"))
+        except ValueError as e:
+            print(f"Expected error creating without typecode: {e}")
+
+        try:
+            MappedDynamicArray(os.path.join(tmp, "missing.mda"), readonly=True)
+        except FileNotFoundError as e:
+            print(f"Expected error opening missing file read-only: {e}")
+
+        with MappedDynamicArray(path) as arr:
+            arr.clear()
+            print(f"After clear: {arr}, Is empty: {arr.is_empty()}")
+            try:
+                arr.get(0)
+            except IndexError as e:
+                print(f"Expected error accessing empty array: {e}")
+
+    print("MappedDynamicArray tests completed successfully!\n")
+
+
+if __name__ == "__main__":
+    test_mapped_dynamic_array()
@@ -0,0 +1,296 @@
+import time
+from itertools import chain
+
+from Day2.LinkedListQueue import LinkedListQueue
+
+
+class Block:
+    __slots__ = ("items", "prev", "next")
+
+    def __init__(self, size):
+        self.items = [None] * size
+        self.prev = None
+        self.next = None
+
+
+class BlockDeque:
+    def __init__(self, block_size=64):
+        if block_size < 2:
+            raise ValueError("Block size must be at least 2")
+        # Elements live in doubly linked fixed-size blocks, so a block is
+        # allocated once per block_size offers instead of a node per offer.
+        # The first element is left.items[left_index] and the last is
+        # right.items[right_index].
+        self.block_size = block_size
+        self.spare = None
+        self.clear()
+
+    def clear(self):
+        block = Block(self.block_size)
+        self.left = self.right = block
+        self._recenter()
+        self.size = 0
+
+    def _recenter(self):
+        # Start an empty deque mid-block so either end can grow before a new
+        # block is needed.
+        self.left_index = self.block_size // 2
+        self.right_index = self.left_index - 1
+
+    def _new_block(self):
+        # One freed block is kept so a queue hovering at a block boundary does
+        # not allocate and free on every operation.
+        if self.spare is not None:
+            block, self.spare = self.spare, None
+            return block
+        return Block(self.block_size)
+
+    def _free_block(self, block):
+        block.prev = block.next = None
+        self.spare = block
+
+    def is_empty(self):
+        return self.size == 0
+
+    def offer(self, elem):
+        if self.right_index == self.block_size - 1:
+            block = self._new_block()
+            block.prev = self.right
+            self.right.next = block
+            self.right = block
+            self.right_index = -1
+        self.right_index += 1
+        self.right.items[self.right_index] = elem
+        self.size += 1
+
+    def offer_first(self, elem):
+        if self.left_index == 0:
+            block = self._new_block()
+            block.next = self.left
+            self.left.prev = block
+            self.left = block
+            self.left_index = self.block_size
+        self.left_index -= 1
+        self.left.items[self.left_index] = elem
+        self.size += 1
+
+    def enqueue(self, elem):
+        self.offer(elem)
+
+    def extend(self, items):
+        items = list(items)
+        pos, count = 0, len(items)
+        while pos < count:
+            if self.right_index == self.block_size - 1:
+                block = self._new_block()
+                block.prev = self.right
+                self.right.next = block
+                self.right = block
+                self.right_index = -1
+            start = self.right_index + 1
+            take = min(self.block_size - start, count - pos)
+            self.right.items[start:start + take] = items[pos:pos + take]
+            self.right_index += take
+            pos += take
+        self.size += count
+
+    def poll(self):
+        if self.is_empty():
+            raise IndexError("Queue is empty")
+        block = self.left
+        data = block.items[self.left_index]
+        block.items[self.left_index] = None
+        self.left_index += 1
+        self.size -= 1
+        if self.size == 0:
+            self._recenter()
+        elif self.left_index == self.block_size:
+            self.left = block.next
+            self.left.prev = None
+            self.left_index = 0
+            self._free_block(block)
+        return data
+
+    def poll_last(self):
+        if self.is_empty():
+            raise IndexError("Queue is empty")
+        block = self.right
+        data = block.items[self.right_index]
+        block.items[self.right_index] = None
+        self.right_index -= 1
+        self.size -= 1
+        if self.size == 0:
+            self._recenter()
+        elif self.right_index == -1:
+            self.right = block.prev
+            self.right.next = None
+            self.right_index = self.block_size - 1
+            self._free_block(block)
+        return data
+
+    def dequeue(self):
+        return self.poll()
+
+    def popleft_many(self, n):
+        if n < 0:
+            raise ValueError("Count must be non-negative")
+        if n > self.size:
+            raise IndexError("Queue is empty")
+        result = []
+        remaining = n
+        while remaining:
+            block = self.left
+            end = min(self.block_size, self.left_index + remaining)
+            result += block.items[self.left_index:end]
+            block.items[self.left_index:end] = [None] * (end - self.left_index)
+            remaining -= end - self.left_index
+            self.left_index = end
+            if end == self.block_size and block is not self.right:
+                self.left = block.next
+                self.left.prev = None
+                self.left_index = 0
+                self._free_block(block)
+        self.size -= n
+        if self.size == 0:
+            self._recenter()
+        return result
+
+    def peek(self):
+        if self.is_empty():
+            raise IndexError("Queue is empty")
+        return self.left.items[self.left_index]
+
+    def peek_last(self):
+        if self.is_empty():
+            raise IndexError("Queue is empty")
+        return self.right.items[self.right_index]
+
+    def front_element(self):
+        return self.peek()
+
+    def rear_element(self):
+        return None if self.is_empty() else self.right.items[self.right_index]
+
+    def _slices(self):
+        block = self.left
+        start = self.left_index
+        while block is not self.right:
+            yield block.items[start:]
+            block = block.next
+            start = 0
+        yield block.items[start:self.right_index + 1]
+
+    def contains(self, elem):
+        return any(elem in items for items in self._slices())
+
+    def to_list(self):
+        return list(self)
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        # One Python-level step per block; elements within a block are
+        # produced by chain's C loop.
+        if self.is_empty():
+            return iter(())
+        return chain.from_iterable(self._slices())
+
+    def __str__(self):
+        return "[ " + ", ".join(str(elem) for elem in self) + " ]"
+
+    def __bool__(self):
+        return not self.is_empty()
+
+
+def test_block_deque():
+    print("Testing BlockDeque...")
+
+    queue = BlockDeque(block_size=4)
+    print(f"Empty queue: {queue}, Is empty: {queue.is_empty()}, Boolean value: {bool(queue)}")
+
+    queue.enqueue(10)
+    queue.enqueue(20)
+    queue.enqueue(30)
+    print(f"After enqueuing 10, 20, 30: {queue}, Size: {len(queue)}")
+    print(f"Front: {queue.front_element()}, Rear: {queue.rear_element()}")
+
+    queue.offer_first(5)
+    queue.offer_first(0)
+    print(f"After offer_first 5 and 0: {queue}")
+    print(f"Dequeued: {queue.dequeue()}, Polled last: {queue.poll_last()}, Queue: {queue}")
+    assert queue.to_list() == [5, 10, 20]
+
+    queue.extend(range(100, 110))
+    print(f"After extend(100..109): {queue}, Contains 105: {queue.contains(105)}, Contains 99: {queue.contains(99)}")
+    polled = queue.popleft_many(6)
+    print(f"popleft_many(6): {polled}, Queue: {queue}")
+    assert polled == [5, 10, 20, 100, 101, 102]
+    assert queue.to_list() == list(range(103, 110))
+
+    # Mixed operations at both ends against a Python list
+    model = list(queue)
+    for step in range(2000):
+        op = step * 7919 % 6
+        if op == 0:
+            queue.offer(step)
+            model.append(step)
+        elif op == 1:
+            queue.offer_first(step)
+            model.insert(0, step)
+        elif op == 2 and model:
+            assert queue.poll() == model.pop(0)
+        elif op == 3 and model:
+            assert queue.poll_last() == model.pop()
+        elif op == 4:
+            queue.extend(range(step % 9))
+            model.extend(range(step % 9))
+        elif op == 5:
+            n = min(len(model), step % 11)
+            assert queue.popleft_many(n) == model[:n]
+            del model[:n]
+        assert len(queue) == len(model)
+    assert list(queue) == model
+    print(f"2000 mixed operations match a Python list (size {len(queue)})")
+
+    assert queue.popleft_many(len(queue)) == model
+    print(f"After draining: {queue}, Is empty: {queue.is_empty()}, Rear: {queue.rear_element()}")
+
+    try:
+        queue.dequeue()
+    except IndexError as e:
+        print(f"Expected error when dequeuing empty queue: {e}")
+
+    try:
+        queue.popleft_many(1)
+    except IndexError as e:
+        print(f"Expected error when popleft_many exceeds size: {e}")
+
+    try:
+        BlockDeque(block_size=1)
+    except ValueError as e:
+        print(f"Expected error: {e}")
+
+    print("BlockDeque tests completed successfully!\n")
+
+
+def benchmark_block_deque(n=1_000_000, depth=1000):
+    print(f"Benchmarking {n} enqueue/dequeue pairs at depth {depth}...")
+    for name, queue in (("LinkedListQueue", LinkedListQueue()), ("BlockDeque", BlockDeque())):
+        for i in range(depth):
+            queue.enqueue(i)
+        start = time.perf_counter()
+        for i in range(n):
+            queue.enqueue(i)
+            queue.dequeue()
+        elapsed = time.perf_counter() - start
+        start = time.perf_counter()
+        total = sum(queue)
+        iterate = time.perf_counter() - start
+        print(f"  {name}: {elapsed * 1e9 / n:.0f} ns/pair, iterate {iterate * 1e6:.0f} us, sum={total}")
+    print()
+
+
+if __name__ == "__main__":
+    test_block_deque()
+    benchmark_block_deque()
@@ -1,4 +1,6 @@
 class Node:
+    __slots__ = ("data", "next")
+
     def __init__(self, data):
         self.data = data
         self.next = None
@@ -8,10 +10,26 @@ class Node:
 
 
 class CircularLinkedList:
-    def __init__(self):
+    def __init__(self, node_pool_size=0):
         self.head = None
         self.tail = None
         self.size = 0
+        # Up to node_pool_size removed nodes are kept for reuse by later adds.
+        self.node_pool_size = node_pool_size
+        self.free_nodes = []
+
+    def _new_node(self, data):
+        if self.free_nodes:
+            node = self.free_nodes.pop()
+            node.data = data
+            return node
+        return Node(data)
+
+    def _recycle(self, node):
+        if len(self.free_nodes) < self.node_pool_size:
+            node.data = None
+            node.next = None
+            self.free_nodes.append(node)
 
     def is_empty(self):
         return self.size == 0
@@ -42,7 +60,7 @@ class CircularLinkedList:
         return "[ " + ", ".join(values) + " ]"
 
     def add(self, elem):
-        node = Node(elem)
+        node = self._new_node(elem)
         if self.is_empty():
             self.head = self.tail = node
             self.tail.next = self.head
@@ -53,7 +71,7 @@ class CircularLinkedList:
         self.size += 1
 
     def add_first(self, elem):
-        node = Node(elem)
+        node = self._new_node(elem)
         if self.is_empty():
             self.head = self.tail = node
             self.tail.next = self.head
@@ -66,19 +84,22 @@ class CircularLinkedList:
     def remove_first(self):
         if self.is_empty():
             raise RuntimeError("Empty list")
-        data = self.head.data
+        node = self.head
+        data = node.data
         if self.head == self.tail:
             self.head = self.tail = None
         else:
-            self.head = self.head.next
+            self.head = node.next
             self.tail.next = self.head
         self.size -= 1
+        self._recycle(node)
         return data
 
     def remove_last(self):
         if self.is_empty():
             raise RuntimeError("Empty list")
-        data = self.tail.data
+        node = self.tail
+        data = node.data
         if self.head == self.tail:
             self.head = self.tail = None
         else:
@@ -88,6 +109,7 @@ class CircularLinkedList:
             self.tail = trav
             self.tail.next = self.head
         self.size -= 1
+        self._recycle(node)
         return data
 
     def remove_at(self, index):
@@ -98,11 +120,13 @@ class CircularLinkedList:
         prev = self.head
         for _ in range(index - 1):
             prev = prev.next
-        data = prev.next.data
-        prev.next = prev.next.next
+        node = prev.next
+        data = node.data
+        prev.next = node.next
         if index == self.size - 1:
             self.tail = prev
         self.size -= 1
+        self._recycle(node)
         return data
 
     def peek(self):
@@ -135,15 +159,33 @@ class CircularLinkedList:
             first_pass = False
         return -1
 
+    def next(self):
+        # Round-robin step: return the current (head) element and advance.
+        if self.is_empty():
+            raise RuntimeError("Empty list")
+        data = self.head.data
+        self.tail = self.head
+        self.head = self.head.next
+        return data
+
+    def remove_current(self):
+        # The current element's predecessor is the tail, so this is O(1).
+        return self.remove_first()
+
     def rotate(self, steps=1):
         if self.is_empty() or self.size == 1:
             return
+        # Negative steps rotate backwards; in a singly linked ring that is the
+        # same as size - steps forward, so take whichever is left after the
+        # modulo. Only the new tail is walked to; head follows from it.
         steps = steps % self.size
         if steps == 0:
             return
+        trav = self.tail
         for _ in range(steps):
-            self.head = self.head.next
-            self.tail = self.tail.next
+            trav = trav.next
+        self.tail = trav
+        self.head = trav.next
 
     def clear(self):
         self.head = self.tail = None
@@ -200,6 +242,17 @@ def test_circular_linked_list():
     cll.rotate(2)
     print(f"List after rotate(2): {cll}")
 
+    cll.rotate(-1)
+    print(f"List after rotate(-1): {cll}")
+    assert list(cll) == [50, 10, 40]
+
+    # Round-robin stepping
+    served = [cll.next() for _ in range(4)]
+    print(f"next() x4: {served}, current: {cll.peek()}")
+    assert served == [50, 10, 40, 50]
+    print(f"Removed current: {cll.remove_current()}, List: {cll}")
+    assert list(cll) == [40, 50] and cll.tail.next is cll.head
+
     # Iteration
     print("Iteration over list:")
     for elem in cll:
@@ -221,6 +274,21 @@ def test_circular_linked_list():
     except IndexError as e:
         print(f"Expected error with invalid index: {e}")
 
+    # Node pooling
+    pooled = CircularLinkedList(node_pool_size=8)
+    for i in range(5):
+        pooled.add(i)
+    pooled.remove_first()
+    pooled.remove_at(1)
+    pooled.remove_last()
+    print(f"Pooled list after removals: {pooled}, Free nodes: {len(pooled.free_nodes)}")
+    assert len(pooled.free_nodes) == 3
+    pooled.add_first("a")
+    pooled.add("b")
+    print(f"Pooled list after reusing nodes: {pooled}")
+    assert list(pooled) == ["a", 1, 3, "b"]
+    assert pooled.tail.next is pooled.head
+
     print("CircularLinkedList tests completed successfully!\n")
 
 
@@ -1,4 +1,9 @@
+import random
+
+
 class Node:
+    __slots__ = ("data", "prev", "next")
+
     def __init__(self, data, prev=None, nxt=None):
         self.data = data
         self.prev = prev
@@ -9,57 +14,161 @@ class Node:
 
 
 class DoublyLinkedList:
-    def __init__(self):
+    def __init__(self, node_pool_size=0):
         self.head = None
         self.tail = None
         self.size = 0
+        # Up to node_pool_size removed nodes are kept for reuse by later adds.
+        self.node_pool_size = node_pool_size
+        self.free_nodes = []
+        # Last node reached by index and its position, so index loops can
+        # step from it instead of walking from an end.
+        self.finger = None
+        self.finger_index = 0
 
     def is_empty(self):
         return self.size == 0
 
+    def _new_node(self, data, prev=None, nxt=None):
+        if self.free_nodes:
+            node = self.free_nodes.pop()
+            node.data = data
+            node.prev = prev
+            node.next = nxt
+            return node
+        return Node(data, prev, nxt)
+
+    def _recycle(self, node):
+        if len(self.free_nodes) < self.node_pool_size:
+            node.data = node.prev = node.next = None
+            self.free_nodes.append(node)
+
+    # add_first, add_last, add, insert_before and insert_after return the
+    # new node as a handle for the O(1) node operations below. A handle is
+    # only valid until its element is removed; with node pooling the node
+    # object may then be reused for another element.
     def add_first(self, elem):
-        node = Node(elem, None, self.head)
+        node = self._new_node(elem, None, self.head)
         if self.is_empty():
             self.tail = node
         else:
             self.head.prev = node
         self.head = node
         self.size += 1
+        if self.finger is not None:
+            self.finger_index += 1
+        return node
 
     def add_last(self, elem):
-        node = Node(elem, self.tail, None)
+        node = self._new_node(elem, self.tail, None)
         if self.is_empty():
             self.head = node
         else:
             self.tail.next = node
         self.tail = node
         self.size += 1
+        return node
 
     def add(self, elem):
-        self.add_last(elem)
+        return self.add_last(elem)
+
+    def _unlink(self, node):
+        if node.prev is None:
+            self.head = node.next
+        else:
+            node.prev.next = node.next
+        if node.next is None:
+            self.tail = node.prev
+        else:
+            node.next.prev = node.prev
+        node.prev = node.next = None
+
+    def _link_before(self, node, successor):
+        node.prev = successor.prev
+        node.next = successor
+        if successor.prev is None:
+            self.head = node
+        else:
+            successor.prev.next = node
+        successor.prev = node
+
+    def _link_after(self, node, predecessor):
+        node.prev = predecessor
+        node.next = predecessor.next
+        if predecessor.next is None:
+            self.tail = node
+        else:
+            predecessor.next.prev = node
+        predecessor.next = node
+
+    def remove_node(self, node):
+        self.finger = None
+        self._unlink(node)
+        self.size -= 1
+        data = node.data
+        self._recycle(node)
+        return data
+
+    def move_to_front(self, node):
+        if node is self.head:
+            return
+        self.finger = None
+        self._unlink(node)
+        self._link_before(node, self.head)
+
+    def move_to_back(self, node):
+        if node is self.tail:
+            return
+        self.finger = None
+        self._unlink(node)
+        self._link_after(node, self.tail)
+
+    def insert_before(self, node, elem):
+        self.finger = None
+        new_node = self._new_node(elem)
+        self._link_before(new_node, node)
+        self.size += 1
+        return new_node
+
+    def insert_after(self, node, elem):
+        self.finger = None
+        new_node = self._new_node(elem)
+        self._link_after(new_node, node)
+        self.size += 1
+        return new_node
 
     def remove_first(self):
         if self.is_empty():
             raise RuntimeError("Empty list")
-        data = self.head.data
-        self.head = self.head.next
+        node = self.head
+        data = node.data
+        if self.finger is node:
+            self.finger = None
+        else:
+            self.finger_index -= 1
+        self.head = node.next
         self.size -= 1
         if self.is_empty():
             self.tail = None
         else:
             self.head.prev = None
+        self._recycle(node)
         return data
 
     def remove_last(self):
         if self.is_empty():
             raise RuntimeError("Empty list")
-        data = self.tail.data
-        self.tail = self.tail.prev
+        node = self.tail
+        data = node.data
+        if self.finger is node:
+            self.finger = None
+        self.tail = node.prev
         self.size -= 1
         if self.is_empty():
             self.head = None
         else:
             self.tail.next = None
+        self._recycle(node)
         return data
 
     def peek_first(self):
@@ -86,6 +195,43 @@ class DoublyLinkedList:
             index += 1
         return -1
 
+    def _node_at(self, index):
+        # Walk from whichever of head, tail or the finger is nearest.
+        if index < 0 or index >= self.size:
+            raise IndexError("Index out of bounds")
+        trav, pos = self.head, 0
+        if self.size - 1 - index < index:
+            trav, pos = self.tail, self.size - 1
+        if self.finger is not None and abs(self.finger_index - index) < abs(pos - index):
+            trav, pos = self.finger, self.finger_index
+        while pos < index:
+            trav = trav.next
+            pos += 1
+        while pos > index:
+            trav = trav.prev
+            pos -= 1
+        self.finger = trav
+        self.finger_index = index
+        return trav
+
+    def get(self, index):
+        return self._node_at(index).data
+
+    def set(self, index, elem):
+        self._node_at(index).data = elem
+
+    def insert_at(self, index, elem):
+        if index < 0 or index > self.size:
+            raise IndexError("Index out of bounds")
+        if index == self.size:
+            return self.add_last(elem)
+        successor = self._node_at(index)
+        node = self._new_node(elem)
+        self._link_before(node, successor)
+        self.size += 1
+        self.finger = node
+        return node
+
     def remove_at(self, index):
         if index < 0 or index >= self.size:
             raise IndexError("Index out of bounds")
@@ -93,17 +239,19 @@ class DoublyLinkedList:
             return self.remove_first()
         if index == self.size - 1:
             return self.remove_last()
-        trav = self.head
-        for _ in range(index):
-            trav = trav.next
+        trav = self._node_at(index)
+        self.finger = trav.next
         trav.prev.next = trav.next
         trav.next.prev = trav.prev
         self.size -= 1
-        return trav.data
+        data = trav.data
+        self._recycle(trav)
+        return data
 
     def reverse(self):
         if self.is_empty() or self.size == 1:
             return
+        self.finger = None
         self.head, self.tail = self.tail, self.head
         trav = self.head
         while trav:
@@ -114,6 +262,7 @@ class DoublyLinkedList:
         self.head = None
         self.tail = None
         self.size = 0
+        self.finger = None
 
     def __len__(self):
         return self.size
@@ -215,6 +364,95 @@ def test_doubly_linked_list():
     print(f"Removed from single element list: {removed}")
     print(f"List after removal: {dll}")
 
+    pooled = DoublyLinkedList(node_pool_size=8)
+    for i in range(5):
+        pooled.add(i)
+    pooled.remove_first()
+    pooled.remove_at(1)
+    pooled.remove_last()
+    print(f"Pooled list after removals: {pooled}, Free nodes: {len(pooled.free_nodes)}")
+    assert len(pooled.free_nodes) == 3
+    pooled.add_first("a")
+    pooled.add_last("b")
+    print(f"Pooled list after reusing nodes: {pooled}, Backward: {list(pooled.reverse_iter())}")
+    assert list(pooled) == ["a", 1, 3, "b"]
+    assert list(pooled.reverse_iter()) == ["b", 3, 1, "a"]
+
+    print("Testing node handles...")
+    dll = DoublyLinkedList()
+    a = dll.add("a")
+    b = dll.add_last("b")
+    c = dll.add_last("c")
+    print(f"List: {dll}, handle b holds: {b}")
+
+    dll.move_to_front(c)
+    print(f"After move_to_front(c): {dll}")
+    assert list(dll) == ["c", "a", "b"]
+    dll.move_to_back(c)
+    dll.move_to_back(c)
+    print(f"After move_to_back(c): {dll}")
+    assert list(dll) == ["a", "b", "c"]
+
+    x = dll.insert_after(a, "x")
+    dll.insert_before(a, "w")
+    dll.insert_after(c, "z")
+    print(f"After insert_after(a, 'x'), insert_before(a, 'w'), insert_after(c, 'z'): {dll}")
+    assert list(dll) == ["w", "a", "x", "b", "c", "z"]
+
+    removed = dll.remove_node(x)
+    print(f"remove_node(x): {removed}, List: {dll}, Size: {len(dll)}")
+    dll.remove_node(dll.head)
+    dll.remove_node(dll.tail)
+    print(f"After removing head and tail nodes: {dll}, Backward: {list(dll.reverse_iter())}")
+    assert list(dll) == ["a", "b", "c"]
+    assert list(dll.reverse_iter()) == ["c", "b", "a"]
+    for handle in (a, b, c):
+        dll.remove_node(handle)
+    assert dll.is_empty() and dll.head is None and dll.tail is None
+
+    print("Testing positional access...")
+    dll = DoublyLinkedList()
+    for i in range(10):
+        dll.add(i)
+    print(f"get(0): {dll.get(0)}, get(9): {dll.get(9)}, get(4): {dll.get(4)}, finger at: {dll.finger_index}")
+    dll.set(5, 50)
+    dll.insert_at(3, "x")
+    dll.insert_at(0, "first")
+    dll.insert_at(len(dll), "last")
+    print(f"After set(5, 50) and inserts: {dll}")
+    assert list(dll) == ["first", 0, 1, 2, "x", 3, 4, 50, 6, 7, 8, 9, "last"]
+    print(f"remove_at(7): {dll.remove_at(7)}, get(7): {dll.get(7)}")
+
+    random.seed(3)
+    expected = list(dll)
+    for step in range(2000):
+        op = random.random()
+        if op < 0.3 or not expected:
+            index = random.randint(0, len(expected))
+            dll.insert_at(index, step)
+            expected.insert(index, step)
+        elif op < 0.5:
+            index = random.randrange(len(expected))
+            assert dll.remove_at(index) == expected.pop(index)
+        elif op < 0.6:
+            dll.add_first(step)
+            expected.insert(0, step)
+        elif op < 0.7:
+            assert dll.remove_first() == expected.pop(0)
+        elif op < 0.75:
+            assert dll.remove_last() == expected.pop()
+        else:
+            index = random.randrange(len(expected))
+            assert dll.get(index) == expected[index]
+    assert list(dll) == expected
+    assert [dll.get(i) for i in range(len(dll))] == expected
+    print(f"2000 random positional edits match a Python list (size {len(dll)})")
+
+    try:
+        dll.get(len(dll))
+    except IndexError as e:
+        print(f"Expected error with invalid index: {e}")
+
     print("DoublyLinkedList tests completed successfully!\n")
 
 
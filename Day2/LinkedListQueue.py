@@ -1,4 +1,6 @@
 class Node:
+    __slots__ = ("data", "next")
+
     def __init__(self, data):
         self.data = data
         self.next = None
@@ -8,16 +10,23 @@ class Node:
 
 
 class LinkedListQueue:
-    def __init__(self):
+    def __init__(self, node_pool_size=0):
         self.front = None
         self.rear = None
         self.size = 0
+        # Up to node_pool_size polled nodes are kept for reuse by later offers.
+        self.node_pool_size = node_pool_size
+        self.free_nodes = []
 
     def is_empty(self):
         return self.size == 0
 
     def offer(self, elem):
-        node = Node(elem)
+        if self.free_nodes:
+            node = self.free_nodes.pop()
+            node.data = elem
+        else:
+            node = Node(elem)
         if self.is_empty():
             self.front = self.rear = node
         else:
@@ -31,11 +40,16 @@ class LinkedListQueue:
     def poll(self):
         if self.is_empty():
             raise IndexError("Queue is empty")
-        data = self.front.data
-        self.front = self.front.next
+        node = self.front
+        data = node.data
+        self.front = node.next
         self.size -= 1
         if self.is_empty():
             self.rear = None
+        if len(self.free_nodes) < self.node_pool_size:
+            node.data = None
+            node.next = None
+            self.free_nodes.append(node)
         return data
 
     def dequeue(self):
@@ -168,6 +182,20 @@ def test_linked_list_queue():
     print(f"Queue after polling single element: {queue}")
 
     queue.clear()
+
+    pooled = LinkedListQueue(node_pool_size=2)
+    for i in range(4):
+        pooled.offer(i)
+    for _ in range(3):
+        pooled.poll()
+    print(f"Pooled queue after 3 polls: {pooled}, Free nodes: {len(pooled.free_nodes)}")
+    assert len(pooled.free_nodes) == 2
+    pooled.offer(4)
+    pooled.offer(5)
+    pooled.offer(6)
+    print(f"Pooled queue after reusing nodes: {pooled}")
+    assert pooled.to_list() == [3, 4, 5, 6]
+
     print("LinkedListQueue tests completed successfully!\n")
 
 
@@ -0,0 +1,232 @@
+import random
+import time
+
+from Day2.CircularLinkedList import CircularLinkedList
+
+
+class Tenant:
+    __slots__ = ("key", "weight", "credit", "active")
+
+    def __init__(self, key, weight):
+        self.key = key
+        self.weight = weight
+        self.credit = weight
+        self.active = True
+
+    def __str__(self):
+        return f"{self.key}x{self.weight}"
+
+
+class RoundRobinScheduler:
+    def __init__(self):
+        # The ring holds Tenant entries with the current one at its head; the
+        # dict maps each key to its live entry so leaving is O(1).
+        self.ring = CircularLinkedList()
+        self.tenants = {}
+        self.removed = 0
+
+    def is_empty(self):
+        return not self.tenants
+
+    def __len__(self):
+        return len(self.tenants)
+
+    def __contains__(self, key):
+        return key in self.tenants
+
+    def __iter__(self):
+        for tenant in self.ring:
+            if tenant.active:
+                yield tenant.key
+
+    def __str__(self):
+        if self.is_empty():
+            return "[]"
+        return "[ " + ", ".join(str(tenant) for tenant in self.ring if tenant.active) + " ]"
+
+    def add(self, key, weight=1):
+        if weight < 1:
+            raise ValueError("Weight must be at least 1")
+        if key in self.tenants:
+            raise ValueError(f"{key!r} is already scheduled")
+        tenant = Tenant(key, weight)
+        self.tenants[key] = tenant
+        # Joining at the tail puts the new tenant last in the current round.
+        self.ring.add(tenant)
+
+    def remove(self, key):
+        # A singly linked ring cannot unlink an arbitrary node in O(1), so the
+        # entry is marked and dropped when it next reaches the head.
+        if key not in self.tenants:
+            raise KeyError(key)
+        self.tenants.pop(key).active = False
+        self.removed += 1
+        if self.removed > len(self.tenants):
+            self._compact()
+
+    def set_weight(self, key, weight):
+        if weight < 1:
+            raise ValueError("Weight must be at least 1")
+        if key not in self.tenants:
+            raise KeyError(key)
+        tenant = self.tenants[key]
+        # Shift the remaining turns this round by the change in weight.
+        tenant.credit = max(tenant.credit + weight - tenant.weight, 1)
+        tenant.weight = weight
+
+    def _compact(self):
+        # Rebuild the ring without removed entries once they outnumber the
+        # live ones, so churn cannot grow it without bound.
+        ring = CircularLinkedList()
+        for tenant in self.ring:
+            if tenant.active:
+                ring.add(tenant)
+        self.ring = ring
+        self.removed = 0
+
+    def _skip_removed(self):
+        while not self.ring.is_empty() and not self.ring.head.data.active:
+            self.ring.remove_first()
+            self.removed -= 1
+        if self.ring.is_empty():
+            raise RuntimeError("No tenants scheduled")
+
+    def current(self):
+        self._skip_removed()
+        return self.ring.head.data.key
+
+    def next(self):
+        # Weighted round-robin: a tenant of weight w is returned w times in a
+        # row before the ring advances to the next tenant.
+        self._skip_removed()
+        tenant = self.ring.head.data
+        tenant.credit -= 1
+        if tenant.credit == 0:
+            tenant.credit = tenant.weight
+            self.ring.next()
+        return tenant.key
+
+    def remove_current(self):
+        self._skip_removed()
+        tenant = self.ring.remove_current()
+        del self.tenants[tenant.key]
+        return tenant.key
+
+    def rotate(self, steps=1):
+        # Skips whole tenants; removed entries are compacted away first so
+        # steps count live tenants only.
+        if self.removed:
+            self._compact()
+        if not self.ring.is_empty():
+            self.ring.head.data.credit = self.ring.head.data.weight
+        self.ring.rotate(steps)
+
+
+# Test Functions
+def test_round_robin_scheduler():
+    print("Testing RoundRobinScheduler...")
+
+    rr = RoundRobinScheduler()
+    print(f"Empty scheduler: {rr}, Is empty: {rr.is_empty()}")
+
+    rr.add("a")
+    rr.add("b", weight=2)
+    rr.add("c")
+    print(f"After adding a, b (weight 2), c: {rr}, Size: {len(rr)}")
+
+    order = [rr.next() for _ in range(8)]
+    print(f"next() x8: {order}")
+    assert order == ["a", "b", "b", "c", "a", "b", "b", "c"]
+
+    rr.remove("b")
+    print(f"After removing b: {rr}, Contains b: {'b' in rr}")
+    order = [rr.next() for _ in range(4)]
+    print(f"next() x4: {order}")
+    assert order == ["a", "c", "a", "c"]
+
+    rr.add("d", weight=3)
+    rr.add("b")
+    print(f"After adding d (weight 3) and b again: {rr}")
+    print(f"Current: {rr.current()}, Removed current: {rr.remove_current()}, Scheduler: {rr}")
+    assert list(rr) == ["c", "d", "b"]
+
+    rr.rotate(-1)
+    print(f"After rotate(-1): {rr}, Current: {rr.current()}")
+    assert rr.current() == "b"
+    rr.set_weight("b", 2)
+    assert [rr.next() for _ in range(6)] == ["b", "b", "c", "d", "d", "d"]
+
+    # Random churn against a simple list model
+    random.seed(3)
+    rr = RoundRobinScheduler()
+    model = []
+    for step in range(5000):
+        op = random.random()
+        if op < 0.3 or not model:
+            rr.add(step)
+            model.append(step)
+        elif op < 0.5:
+            key = random.choice(model)
+            rr.remove(key)
+            model.remove(key)
+        elif op < 0.55:
+            assert rr.remove_current() == model.pop(0)
+        else:
+            assert rr.next() == model[0]
+            model.append(model.pop(0))
+    assert list(rr) == model and len(rr.ring) <= 2 * len(model) + 1
+    print(f"5000 random joins, leaves and dispatches match a list model ({len(rr)} tenants)")
+
+    for key in list(rr):
+        rr.remove(key)
+    try:
+        rr.next()
+    except RuntimeError as e:
+        print(f"Expected error: {e}")
+
+    try:
+        rr.remove("missing")
+    except KeyError as e:
+        print(f"Expected error: {e}")
+
+    try:
+        rr.add("x", weight=0)
+    except ValueError as e:
+        print(f"Expected error: {e}")
+
+    print("RoundRobinScheduler tests completed successfully!\n")
+
+
+def benchmark_round_robin_scheduler(tenants=5_000, ops=20_000):
+    print(f"Benchmarking {ops} leave/join/dispatch rounds over {tenants} tenants...")
+    random.seed(5)
+    leaving = [random.randrange(tenants) for _ in range(ops)]
+
+    ring = CircularLinkedList()
+    for key in range(tenants):
+        ring.add(key)
+    start = time.perf_counter()
+    for key in leaving:
+        ring.remove_at(ring.index_of(key))
+        ring.add(key)
+        ring.next()
+    elapsed = time.perf_counter() - start
+    print(f"  CircularLinkedList remove_at(index_of): {elapsed * 1e6 / ops:.1f} us/round")
+
+    rr = RoundRobinScheduler()
+    for key in range(tenants):
+        rr.add(key)
+    start = time.perf_counter()
+    for key in leaving:
+        rr.remove(key)
+        rr.add(key)
+        rr.next()
+    elapsed = time.perf_counter() - start
+    print(f"  RoundRobinScheduler: {elapsed * 1e6 / ops:.1f} us/round")
+    print()
+
+
+# Run tests when file is executed directly
+if __name__ == "__main__":
+    test_round_robin_scheduler()
+    benchmark_round_robin_scheduler()
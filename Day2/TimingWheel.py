@@ -0,0 +1,203 @@
+import random
+
+from Day2.CircularLinkedList import CircularLinkedList
+
+
+class Timer:
+    __slots__ = ("deadline", "callback", "args", "cancelled")
+
+    def __init__(self, deadline, callback, args):
+        self.deadline = deadline
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def __str__(self):
+        return f"Timer(deadline={self.deadline})"
+
+
+class TimingWheel:
+    def __init__(self, wheel_size=256, levels=4):
+        if wheel_size < 2 or levels < 1:
+            raise ValueError("Wheel size must be at least 2 and levels at least 1")
+        # Level L has wheel_size slots of wheel_size ** L ticks each; every
+        # slot is a CircularLinkedList of timers.
+        self.wheel_size = wheel_size
+        self.levels = levels
+        self.spans = [wheel_size ** level for level in range(levels + 1)]
+        self.wheels = [[CircularLinkedList() for _ in range(wheel_size)] for _ in range(levels)]
+        self.current_tick = 0
+        self.size = 0
+
+    def is_empty(self):
+        return self.size == 0
+
+    def __len__(self):
+        return self.size
+
+    def _place(self, timer):
+        remaining = timer.deadline - self.current_tick
+        level = 0
+        while level < self.levels - 1 and remaining >= self.spans[level + 1]:
+            level += 1
+        # Timers beyond the top level's range park in the top level and are
+        # re-placed each time their slot cascades.
+        slot = (timer.deadline // self.spans[level]) % self.wheel_size
+        self.wheels[level][slot].add(timer)
+
+    def schedule(self, delay, callback, *args):
+        if delay < 1:
+            raise ValueError("Delay must be at least one tick")
+        timer = Timer(self.current_tick + delay, callback, args)
+        self._place(timer)
+        self.size += 1
+        return timer
+
+    def cancel(self, timer):
+        # Cancelled timers stay in their slot and are dropped when it is
+        # next processed, which keeps cancel O(1). Their callback and args
+        # are released now so a parked timer does not keep them alive until
+        # then. Fired timers have their callback cleared.
+        if timer.cancelled or timer.callback is None:
+            return False
+        timer.cancelled = True
+        timer.callback = None
+        timer.args = ()
+        self.size -= 1
+        return True
+
+    def _cascade(self, level):
+        slot = self.wheels[level][(self.current_tick // self.spans[level]) % self.wheel_size]
+        # Only drain the timers present now: one still out of range can be
+        # re-placed into this same slot.
+        for _ in range(len(slot)):
+            timer = slot.remove_first()
+            if not timer.cancelled:
+                self._place(timer)
+
+    def _tick(self):
+        self.current_tick += 1
+        # Cascade higher levels first so their timers can cascade again
+        # into a lower level slot that falls due on the same tick.
+        for level in range(self.levels - 1, 0, -1):
+            if self.current_tick % self.spans[level] == 0:
+                self._cascade(level)
+        fired = 0
+        error = None
+        slot = self.wheels[0][self.current_tick % self.wheel_size]
+        for _ in range(len(slot)):
+            timer = slot.remove_first()
+            if timer.cancelled:
+                continue
+            if timer.deadline > self.current_tick:
+                self._place(timer)
+                continue
+            callback = timer.callback
+            timer.callback = None
+            self.size -= 1
+            fired += 1
+            try:
+                callback(*timer.args)
+            except Exception as e:
+                if error is None:
+                    error = e
+        return fired, error
+
+    def advance(self, ticks=1):
+        if ticks < 0:
+            raise ValueError("Cannot advance by a negative number of ticks")
+        # A failing callback must not strand the timers after it, so every
+        # requested tick is processed and the first error is re-raised at
+        # the end.
+        fired = 0
+        first_error = None
+        for _ in range(ticks):
+            count, error = self._tick()
+            fired += count
+            if first_error is None:
+                first_error = error
+        if first_error is not None:
+            raise first_error
+        return fired
+
+
+# Test Functions
+def test_timing_wheel():
+    print("Testing TimingWheel...")
+
+    wheel = TimingWheel(wheel_size=4, levels=3)
+    fired = []
+    print(f"Empty wheel: size {len(wheel)}, Is empty: {wheel.is_empty()}")
+
+    # Schedule across all levels, including beyond the 64-tick range
+    for delay in (1, 3, 4, 5, 16, 17, 63, 64, 100, 250):
+        wheel.schedule(delay, lambda d=delay: fired.append((d, wheel.current_tick)))
+    cancelled = wheel.schedule(10, fired.append, "cancelled")
+    print(f"Scheduled 11 timers, size: {len(wheel)}")
+    print(f"Cancel pending timer: {wheel.cancel(cancelled)}, cancel again: {wheel.cancel(cancelled)}")
+    assert cancelled.callback is None and cancelled.args == ()
+
+    count = wheel.advance(5)
+    print(f"Fired after 5 ticks: {count}, {fired}")
+    wheel.advance(300)
+    print(f"Fired after 305 ticks: {fired}")
+    assert all(delay == tick for delay, tick in fired)
+    assert [delay for delay, _ in fired] == [1, 3, 4, 5, 16, 17, 63, 64, 100, 250]
+    assert wheel.is_empty()
+
+    # Callback arguments and timers scheduled mid-run
+    results = []
+    wheel.schedule(2, results.append, "a")
+    wheel.advance(1)
+    handle = wheel.schedule(2, results.append, "b")
+    wheel.advance(2)
+    print(f"Callback results: {results}, Cancel fired timer: {wheel.cancel(handle)}")
+    assert results == ["a", "b"]
+
+    # Randomized check against expected deadlines
+    random.seed(11)
+    wheel = TimingWheel(wheel_size=8, levels=3)
+    fired = []
+    expected = {}
+    for i in range(500):
+        delay = random.randint(1, 1000)
+        timer = wheel.schedule(delay, lambda i=i: fired.append((i, wheel.current_tick)))
+        expected[i] = (timer, wheel.current_tick + delay)
+        if i % 7 == 0:
+            wheel.cancel(timer)
+            del expected[i]
+        wheel.advance(random.randint(0, 3))
+    wheel.advance(1200)
+    assert sorted(fired) == sorted((i, deadline) for i, (_, deadline) in expected.items())
+    print(f"500 random timers fired exactly at their deadlines ({len(fired)} fired, rest cancelled)")
+
+    # A raising callback still lets the rest of its slot and the remaining
+    # requested ticks run on time
+    wheel = TimingWheel(wheel_size=4)
+    fired = []
+    wheel.schedule(2, fired.append, "before")
+    wheel.schedule(2, lambda: 1 / 0)
+    wheel.schedule(2, fired.append, "after")
+    wheel.schedule(5, fired.append, "later")
+    try:
+        wheel.advance(6)
+    except ZeroDivisionError as e:
+        print(f"Expected error from callback: {e}, other timers fired: {fired}, tick: {wheel.current_tick}")
+    assert fired == ["before", "after", "later"] and wheel.is_empty() and wheel.current_tick == 6
+
+    try:
+        wheel.schedule(0, print)
+    except ValueError as e:
+        print(f"Expected error: {e}")
+
+    try:
+        TimingWheel(wheel_size=1)
+    except ValueError as e:
+        print(f"Expected error: {e}")
+
+    print("TimingWheel tests completed successfully!\n")
+
+
+# Run tests when file is executed directly
+if __name__ == "__main__":
+    test_timing_wheel()
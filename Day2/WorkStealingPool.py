@@ -0,0 +1,311 @@
+import itertools
+import os
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+
+from Day2.DoublyLinkedList import DoublyLinkedList
+from Day3.BinaryTree import BinaryTree, Node
+
+
+class WorkerDeque:
+    def __init__(self):
+        # The owning worker pushes and pops at the back (newest first, which
+        # keeps its working set hot); thieves take from the front, where the
+        # oldest and usually largest tasks are.
+        self.tasks = DoublyLinkedList()
+        self.lock = threading.Lock()
+        # Steals made by the owning worker; only that thread writes it.
+        self.steals = 0
+
+    def is_empty(self):
+        return self.tasks.is_empty()
+
+    def __len__(self):
+        return len(self.tasks)
+
+    def push(self, task):
+        with self.lock:
+            self.tasks.add_last(task)
+
+    def pop(self):
+        with self.lock:
+            if self.tasks.is_empty():
+                return None
+            return self.tasks.remove_last()
+
+    def steal_many(self, limit):
+        # Takes up to half the deque (at most limit tasks) from the front.
+        with self.lock:
+            count = min(limit, (len(self.tasks) + 1) // 2)
+            return [self.tasks.remove_first() for _ in range(count)]
+
+
+class WorkStealingPool:
+    def __init__(self, workers=None, steal_batch=16):
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError("Worker count must be positive")
+        if steal_batch < 1:
+            raise ValueError("Steal batch must be positive")
+        self.steal_batch = steal_batch
+        self.deques = [WorkerDeque() for _ in range(workers)]
+        self.local = threading.local()
+        # next() on a count is atomic, so concurrent submits still spread
+        # across the deques.
+        self.next_deque = itertools.count()
+        # Idle workers sleep on the condition; submit only takes its lock
+        # when some worker is idle.
+        self.work_available = threading.Condition()
+        self.idle_workers = 0
+        self.shutting_down = False
+        self.threads = [
+            threading.Thread(target=self._worker, args=(index,), daemon=True)
+            for index in range(workers)
+        ]
+        for thread in self.threads:
+            thread.start()
+
+    def submit(self, fn, *args):
+        if self.shutting_down:
+            raise RuntimeError("Pool is shut down")
+        future = Future()
+        index = getattr(self.local, "index", None)
+        if index is None:
+            # Submissions from outside the pool are spread round-robin;
+            # tasks spawned by a worker stay on its own deque.
+            index = next(self.next_deque) % len(self.deques)
+        self.deques[index].push((future, fn, args))
+        if self.idle_workers:
+            with self.work_available:
+                self.work_available.notify()
+        return future
+
+    def map(self, fn, *iterables):
+        futures = [self.submit(fn, *args) for args in zip(*iterables)]
+
+        def results():
+            for future in futures:
+                yield self.wait_for(future)
+
+        return results()
+
+    def wait_for(self, future):
+        # A worker waiting on a subtask keeps running tasks instead of
+        # blocking, so recursive fork/join cannot deadlock the pool.
+        index = getattr(self.local, "index", None)
+        if index is None:
+            return future.result()
+        while not future.done():
+            task = self.deques[index].pop() or self._steal(index)
+            if task is None:
+                wait_futures([future], timeout=0.001)
+            else:
+                self._run(task)
+        return future.result()
+
+    @property
+    def steals(self):
+        return sum(deque.steals for deque in self.deques)
+
+    def _steal(self, index):
+        count = len(self.deques)
+        for offset in range(1, count):
+            victim = self.deques[(index + offset) % count]
+            if victim.is_empty():
+                continue
+            stolen = victim.steal_many(self.steal_batch)
+            if stolen:
+                own = self.deques[index]
+                own.steals += 1
+                for task in stolen[1:]:
+                    own.push(task)
+                return stolen[0]
+        return None
+
+    def _has_work(self):
+        return any(not deque.is_empty() for deque in self.deques)
+
+    def _run(self, task):
+        future, fn, args = task
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result = fn(*args)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+
+    def _worker(self, index):
+        self.local.index = index
+        own = self.deques[index]
+        while True:
+            task = own.pop() or self._steal(index)
+            if task is not None:
+                self._run(task)
+                continue
+            with self.work_available:
+                # Registering as idle before re-checking means a submit that
+                # misses this check will see idle_workers and notify.
+                self.idle_workers += 1
+                try:
+                    while not self._has_work():
+                        if self.shutting_down:
+                            return
+                        self.work_available.wait()
+                finally:
+                    self.idle_workers -= 1
+
+    def shutdown(self, wait=True):
+        with self.work_available:
+            self.shutting_down = True
+            self.work_available.notify_all()
+        if wait:
+            for thread in self.threads:
+                thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.shutdown()
+
+
+# Test Functions
+def _fib(pool, n):
+    if n < 2:
+        return n
+    left = pool.submit(_fib, pool, n - 1)
+    right = _fib(pool, n - 2)
+    return pool.wait_for(left) + right
+
+
+def _fail():
+    raise ValueError("task failed")
+
+
+def test_work_stealing_pool():
+    print("Testing WorkStealingPool...")
+
+    with WorkStealingPool(workers=4) as pool:
+        future = pool.submit(pow, 2, 10)
+        print(f"submit(pow, 2, 10): {future.result(timeout=10)}")
+        assert future.result() == 1024
+
+        squares = list(pool.map(lambda x: x * x, range(10)))
+        print(f"map(square, 0..9): {squares}")
+        assert squares == [x * x for x in range(10)]
+        assert list(pool.map(pow, [2, 3], [3, 2])) == [8, 9]
+
+        result = pool.submit(_fib, pool, 18).result(timeout=60)
+        print(f"Recursive fork/join fib(18): {result}, steals so far: {pool.steals}")
+        assert result == 2584
+
+        try:
+            pool.submit(_fail).result(timeout=10)
+        except ValueError as e:
+            print(f"Expected error from task: {e}")
+
+    try:
+        pool.submit(print)
+    except RuntimeError as e:
+        print(f"Expected error after shutdown: {e}")
+
+    local_deque = WorkerDeque()
+    for i in range(5):
+        local_deque.push(i)
+    print(f"Local pop takes newest: {local_deque.pop()}, steal takes oldest half: {local_deque.steal_many(16)}")
+    assert list(local_deque.tasks) == [2, 3]
+
+    try:
+        WorkStealingPool(workers=0)
+    except ValueError as e:
+        print(f"Expected error: {e}")
+
+    print("WorkStealingPool tests completed successfully!\n")
+
+
+def _random_tree(n, seed=8):
+    # Random insertion order gives an irregular, unbalanced tree.
+    random.seed(seed)
+    bt = BinaryTree()
+    for value in random.sample(range(n * 10), n):
+        node = Node(value)
+        if bt.root is None:
+            bt.root = node
+            continue
+        trav = bt.root
+        while True:
+            if value < trav.value:
+                if trav.left is None:
+                    trav.left = node
+                    break
+                trav = trav.left
+            else:
+                if trav.right is None:
+                    trav.right = node
+                    break
+                trav = trav.right
+    return bt
+
+
+def _subtree_sum(node):
+    total = 0
+    stack = [node] if node else []
+    while stack:
+        node = stack.pop()
+        total += node.value
+        if node.left:
+            stack.append(node.left)
+        if node.right:
+            stack.append(node.right)
+    return total
+
+
+def _forked_sum(pool, node, depth):
+    if node is None:
+        return 0
+    if depth == 0:
+        return _subtree_sum(node)
+    left = pool.submit(_forked_sum, pool, node.left, depth - 1)
+    right = _forked_sum(pool, node.right, depth - 1)
+    return node.value + pool.wait_for(left) + right
+
+
+def benchmark_work_stealing_pool(n=200_000, split_depth=8, workers=4):
+    print(f"Benchmarking subtree sums over a random {n}-node BinaryTree, {workers} workers...")
+    bt = _random_tree(n)
+
+    start = time.perf_counter()
+    expected = _subtree_sum(bt.root)
+    print(f"  sequential: {(time.perf_counter() - start) * 1e3:.1f} ms")
+
+    # A central FIFO executor cannot block on subtasks from inside a task
+    # without risking deadlock, so it gets a static split at split_depth.
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        start = time.perf_counter()
+        frontier, top = [bt.root], 0
+        for _ in range(split_depth):
+            top += sum(node.value for node in frontier)
+            frontier = [child for node in frontier for child in (node.left, node.right) if child]
+        total = top + sum(f.result() for f in [executor.submit(_subtree_sum, node) for node in frontier])
+        print(f"  ThreadPoolExecutor (static split): {(time.perf_counter() - start) * 1e3:.1f} ms")
+        assert total == expected
+
+    with WorkStealingPool(workers=workers) as pool:
+        start = time.perf_counter()
+        total = pool.submit(_forked_sum, pool, bt.root, split_depth).result()
+        elapsed = time.perf_counter() - start
+        print(f"  WorkStealingPool (fork/join): {elapsed * 1e3:.1f} ms, {pool.steals} steals")
+        assert total == expected
+    print()
+
+
+# Run tests when file is executed directly
+if __name__ == "__main__":
+    test_work_stealing_pool()
+    benchmark_work_stealing_pool()
@@ -1,8 +1,11 @@
 import unittest
-from typing import Optional, List, Any
+from collections import deque
+from typing import Optional, List, Any, Iterator
 
 
 class Node:
+    __slots__ = ("value", "left", "right")
+
     def __init__(self, value: Any):
         self.value = value
         self.left: Optional['Node'] = None
@@ -20,25 +23,32 @@ class BinaryTree:
         return self.root is None
 
     def height(self, node: Optional[Node] = None) -> int:
-
-         if node is None:
-          node = self.root
-          if node is None:  # empty tree
-            return -1
-         if node.left is None and node.right is None:
-          return 0
-         return 1 + max(
-           self.height(node.left) if node.left else -1,
-           self.height(node.right) if node.right else -1
-    )
+        if node is None:
+            node = self.root
+        height = -1
+        stack = [(node, 0)] if node else []
+        while stack:
+            node, depth = stack.pop()
+            height = max(height, depth)
+            if node.left:
+                stack.append((node.left, depth + 1))
+            if node.right:
+                stack.append((node.right, depth + 1))
+        return height
 
     def size(self, node: Optional[Node] = None) -> int:
-     if node is None:
-        node = self.root
-        if node is None:  # empty tree
-            return 0
-     return 1 + (self.size(node.left) if node.left else 0) + (self.size(node.right) if node.right else 0)
-
+        if node is None:
+            node = self.root
+        count = 0
+        stack = [node] if node else []
+        while stack:
+            node = stack.pop()
+            count += 1
+            if node.left:
+                stack.append(node.left)
+            if node.right:
+                stack.append(node.right)
+        return count
 
     def preorder_traversal(self, node: Optional[Node] = None) -> List[Any]:
         result = []
@@ -48,10 +58,7 @@ class BinaryTree:
         return result
 
     def _preorder(self, node: Optional[Node], result: List[Any]) -> None:
-        if node:
-            result.append(node.value)
-            self._preorder(node.left, result)
-            self._preorder(node.right, result)
+        result.extend(self.iter_preorder(node) if node else ())
 
     def inorder_traversal(self, node: Optional[Node] = None) -> List[Any]:
         result = []
@@ -61,10 +68,7 @@ class BinaryTree:
         return result
 
     def _inorder(self, node: Optional[Node], result: List[Any]) -> None:
-        if node:
-            self._inorder(node.left, result)
-            result.append(node.value)
-            self._inorder(node.right, result)
+        result.extend(self.iter_inorder(node) if node else ())
 
     def postorder_traversal(self, node: Optional[Node] = None) -> List[Any]:
         result = []
@@ -74,24 +78,63 @@ class BinaryTree:
         return result
 
     def _postorder(self, node: Optional[Node], result: List[Any]) -> None:
-        if node:
-            self._postorder(node.left, result)
-            self._postorder(node.right, result)
-            result.append(node.value)
+        result.extend(self.iter_postorder(node) if node else ())
 
     def level_order_traversal(self) -> List[Any]:
-        if not self.root:
-            return []
-        result = []
-        queue = [self.root]
+        return list(self.iter_level_order())
+
+    def iter_preorder(self, node: Optional[Node] = None) -> Iterator[Any]:
+        if node is None:
+            node = self.root
+        stack = [node] if node else []
+        while stack:
+            node = stack.pop()
+            yield node.value
+            if node.right:
+                stack.append(node.right)
+            if node.left:
+                stack.append(node.left)
+
+    def iter_inorder(self, node: Optional[Node] = None) -> Iterator[Any]:
+        if node is None:
+            node = self.root
+        stack = []
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.value
+            node = node.right
+
+    def iter_postorder(self, node: Optional[Node] = None) -> Iterator[Any]:
+        if node is None:
+            node = self.root
+        stack = []
+        last_visited = None
+        while stack or node:
+            if node:
+                stack.append(node)
+                node = node.left
+                continue
+            top = stack[-1]
+            if top.right and top.right is not last_visited:
+                node = top.right
+            else:
+                yield top.value
+                last_visited = stack.pop()
+
+    def iter_level_order(self, node: Optional[Node] = None) -> Iterator[Any]:
+        if node is None:
+            node = self.root
+        queue = deque([node] if node else [])
         while queue:
-            node = queue.pop(0)
-            result.append(node.value)
+            node = queue.popleft()
+            yield node.value
             if node.left:
                 queue.append(node.left)
             if node.right:
                 queue.append(node.right)
-        return result
 
 
 class TestBinaryTree(unittest.TestCase):
@@ -167,6 +210,33 @@ class TestBinaryTree(unittest.TestCase):
         self.assertEqual(bt.height(), 2)
         self.assertEqual(bt.size(), 5)
 
+    def test_deep_tree_iterative(self):
+        bt = BinaryTree(0)
+        node = bt.root
+        for i in range(1, 10000):
+            node.right = Node(i)
+            node = node.right
+
+        self.assertEqual(bt.height(), 9999)
+        self.assertEqual(bt.size(), 10000)
+        self.assertEqual(bt.inorder_traversal(), list(range(10000)))
+        self.assertEqual(bt.postorder_traversal(), list(range(9999, -1, -1)))
+        self.assertEqual(bt.level_order_traversal(), list(range(10000)))
+
+    def test_lazy_traversals(self):
+        bt = BinaryTree(1)
+        bt.root.left = Node(2)
+        bt.root.right = Node(3)
+        bt.root.left.left = Node(4)
+        bt.root.left.right = Node(5)
+
+        self.assertEqual(list(bt.iter_preorder()), [1, 2, 4, 5, 3])
+        self.assertEqual(list(bt.iter_inorder()), [4, 2, 5, 1, 3])
+        self.assertEqual(list(bt.iter_postorder(bt.root.left)), [4, 5, 2])
+        self.assertEqual(list(bt.iter_level_order()), [1, 2, 3, 4, 5])
+        self.assertEqual(next(bt.iter_inorder()), 4)
+        self.assertEqual(list(self.bt.iter_preorder()), [])
+
 
 def run_tests():
     print("Running Binary Tree Tests...")
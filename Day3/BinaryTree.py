@@ -1,9 +1,19 @@
+import io
+import pickle
+import struct
+import sys
+import time
+import tracemalloc
 import unittest
-from typing import Optional, List, Any
+from array import array
+from collections import deque
+from typing import Optional, List, Any, Iterator, BinaryIO
 
 
 class Node:
     """Node class for Binary Tree"""
+    __slots__ = ("value", "left", "right")
+
     def __init__(self, value: Any):
         self.value = value
         self.left: Optional['Node'] = None
@@ -19,7 +29,7 @@ class BinaryTree:
     - Height: O(n)
     - Size: O(n)
     
-    Space Complexity: O(n) for storage, O(h) for recursion stack
+    Space Complexity: O(n) for storage, O(h) for the explicit traversal stack
     """
     
     def __init__(self, root_value: Optional[Any] = None):
@@ -38,22 +48,35 @@ class BinaryTree:
         return self._height_helper(self.root)
     
     def _height_helper(self, node: Optional[Node]) -> int:
-        """Helper method to calculate height recursively"""
-        if node is None:
-            return -1
-        
-        return 1 + max(self._height_helper(node.left), self._height_helper(node.right))
+        """Helper method to calculate height with an explicit stack of (node, depth)"""
+        height = -1
+        stack = [(node, 0)] if node else []
+        while stack:
+            node, depth = stack.pop()
+            if depth > height:
+                height = depth
+            if node.left:
+                stack.append((node.left, depth + 1))
+            if node.right:
+                stack.append((node.right, depth + 1))
+        return height
     
     def size(self) -> int:
         """Count total number of nodes in tree"""
         return self._size_helper(self.root)
     
     def _size_helper(self, node: Optional[Node]) -> int:
-        """Helper method to count nodes recursively"""
-        if node is None:
-            return 0
-        
-        return 1 + self._size_helper(node.left) + self._size_helper(node.right)
+        """Helper method to count nodes with an explicit stack"""
+        count = 0
+        stack = [node] if node else []
+        while stack:
+            node = stack.pop()
+            count += 1
+            if node.left:
+                stack.append(node.left)
+            if node.right:
+                stack.append(node.right)
+        return count
     
     def preorder_traversal(self) -> List[Any]:
         """Preorder traversal: Root -> Left -> Right"""
@@ -63,10 +86,7 @@ class BinaryTree:
     
     def preorder(self, node: Optional[Node], result: List[Any]) -> None:
         """Helper method for preorder traversal"""
-        if node:
-            result.append(node.value)
-            self.preorder(node.left, result)
-            self.preorder(node.right, result)
+        result.extend(self._preorder_values(node))
     
     def inorder_traversal(self) -> List[Any]:
         """Inorder traversal: Left -> Root -> Right"""
@@ -76,10 +96,7 @@ class BinaryTree:
     
     def inorder(self, node: Optional[Node], result: List[Any]) -> None:
         """Helper method for inorder traversal"""
-        if node:
-            self.inorder(node.left, result)
-            result.append(node.value)
-            self.inorder(node.right, result)
+        result.extend(self._inorder_values(node))
     
     def postorder_traversal(self) -> List[Any]:
         """Postorder traversal: Left -> Right -> Root"""
@@ -89,11 +106,412 @@ class BinaryTree:
     
     def postorder(self, node: Optional[Node], result: List[Any]) -> None:
         """Helper method for postorder traversal"""
-        if node:
-            self.postorder(node.left, result)
-            self.postorder(node.right, result)
-            result.append(node.value)
+        result.extend(self._postorder_values(node))
+    
+    def level_order_traversal(self) -> List[Any]:
+        """Level order traversal: top to bottom, left to right"""
+        return list(self.iter_level_order())
+    
+    # ---------- Lazy traversals ----------
+    # Each generator keeps at most O(h) nodes on its stack (O(width) for
+    # level order), so deep trees do not hit the recursion limit and callers
+    # that stop early never pay for the rest of the tree.
+    
+    def iter_preorder(self) -> Iterator[Any]:
+        """Yield values in preorder"""
+        return self._preorder_values(self.root)
+    
+    def iter_inorder(self) -> Iterator[Any]:
+        """Yield values in inorder"""
+        return self._inorder_values(self.root)
+    
+    def iter_postorder(self) -> Iterator[Any]:
+        """Yield values in postorder"""
+        return self._postorder_values(self.root)
+    
+    def iter_level_order(self) -> Iterator[Any]:
+        """Yield values in level order using a deque as the queue"""
+        queue = deque([self.root] if self.root else [])
+        while queue:
+            node = queue.popleft()
+            yield node.value
+            if node.left:
+                queue.append(node.left)
+            if node.right:
+                queue.append(node.right)
+    
+    @staticmethod
+    def _preorder_values(node: Optional[Node]) -> Iterator[Any]:
+        """Preorder generator: the right child is pushed first so the left pops first"""
+        stack = [node] if node else []
+        while stack:
+            node = stack.pop()
+            yield node.value
+            if node.right:
+                stack.append(node.right)
+            if node.left:
+                stack.append(node.left)
+    
+    @staticmethod
+    def _inorder_values(node: Optional[Node]) -> Iterator[Any]:
+        """Inorder generator: walk left pushing ancestors, then visit and go right"""
+        stack = []
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.value
+            node = node.right
+    
+    @staticmethod
+    def _postorder_values(node: Optional[Node]) -> Iterator[Any]:
+        """Postorder generator: a node is visited once its right subtree is done"""
+        stack = []
+        last_visited = None
+        while stack or node:
+            if node:
+                stack.append(node)
+                node = node.left
+                continue
+            top = stack[-1]
+            if top.right and top.right is not last_visited:
+                node = top.right
+            else:
+                yield top.value
+                last_visited = stack.pop()
+    
+    # ---------- Morris traversals ----------
+    # Morris traversal threads the rightmost node of each left subtree back to
+    # its ancestor instead of keeping a stack, so it needs O(1) extra memory.
+    # Every thread is removed before the walk leaves that ancestor, leaving
+    # the tree exactly as it was once the generator finishes or is closed.
+    # While one is suspended the threads form cycles, so the tree must not be
+    # modified, read or traversed (not even by a second Morris walk) until
+    # the generator is exhausted or closed.
+    
+    def iter_morris_inorder(self) -> Iterator[Any]:
+        """Yield values in inorder using O(1) extra memory; do not touch the tree until it is exhausted or closed"""
+        return self._restoring(self._morris_values(self.root, preorder=False))
+    
+    def iter_morris_preorder(self) -> Iterator[Any]:
+        """Yield values in preorder using O(1) extra memory; do not touch the tree until it is exhausted or closed"""
+        return self._restoring(self._morris_values(self.root, preorder=True))
+    
+    @staticmethod
+    def _restoring(walk: Iterator[Any]) -> Iterator[Any]:
+        """Finish the walk silently if the consumer stops early, removing any threads still in place"""
+        try:
+            for value in walk:
+                yield value
+        finally:
+            for _ in walk:
+                pass
+    
+    @staticmethod
+    def _morris_values(node: Optional[Node], preorder: bool) -> Iterator[Any]:
+        """Morris walk yielding each value in preorder or inorder"""
+        while node:
+            if node.left is None:
+                yield node.value
+                node = node.right
+                continue
+            predecessor = node.left
+            while predecessor.right and predecessor.right is not node:
+                predecessor = predecessor.right
+            if predecessor.right is None:
+                # First arrival: thread back to node and descend left.
+                if preorder:
+                    yield node.value
+                predecessor.right = node
+                node = node.left
+            else:
+                # Came back up the thread: the left subtree is done.
+                predecessor.right = None
+                if not preorder:
+                    yield node.value
+                node = node.right
+    
+    # ---------- Serialization ----------
+    # Stream format: a header (magic, value typecode), then chunks of up to
+    # DUMP_CHUNK nodes in preorder. Each chunk holds its node count, a bitmap
+    # with two bits per node (has left, has right) and the chunk's values,
+    # either as a little-endian typed array ('q' or 'd') or as one pickled
+    # list ('p'). A zero count ends the stream. Both directions keep only one
+    # chunk and an O(h) stack in memory.
+    
+    DUMP_MAGIC = b"BTR1"
+    DUMP_CHUNK = 4096
+    _DUMP_HEADER = struct.Struct("<4sc")
+    _DUMP_COUNT = struct.Struct("<I")
+    _DUMP_LENGTH = struct.Struct("<Q")
+    
+    def _value_typecode(self) -> str:
+        """Pick 'q' if every value is a 64-bit int, 'd' if every value is a float, else 'p'"""
+        typecode = None
+        for value in self._preorder_values(self.root):
+            if type(value) is int and -2 ** 63 <= value < 2 ** 63:
+                code = 'q'
+            elif type(value) is float:
+                code = 'd'
+            else:
+                return 'p'
+            if typecode is None:
+                typecode = code
+            elif typecode != code:
+                return 'p'
+        return typecode or 'q'
+    
+    def dump(self, file: BinaryIO) -> None:
+        """Write the tree to a binary file object without recursion"""
+        typecode = self._value_typecode()
+        file.write(self._DUMP_HEADER.pack(self.DUMP_MAGIC, typecode.encode()))
+        stack = [self.root] if self.root else []
+        while stack:
+            values = []
+            bitmap = bytearray((self.DUMP_CHUNK + 3) // 4)
+            while stack and len(values) < self.DUMP_CHUNK:
+                node = stack.pop()
+                i = len(values)
+                values.append(node.value)
+                flags = (node.left is not None) | (node.right is not None) << 1
+                bitmap[i >> 2] |= flags << ((i & 3) * 2)
+                if node.right:
+                    stack.append(node.right)
+                if node.left:
+                    stack.append(node.left)
+            count = len(values)
+            file.write(self._DUMP_COUNT.pack(count))
+            file.write(bitmap[:(count + 3) // 4])
+            if typecode == 'p':
+                blob = pickle.dumps(values, protocol=pickle.HIGHEST_PROTOCOL)
+                file.write(self._DUMP_LENGTH.pack(len(blob)))
+                file.write(blob)
+            else:
+                column = array(typecode, values)
+                if sys.byteorder == 'big':
+                    column.byteswap()
+                file.write(column.tobytes())
+        file.write(self._DUMP_COUNT.pack(0))
+    
+    @classmethod
+    def load(cls, file: BinaryIO) -> 'BinaryTree':
+        """Read a tree written by dump(); pickled values must come from a trusted file"""
+        def read_exact(n: int) -> bytes:
+            data = file.read(n)
+            if len(data) != n:
+                raise ValueError("Truncated BinaryTree dump")
+            return data
+        
+        magic, typecode = cls._DUMP_HEADER.unpack(read_exact(cls._DUMP_HEADER.size))
+        typecode = typecode.decode()
+        if magic != cls.DUMP_MAGIC or typecode not in "qdp":
+            raise ValueError("Not a BinaryTree dump")
+        tree = cls()
+        # Child slots still waiting for a node, as (parent, is_left); preorder
+        # fills the most recently opened slot first.
+        pending = []
+        while True:
+            count = cls._DUMP_COUNT.unpack(read_exact(cls._DUMP_COUNT.size))[0]
+            if count == 0:
+                break
+            bitmap = read_exact((count + 3) // 4)
+            if typecode == 'p':
+                length = cls._DUMP_LENGTH.unpack(read_exact(cls._DUMP_LENGTH.size))[0]
+                values = pickle.loads(read_exact(length))
+                if not isinstance(values, list) or len(values) != count:
+                    raise ValueError("Corrupt BinaryTree dump")
+            else:
+                values = array(typecode)
+                values.frombytes(read_exact(count * values.itemsize))
+                if sys.byteorder == 'big':
+                    values.byteswap()
+            for i in range(count):
+                node = Node(values[i])
+                if pending:
+                    parent, is_left = pending.pop()
+                    if is_left:
+                        parent.left = node
+                    else:
+                        parent.right = node
+                elif tree.root is None:
+                    tree.root = node
+                else:
+                    raise ValueError("Corrupt BinaryTree dump")
+                flags = bitmap[i >> 2] >> ((i & 3) * 2)
+                if flags & 2:
+                    pending.append((node, False))
+                if flags & 1:
+                    pending.append((node, True))
+        if pending:
+            raise ValueError("Truncated BinaryTree dump")
+        return tree
+
+
+class AugmentedNode:
+    """Node that caches its subtree size and height and knows its parent"""
+    __slots__ = ("value", "left", "right", "parent", "size", "height", "owner")
+
+    def __init__(self, value: Any):
+        self.value = value
+        self.left: Optional['AugmentedNode'] = None
+        self.right: Optional['AugmentedNode'] = None
+        self.parent: Optional['AugmentedNode'] = None
+        self.size = 1
+        self.height = 0
+        # The tree this node is the root of, if any
+        self.owner: Optional['AugmentedBinaryTree'] = None
+
+
+class AugmentedBinaryTree(BinaryTree):
+    """
+    Binary Tree whose nodes cache subtree size and height
+
+    The root and children must be attached and removed through set_root,
+    set_left, set_right and detach, which refresh the cached values on the path to the root.
+    Assigning root, node.left or node.right directly leaves the caches
+    stale. A node belongs to at most one tree: the root records its tree,
+    and parents passed to set_left / set_right must be in this tree.
+
+    Time Complexities:
+    - height / size: O(1)
+    - set_left / set_right / detach: O(depth)
+    - Traversal: O(n)
+    """
+
+    def __init__(self, root_value: Optional[Any] = None):
+        """Initialize augmented tree with optional root value"""
+        self.root = None
+        if root_value is not None:
+            self.set_root(root_value)
+
+    def height(self) -> int:
+        """Height of tree from the cached root value (-1 for empty tree)"""
+        return self.root.height if self.root else -1
+
+    def size(self) -> int:
+        """Node count from the cached root value"""
+        return self.root.size if self.root else 0
+
+    def set_root(self, root: Any) -> Optional[AugmentedNode]:
+        """Install root (a value, a detached node or None) as the root, detaching any previous root; returns it"""
+        if root is not None and not isinstance(root, AugmentedNode):
+            root = AugmentedNode(root)
+        if root is not None and (root.parent is not None or root.owner is not None):
+            raise ValueError("Node is already attached; detach it first")
+        if self.root is not None:
+            self.root.owner = None
+        self.root = root
+        if root is not None:
+            root.owner = self
+        return root
+
+    def set_left(self, parent: AugmentedNode, child: Any) -> Optional[AugmentedNode]:
+        """Attach child (a value, a detached node or None) as parent's left child; returns it"""
+        return self._set_child(parent, child, is_left=True)
 
+    def set_right(self, parent: AugmentedNode, child: Any) -> Optional[AugmentedNode]:
+        """Attach child (a value, a detached node or None) as parent's right child; returns it"""
+        return self._set_child(parent, child, is_left=False)
+
+    def detach(self, node: AugmentedNode) -> AugmentedNode:
+        """Remove node's subtree from the tree and return it as a standalone subtree"""
+        parent = node.parent
+        if parent is None:
+            if node is self.root:
+                self.set_root(None)
+            return node
+        if parent.left is node:
+            parent.left = None
+        else:
+            parent.right = None
+        node.parent = None
+        self._refresh_upward(parent)
+        return node
+
+    @classmethod
+    def load(cls, file: BinaryIO) -> 'AugmentedBinaryTree':
+        """Read a tree written by dump(), rebuilding parent links and cached values"""
+        tree = cls()
+        tree.set_root(cls._augment(BinaryTree.load(file).root))
+        return tree
+
+    @staticmethod
+    def _augment(root: Optional[Node]) -> Optional[AugmentedNode]:
+        """Copy a plain subtree into augmented nodes, filling the caches bottom-up"""
+        if root is None:
+            return None
+        top = AugmentedNode(root.value)
+        stack = [(root, top)]
+        # Parents are appended before their children, so walking this list
+        # backwards sees every child before its parent.
+        order = []
+        while stack:
+            node, copy = stack.pop()
+            order.append(copy)
+            if node.left:
+                copy.left = AugmentedNode(node.left.value)
+                copy.left.parent = copy
+                stack.append((node.left, copy.left))
+            if node.right:
+                copy.right = AugmentedNode(node.right.value)
+                copy.right.parent = copy
+                stack.append((node.right, copy.right))
+        for node in reversed(order):
+            if node.left:
+                node.size += node.left.size
+                node.height = node.left.height + 1
+            if node.right:
+                node.size += node.right.size
+                node.height = max(node.height, node.right.height + 1)
+        return top
+
+    def _set_child(self, parent: AugmentedNode, child: Any, is_left: bool) -> Optional[AugmentedNode]:
+        """Replace one child of parent, detaching any previous child"""
+        if child is not None and not isinstance(child, AugmentedNode):
+            child = AugmentedNode(child)
+        if child is not None and (child.parent is not None or child.owner is not None):
+            raise ValueError("Node is already attached; detach it first")
+        top = parent
+        while True:
+            if top is child:
+                raise ValueError("Cannot attach a subtree under one of its own nodes")
+            if top.parent is None:
+                break
+            top = top.parent
+        if top.owner is not self:
+            raise ValueError("Parent is not in this tree")
+        old = parent.left if is_left else parent.right
+        if old is not None:
+            old.parent = None
+        if is_left:
+            parent.left = child
+        else:
+            parent.right = child
+        if child is not None:
+            child.parent = parent
+        self._refresh_upward(parent)
+        return child
+
+    @staticmethod
+    def _refresh_upward(node: Optional[AugmentedNode]) -> None:
+        """Recompute cached size and height from node up to the root"""
+        while node:
+            size = 1
+            height = -1
+            if node.left:
+                size += node.left.size
+                height = node.left.height
+            if node.right:
+                size += node.right.size
+                height = max(height, node.right.height)
+            height += 1
+            if size == node.size and height == node.height:
+                # Nothing above can change either.
+                return
+            node.size = size
+            node.height = height
+            node = node.parent
 
 # ==================== UNIT TESTS ====================
 
@@ -160,11 +578,374 @@ class TestBinaryTree(unittest.TestCase):
         self.assertEqual(bt.preorder_traversal(), ['A', 'B', 'D', 'E', 'C', 'F'])
         self.assertEqual(bt.inorder_traversal(), ['D', 'B', 'E', 'A', 'F', 'C'])
         self.assertEqual(bt.postorder_traversal(), ['D', 'E', 'B', 'F', 'C', 'A'])
+        self.assertEqual(bt.level_order_traversal(), ['A', 'B', 'C', 'D', 'E', 'F'])
+
+    def test_lazy_traversals(self):
+        """Test generators yield the same orders as the list traversals"""
+        bt = BinaryTree('A')
+        bt.root.left = Node('B')
+        bt.root.right = Node('C')
+        bt.root.left.left = Node('D')
+        bt.root.left.right = Node('E')
+        bt.root.right.left = Node('F')
+
+        self.assertEqual(list(bt.iter_preorder()), bt.preorder_traversal())
+        self.assertEqual(list(bt.iter_inorder()), bt.inorder_traversal())
+        self.assertEqual(list(bt.iter_postorder()), bt.postorder_traversal())
+        self.assertEqual(list(bt.iter_level_order()), bt.level_order_traversal())
+        self.assertEqual(list(self.bt.iter_postorder()), [])
+        self.assertEqual(list(self.bt.iter_level_order()), [])
+
+    def test_degenerate_tree(self):
+        """Test a 20,000-node linked-list-shaped tree stays below the recursion limit"""
+        n = 20000
+        bt = BinaryTree(0)
+        node = bt.root
+        for i in range(1, n):
+            if i % 2:
+                node.left = Node(i)
+                node = node.left
+            else:
+                node.right = Node(i)
+                node = node.right
+
+        self.assertEqual(bt.height(), n - 1)
+        self.assertEqual(bt.size(), n)
+        self.assertEqual(bt.preorder_traversal(), list(range(n)))
+        self.assertEqual(bt.postorder_traversal(), list(range(n - 1, -1, -1)))
+        self.assertEqual(bt.level_order_traversal(), list(range(n)))
+        self.assertEqual(len(bt.inorder_traversal()), n)
+
+        # Generators stop early without walking the whole tree
+        inorder = bt.iter_inorder()
+        self.assertEqual(next(inorder), bt.inorder_traversal()[0])
+        preorder = bt.iter_preorder()
+        self.assertEqual([next(preorder) for _ in range(3)], [0, 1, 2])
+
+    def test_morris_traversals(self):
+        """Test Morris traversals match the stack traversals and restore the tree"""
+        bt = BinaryTree('A')
+        bt.root.left = Node('B')
+        bt.root.right = Node('C')
+        bt.root.left.left = Node('D')
+        bt.root.left.right = Node('E')
+        bt.root.right.left = Node('F')
+        bt.root.left.right.left = Node('G')
+        shape = _shape(bt.root)
+
+        self.assertEqual(list(bt.iter_morris_inorder()), bt.inorder_traversal())
+        self.assertEqual(list(bt.iter_morris_preorder()), bt.preorder_traversal())
+        self.assertEqual(_shape(bt.root), shape)
+        self.assertEqual(list(self.bt.iter_morris_inorder()), [])
+
+        # Stopping early still removes the threads
+        for walk in (bt.iter_morris_inorder(), bt.iter_morris_preorder()):
+            self.assertEqual(len([next(walk) for _ in range(3)]), 3)
+            walk.close()
+            self.assertEqual(_shape(bt.root), shape)
+
+        skewed = _build_tree(5000, balanced=False)
+        self.assertEqual(list(skewed.iter_morris_inorder()), skewed.inorder_traversal())
+        self.assertEqual(list(skewed.iter_morris_preorder()), skewed.preorder_traversal())
+
+
+class TestAugmentedBinaryTree(unittest.TestCase):
+    """Test cases for AugmentedBinaryTree"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        # Create tree:    1
+        #               /   \
+        #              2     3
+        #             / \
+        #            4   5
+        self.bt = AugmentedBinaryTree(1)
+        self.two = self.bt.set_left(self.bt.root, 2)
+        self.three = self.bt.set_right(self.bt.root, 3)
+        self.four = self.bt.set_left(self.two, 4)
+        self.five = self.bt.set_right(self.two, 5)
+
+    def assertCachesMatch(self, tree):
+        """Check every cached size and height against a recount"""
+        for node in _nodes(tree.root):
+            self.assertEqual(node.size, BinaryTree()._size_helper(node))
+            self.assertEqual(node.height, BinaryTree()._height_helper(node))
+
+    def test_empty_tree(self):
+        """Test queries on empty tree"""
+        bt = AugmentedBinaryTree()
+        self.assertTrue(bt.is_empty())
+        self.assertEqual(bt.height(), -1)
+        self.assertEqual(bt.size(), 0)
+
+    def test_cached_values(self):
+        """Test cached size and height after attaching children"""
+        self.assertEqual(self.bt.size(), 5)
+        self.assertEqual(self.bt.height(), 2)
+        self.assertEqual(self.two.size, 3)
+        self.assertEqual(self.three.height, 0)
+        self.assertEqual(self.bt.inorder_traversal(), [4, 2, 5, 1, 3])
+        self.assertCachesMatch(self.bt)
+
+    def test_detach_and_reattach(self):
+        """Test detaching a subtree and attaching it elsewhere"""
+        subtree = self.bt.detach(self.two)
+        self.assertIsNone(subtree.parent)
+        self.assertEqual(self.bt.size(), 2)
+        self.assertEqual(self.bt.height(), 1)
+        self.assertEqual(subtree.size, 3)
+
+        self.bt.set_right(self.three, subtree)
+        self.assertEqual(self.bt.size(), 5)
+        self.assertEqual(self.bt.height(), 3)
+        self.assertEqual(self.bt.preorder_traversal(), [1, 3, 2, 4, 5])
+        self.assertCachesMatch(self.bt)
+
+        with self.assertRaises(ValueError):
+            self.bt.set_left(self.bt.root, self.four)
+
+        subtree = self.bt.detach(self.two)
+        with self.assertRaises(ValueError):
+            self.bt.set_left(self.four, subtree)
+        with self.assertRaises(ValueError):
+            self.bt.set_right(subtree, subtree)
+        with self.assertRaises(ValueError):
+            self.bt.set_right(self.three, AugmentedBinaryTree(9).root)
+        other = AugmentedBinaryTree(9)
+        with self.assertRaises(ValueError):
+            other.set_left(other.root, self.three)
+        with self.assertRaises(ValueError):
+            other.set_left(self.three, 10)
+        with self.assertRaises(ValueError):
+            other.set_root(self.bt.root)
+        self.assertEqual(other.size(), 1)
+        self.assertEqual(subtree.size, 3)
+        self.assertIsNone(self.four.left)
+        self.bt.set_right(self.three, subtree)
+
+        self.bt.detach(self.bt.root)
+        self.assertTrue(self.bt.is_empty())
+
+    def test_set_root(self):
+        """Test installing a new root after the tree is emptied"""
+        subtree = self.bt.detach(self.two)
+        self.bt.detach(self.bt.root)
+        self.assertTrue(self.bt.is_empty())
+        self.assertIs(self.bt.set_root(subtree), subtree)
+        self.assertEqual(self.bt.size(), 3)
+        self.assertEqual(self.bt.preorder_traversal(), [2, 4, 5])
+        with self.assertRaises(ValueError):
+            self.bt.set_root(self.four)
+
+        bt = AugmentedBinaryTree()
+        root = bt.set_root(7)
+        bt.set_left(root, 8)
+        self.assertEqual(bt.size(), 2)
+        self.assertEqual(bt.height(), 1)
+        self.assertCachesMatch(bt)
+        self.assertIsNone(bt.set_root(None))
+        self.assertTrue(bt.is_empty())
+
+    def test_replace_child(self):
+        """Test replacing and clearing a child"""
+        old = self.two
+        self.bt.set_left(self.bt.root, 6)
+        self.assertIsNone(old.parent)
+        self.assertEqual(self.bt.size(), 3)
+        self.assertEqual(self.bt.height(), 1)
+        self.bt.set_right(self.bt.root, None)
+        self.assertEqual(self.bt.size(), 2)
+        self.assertCachesMatch(self.bt)
+
+    def test_deep_chain(self):
+        """Test caches along a long chain of edits"""
+        bt = AugmentedBinaryTree(0)
+        node = bt.root
+        for i in range(1, 2000):
+            node = bt.set_left(node, i)
+        self.assertEqual(bt.height(), 1999)
+        self.assertEqual(bt.size(), 2000)
+        bt.detach(node.parent)
+        self.assertEqual(bt.height(), 1997)
+        self.assertEqual(bt.size(), 1998)
+
+
+class TestBinaryTreeSerialization(unittest.TestCase):
+    """Test cases for BinaryTree.dump / BinaryTree.load"""
+
+    def round_trip(self, bt: BinaryTree) -> BinaryTree:
+        """Dump to an in-memory file and load it back"""
+        buffer = io.BytesIO()
+        bt.dump(buffer)
+        buffer.seek(0)
+        loaded = BinaryTree.load(buffer)
+        self.assertEqual(_shape(loaded.root), _shape(bt.root))
+        self.assertEqual(buffer.read(), b"")
+        return loaded
+
+    def test_empty_tree(self):
+        """Test an empty tree round trip"""
+        self.assertTrue(self.round_trip(BinaryTree()).is_empty())
+
+    def test_value_columns(self):
+        """Test typed columns for ints and floats and pickle for anything else"""
+        for values, typecode in (([1, -2, 3, 2 ** 40], 'q'),
+                                 ([0.5, 1.5, -2.0, 3.25], 'd'),
+                                 (['a', (1, 2), None, 'd'], 'p'),
+                                 ([1, 2.5, 3, 4], 'p'),
+                                 ([True, False, True, True], 'p'),
+                                 ([2 ** 70, 1, 2, 3], 'p')):
+            bt = _build_tree(4)
+            for node, value in zip(_nodes(bt.root), values):
+                node.value = value
+            self.assertEqual(bt._value_typecode(), typecode)
+            loaded = self.round_trip(bt)
+            self.assertEqual([type(v) for v in loaded.preorder_traversal()],
+                             [type(v) for v in values])
+
+    def test_chunks_and_deep_trees(self):
+        """Test trees spanning many chunks, including a deep chain"""
+        bt = _build_tree(1000)
+        bt.DUMP_CHUNK = 7
+        self.round_trip(bt)
+        loaded = self.round_trip(_build_tree(20000, balanced=False))
+        self.assertEqual(loaded.height(), 19999)
+
+    def test_compact_size(self):
+        """Test the int encoding is far smaller than pickling the nodes"""
+        bt = _build_tree(1000)
+        buffer = io.BytesIO()
+        bt.dump(buffer)
+        self.assertLess(len(buffer.getvalue()), 1000 * 8 + 1000 // 4 + 64)
+
+    def test_invalid_input(self):
+        """Test truncated and foreign streams are rejected"""
+        buffer = io.BytesIO()
+        _build_tree(10).dump(buffer)
+        data = buffer.getvalue()
+        with self.assertRaises(ValueError):
+            BinaryTree.load(io.BytesIO(data[:-10]))
+        with self.assertRaises(ValueError):
+            BinaryTree.load(io.BytesIO(b"nope" + data[4:]))
+
+    def test_value_count_mismatch(self):
+        """Test a pickled value column shorter than its node count is rejected"""
+        blob = pickle.dumps(["a"])
+        data = (BinaryTree._DUMP_HEADER.pack(BinaryTree.DUMP_MAGIC, b"p")
+                + BinaryTree._DUMP_COUNT.pack(2) + bytes([1])
+                + BinaryTree._DUMP_LENGTH.pack(len(blob)) + blob
+                + BinaryTree._DUMP_COUNT.pack(0))
+        with self.assertRaises(ValueError):
+            BinaryTree.load(io.BytesIO(data))
+
+    def test_load_augmented(self):
+        """Test AugmentedBinaryTree.load restores parents and cached values"""
+        buffer = io.BytesIO()
+        _build_tree(200, balanced=False).dump(buffer)
+        buffer.seek(0)
+        loaded = AugmentedBinaryTree.load(buffer)
+        self.assertIsInstance(loaded, AugmentedBinaryTree)
+        self.assertIsInstance(loaded.root, AugmentedNode)
+        self.assertEqual(loaded.size(), 200)
+        self.assertEqual(loaded.height(), 199)
+        for node in _nodes(loaded.root):
+            self.assertEqual(node.size, BinaryTree()._size_helper(node))
+            self.assertEqual(node.height, BinaryTree()._height_helper(node))
+            for child in (node.left, node.right):
+                if child:
+                    self.assertIs(child.parent, node)
+        self.assertIsNone(loaded.root.parent)
+
+
+def _shape(node: Optional[Node]) -> List[Any]:
+    """Preorder list of (value, left value, right value) used to compare trees"""
+    return [(n.value, n.left and n.left.value, n.right and n.right.value)
+            for n in _nodes(node)]
+
+
+def _nodes(node: Optional[Node]) -> Iterator[Node]:
+    """Yield nodes in preorder with an explicit stack"""
+    stack = [node] if node else []
+    while stack:
+        node = stack.pop()
+        yield node
+        if node.right:
+            stack.append(node.right)
+        if node.left:
+            stack.append(node.left)
+
+
+def _build_tree(n: int, balanced: bool = True) -> BinaryTree:
+    """Build a complete tree (heap layout) or a left-leaning chain of n nodes"""
+    bt = BinaryTree()
+    nodes = [Node(i) for i in range(n)]
+    for i, node in enumerate(nodes):
+        if balanced:
+            if 2 * i + 1 < n:
+                node.left = nodes[2 * i + 1]
+            if 2 * i + 2 < n:
+                node.right = nodes[2 * i + 2]
+        elif i + 1 < n:
+            node.left = nodes[i + 1]
+    bt.root = nodes[0] if nodes else None
+    return bt
+
+
+# ==================== BENCHMARK ====================
+
+def benchmark_traversal_memory(n: int = 500_000) -> None:
+    """Compare peak traversal memory of list, stack-generator and Morris inorder"""
+    print(f"Benchmarking inorder traversal memory on {n}-node trees...")
+    for label, balanced in (("balanced", True), ("skewed", False)):
+        bt = _build_tree(n, balanced)
+        for name, walk in (("inorder_traversal", bt.inorder_traversal),
+                           ("iter_inorder", bt.iter_inorder),
+                           ("iter_morris_inorder", bt.iter_morris_inorder)):
+            tracemalloc.start()
+            start = time.perf_counter()
+            total = sum(walk())
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"  {label:8} {name:20} peak {peak / 1024:10.1f} KiB, {elapsed * 1e3:7.1f} ms, sum={total}")
+    print()
+
 
+def benchmark_serialization(n: int = 200_000) -> None:
+    """Compare dump/load with pickle on a complete tree"""
+    print(f"Benchmarking serialization of a complete {n}-node tree...")
+    bt = _build_tree(n)
+    start = time.perf_counter()
+    buffer = io.BytesIO()
+    bt.dump(buffer)
+    dumped = time.perf_counter() - start
+    buffer.seek(0)
+    start = time.perf_counter()
+    BinaryTree.load(buffer)
+    loaded = time.perf_counter() - start
+    print(f"  dump/load: {len(buffer.getvalue()) / n:5.1f} bytes/node, "
+          f"dump {dumped * 1e3:.1f} ms, load {loaded * 1e3:.1f} ms")
+    start = time.perf_counter()
+    blob = pickle.dumps(bt, protocol=pickle.HIGHEST_PROTOCOL)
+    dumped = time.perf_counter() - start
+    start = time.perf_counter()
+    pickle.loads(blob)
+    loaded = time.perf_counter() - start
+    print(f"  pickle:    {len(blob) / n:5.1f} bytes/node, "
+          f"dump {dumped * 1e3:.1f} ms, load {loaded * 1e3:.1f} ms")
+    try:
+        pickle.dumps(_build_tree(50_000, balanced=False))
+    except RecursionError:
+        print("  pickle on a 50,000-deep chain: RecursionError")
+    print()
 
 # ==================== HOW TO RUN TESTS ====================
 
 if __name__ == '__main__':
+    if "--bench" in sys.argv:
+        benchmark_traversal_memory()
+        benchmark_serialization()
+        sys.exit()
     print("Running Binary Tree Tests...")
     print("=" * 30)
     unittest.main(verbosity=2)
\ No newline at end of file
@@ -0,0 +1,371 @@
+import sys
+import time
+import tracemalloc
+import unittest
+from array import array
+from collections import deque
+from typing import Optional, List, Any, Iterator
+
+from Day3.BinaryTree import BinaryTree, Node
+
+
+NO_CHILD = -1
+
+
+class CompactBinaryTree:
+    """
+    Binary Tree stored as parallel arrays (struct of arrays)
+
+    Node i has value values[i] and children left[i] and right[i], where
+    NO_CHILD (-1) marks a missing child. Child indices are array('i') entries
+    (4 bytes each); values are a typed array when a typecode is given and a
+    Python list otherwise.
+
+    Time Complexities:
+    - Traversal: O(n)
+    - Height: O(n)
+    - Size: O(n)
+    - from_tree / to_tree: O(n)
+
+    Space Complexity: 8 bytes of child indices per node plus value storage,
+    O(h) for the explicit traversal stack
+    """
+
+    def __init__(self, typecode: Optional[str] = None):
+        """Initialize an empty tree; typecode selects an array type for values"""
+        self.typecode = typecode
+        self.values = array(typecode) if typecode else []
+        self.left = array('i')
+        self.right = array('i')
+        self.root = NO_CHILD
+
+    def __len__(self) -> int:
+        """Number of stored nodes"""
+        return len(self.left)
+
+    def is_empty(self) -> bool:
+        """Check if tree is empty"""
+        return self.root == NO_CHILD
+
+    def add_node(self, value: Any) -> int:
+        """Append an unlinked node and return its index; the first node becomes the root"""
+        self.values.append(value)
+        self.left.append(NO_CHILD)
+        self.right.append(NO_CHILD)
+        index = len(self.left) - 1
+        if self.root == NO_CHILD:
+            self.root = index
+        return index
+
+    def _check_index(self, index: int) -> None:
+        """Raise IndexError unless index names a stored node"""
+        if index < 0 or index >= len(self.left):
+            raise IndexError("Index out of bounds")
+
+    def set_left(self, parent: int, child: int) -> None:
+        """Make child (or NO_CHILD) the left child of parent"""
+        self._check_index(parent)
+        if child != NO_CHILD:
+            self._check_index(child)
+        self.left[parent] = child
+
+    def set_right(self, parent: int, child: int) -> None:
+        """Make child (or NO_CHILD) the right child of parent"""
+        self._check_index(parent)
+        if child != NO_CHILD:
+            self._check_index(child)
+        self.right[parent] = child
+
+    def nbytes(self) -> int:
+        """Bytes used by the index arrays and typed value storage"""
+        total = (len(self.left) + len(self.right)) * self.left.itemsize
+        if self.typecode:
+            total += len(self.values) * self.values.itemsize
+        return total
+
+    # ---------- Conversion ----------
+
+    @classmethod
+    def from_tree(cls, tree: BinaryTree, typecode: Optional[str] = None) -> 'CompactBinaryTree':
+        """Copy a pointer-based BinaryTree, laying nodes out in preorder"""
+        compact = cls(typecode)
+        stack = [(tree.root, NO_CHILD, False)] if tree.root else []
+        while stack:
+            node, parent, is_left = stack.pop()
+            index = compact.add_node(node.value)
+            if parent != NO_CHILD:
+                if is_left:
+                    compact.left[parent] = index
+                else:
+                    compact.right[parent] = index
+            if node.right:
+                stack.append((node.right, index, False))
+            if node.left:
+                stack.append((node.left, index, True))
+        return compact
+
+    def to_tree(self) -> BinaryTree:
+        """Build the equivalent pointer-based BinaryTree"""
+        tree = BinaryTree()
+        if self.is_empty():
+            return tree
+        values, left, right = self.values, self.left, self.right
+        tree.root = Node(values[self.root])
+        stack = [(self.root, tree.root)]
+        while stack:
+            index, node = stack.pop()
+            child = left[index]
+            if child != NO_CHILD:
+                node.left = Node(values[child])
+                stack.append((child, node.left))
+            child = right[index]
+            if child != NO_CHILD:
+                node.right = Node(values[child])
+                stack.append((child, node.right))
+        return tree
+
+    # ---------- Queries ----------
+
+    def height(self) -> int:
+        """Calculate height of tree (-1 for empty tree)"""
+        left, right = self.left, self.right
+        height = -1
+        stack = [(self.root, 0)] if self.root != NO_CHILD else []
+        while stack:
+            index, depth = stack.pop()
+            if depth > height:
+                height = depth
+            if left[index] != NO_CHILD:
+                stack.append((left[index], depth + 1))
+            if right[index] != NO_CHILD:
+                stack.append((right[index], depth + 1))
+        return height
+
+    def size(self) -> int:
+        """Count nodes reachable from the root"""
+        return sum(1 for _ in self._preorder_indices())
+
+    # ---------- Traversals ----------
+
+    def preorder_traversal(self) -> List[Any]:
+        """Preorder traversal: Root -> Left -> Right"""
+        return list(self.iter_preorder())
+
+    def inorder_traversal(self) -> List[Any]:
+        """Inorder traversal: Left -> Root -> Right"""
+        return list(self.iter_inorder())
+
+    def postorder_traversal(self) -> List[Any]:
+        """Postorder traversal: Left -> Right -> Root"""
+        return list(self.iter_postorder())
+
+    def level_order_traversal(self) -> List[Any]:
+        """Level order traversal: top to bottom, left to right"""
+        return list(self.iter_level_order())
+
+    def iter_preorder(self) -> Iterator[Any]:
+        """Yield values in preorder"""
+        values = self.values
+        return (values[i] for i in self._preorder_indices())
+
+    def iter_inorder(self) -> Iterator[Any]:
+        """Yield values in inorder"""
+        values = self.values
+        return (values[i] for i in self._inorder_indices())
+
+    def iter_postorder(self) -> Iterator[Any]:
+        """Yield values in postorder"""
+        values = self.values
+        return (values[i] for i in self._postorder_indices())
+
+    def iter_level_order(self) -> Iterator[Any]:
+        """Yield values in level order"""
+        values, left, right = self.values, self.left, self.right
+        queue = deque([self.root] if self.root != NO_CHILD else [])
+        while queue:
+            index = queue.popleft()
+            yield values[index]
+            if left[index] != NO_CHILD:
+                queue.append(left[index])
+            if right[index] != NO_CHILD:
+                queue.append(right[index])
+
+    def _preorder_indices(self) -> Iterator[int]:
+        """Yield node indices in preorder"""
+        left, right = self.left, self.right
+        stack = [self.root] if self.root != NO_CHILD else []
+        while stack:
+            index = stack.pop()
+            yield index
+            if right[index] != NO_CHILD:
+                stack.append(right[index])
+            if left[index] != NO_CHILD:
+                stack.append(left[index])
+
+    def _inorder_indices(self) -> Iterator[int]:
+        """Yield node indices in inorder"""
+        left, right = self.left, self.right
+        stack = []
+        index = self.root
+        while stack or index != NO_CHILD:
+            while index != NO_CHILD:
+                stack.append(index)
+                index = left[index]
+            index = stack.pop()
+            yield index
+            index = right[index]
+
+    def _postorder_indices(self) -> Iterator[int]:
+        """Yield node indices in postorder"""
+        left, right = self.left, self.right
+        stack = []
+        last_visited = NO_CHILD
+        index = self.root
+        while stack or index != NO_CHILD:
+            if index != NO_CHILD:
+                stack.append(index)
+                index = left[index]
+                continue
+            top = stack[-1]
+            if right[top] != NO_CHILD and right[top] != last_visited:
+                index = right[top]
+            else:
+                yield top
+                last_visited = stack.pop()
+
+
+# ==================== UNIT TESTS ====================
+
+class TestCompactBinaryTree(unittest.TestCase):
+    """Test cases for CompactBinaryTree"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        # Create tree:     A
+        #               /     \
+        #              B       C
+        #             / \     /
+        #            D   E   F
+        self.bt = BinaryTree('A')
+        self.bt.root.left = Node('B')
+        self.bt.root.right = Node('C')
+        self.bt.root.left.left = Node('D')
+        self.bt.root.left.right = Node('E')
+        self.bt.root.right.left = Node('F')
+
+    def test_empty_tree(self):
+        """Test operations on empty tree"""
+        compact = CompactBinaryTree.from_tree(BinaryTree())
+        self.assertTrue(compact.is_empty())
+        self.assertEqual(len(compact), 0)
+        self.assertEqual(compact.height(), -1)
+        self.assertEqual(compact.size(), 0)
+        self.assertEqual(compact.inorder_traversal(), [])
+        self.assertEqual(compact.level_order_traversal(), [])
+        self.assertTrue(compact.to_tree().is_empty())
+
+    def test_matches_pointer_tree(self):
+        """Test traversals, height and size match the pointer-based tree"""
+        compact = CompactBinaryTree.from_tree(self.bt)
+        self.assertEqual(len(compact), 6)
+        self.assertEqual(compact.height(), self.bt.height())
+        self.assertEqual(compact.size(), self.bt.size())
+        self.assertEqual(compact.preorder_traversal(), self.bt.preorder_traversal())
+        self.assertEqual(compact.inorder_traversal(), self.bt.inorder_traversal())
+        self.assertEqual(compact.postorder_traversal(), self.bt.postorder_traversal())
+        self.assertEqual(compact.level_order_traversal(), self.bt.level_order_traversal())
+        # from_tree lays nodes out in preorder
+        self.assertEqual(list(compact.values), self.bt.preorder_traversal())
+
+    def test_round_trip(self):
+        """Test converting to the compact form and back preserves the tree"""
+        back = CompactBinaryTree.from_tree(self.bt).to_tree()
+        self.assertEqual(back.preorder_traversal(), self.bt.preorder_traversal())
+        self.assertEqual(back.inorder_traversal(), self.bt.inorder_traversal())
+        self.assertIsNot(back.root, self.bt.root)
+
+    def test_typed_values(self):
+        """Test values stored in a typed array"""
+        bt = BinaryTree(1.5)
+        bt.root.left = Node(0.5)
+        bt.root.right = Node(2.5)
+        compact = CompactBinaryTree.from_tree(bt, typecode='d')
+        self.assertEqual(compact.values.typecode, 'd')
+        self.assertEqual(compact.inorder_traversal(), [0.5, 1.5, 2.5])
+        self.assertEqual(compact.nbytes(), 3 * 8 + 6 * 4)
+        with self.assertRaises(TypeError):
+            compact.add_node('not a float')
+
+    def test_manual_construction(self):
+        """Test building a tree with add_node and set_left/set_right"""
+        compact = CompactBinaryTree('q')
+        root = compact.add_node(1)
+        left = compact.add_node(2)
+        right = compact.add_node(3)
+        compact.set_left(root, left)
+        compact.set_right(root, right)
+        compact.set_left(left, compact.add_node(4))
+        self.assertEqual(compact.root, root)
+        self.assertEqual(compact.preorder_traversal(), [1, 2, 4, 3])
+        self.assertEqual(compact.postorder_traversal(), [4, 2, 3, 1])
+        compact.set_right(root, NO_CHILD)
+        self.assertEqual(compact.size(), 3)
+        self.assertEqual(len(compact), 4)
+        with self.assertRaises(IndexError):
+            compact.set_left(root, 10)
+
+    def test_degenerate_tree(self):
+        """Test a deep linked-list-shaped tree without recursion"""
+        n = 20000
+        compact = CompactBinaryTree('i')
+        previous = compact.add_node(0)
+        for i in range(1, n):
+            index = compact.add_node(i)
+            compact.set_right(previous, index)
+            previous = index
+        self.assertEqual(compact.height(), n - 1)
+        self.assertEqual(compact.size(), n)
+        self.assertEqual(compact.inorder_traversal(), list(range(n)))
+        self.assertEqual(compact.postorder_traversal(), list(range(n - 1, -1, -1)))
+        self.assertEqual(compact.to_tree().height(), n - 1)
+
+
+# ==================== BENCHMARK ====================
+
+def benchmark_compact_tree(n: int = 500_000) -> None:
+    """Compare memory of a pointer-based tree and its compact copy"""
+    print(f"Benchmarking memory of a complete {n}-node tree...")
+    tracemalloc.start()
+    nodes = [Node(i) for i in range(n)]
+    for i, node in enumerate(nodes):
+        if 2 * i + 1 < n:
+            node.left = nodes[2 * i + 1]
+        if 2 * i + 2 < n:
+            node.right = nodes[2 * i + 2]
+    bt = BinaryTree()
+    bt.root = nodes[0]
+    del nodes
+    pointer_bytes = tracemalloc.get_traced_memory()[0]
+    compact = CompactBinaryTree.from_tree(bt, typecode='q')
+    compact_bytes = tracemalloc.get_traced_memory()[0] - pointer_bytes
+    tracemalloc.stop()
+    print(f"  BinaryTree:        {pointer_bytes / n:6.1f} bytes/node")
+    print(f"  CompactBinaryTree: {compact_bytes / n:6.1f} bytes/node")
+
+    for name, tree in (("BinaryTree", bt), ("CompactBinaryTree", compact)):
+        start = time.perf_counter()
+        total = sum(tree.iter_inorder())
+        elapsed = time.perf_counter() - start
+        print(f"  {name} inorder sum: {elapsed * 1e3:.1f} ms, sum={total}")
+    print()
+
+
+# ==================== HOW TO RUN TESTS ====================
+
+if __name__ == '__main__':
+    if "--bench" in sys.argv:
+        benchmark_compact_tree()
+        sys.exit()
+    print("Running Compact Binary Tree Tests...")
+    print("=" * 30)
+    unittest.main(verbosity=2)
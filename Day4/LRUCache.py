@@ -0,0 +1,461 @@
+import functools
+import random
+import time
+import unittest
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Optional
+
+from Day2.DoublyLinkedList import DoublyLinkedList
+from Day4.HashTableSeparateChaining import HashTableSeparateChaining
+
+_MISSING = object()
+# Separates positional from keyword arguments in cached() keys, so a call
+# with keywords never shares a key with a purely positional call.
+_KWARGS_MARK = object()
+
+
+class _Entry:
+    __slots__ = ("key", "value", "weight", "node", "bucket")
+
+    def __init__(self, key: Any, value: Any, weight: int):
+        self.key = key
+        self.value = value
+        self.weight = weight
+        self.node = None
+        self.bucket = None
+
+
+class _FrequencyBucket:
+    __slots__ = ("freq", "entries")
+
+    def __init__(self, freq: int):
+        self.freq = freq
+        self.entries = DoublyLinkedList()
+
+
+class _BoundedCache(ABC):
+    """Shared bookkeeping for the caches: key -> entry lookup through
+    HashTableSeparateChaining, entry-count and weight limits, eviction
+    callbacks and hit/miss/eviction counters. Subclasses decide the
+    eviction order."""
+
+    def __init__(self, max_entries: Optional[int] = None, max_weight: Optional[int] = None,
+                 weigher: Optional[Callable[[Any, Any], int]] = None,
+                 on_evict: Optional[Callable[[Any, Any], None]] = None):
+        if max_entries is not None and max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        if max_weight is not None and max_weight <= 0:
+            raise ValueError("max_weight must be positive")
+        self.max_entries = max_entries
+        self.max_weight = max_weight
+        self.weigher = weigher
+        self.on_evict = on_evict
+        self.table = HashTableSeparateChaining()
+        self.total_weight = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @abstractmethod
+    def _link(self, entry: _Entry) -> None:
+        ...
+
+    @abstractmethod
+    def _unlink(self, entry: _Entry) -> None:
+        ...
+
+    @abstractmethod
+    def _touch(self, entry: _Entry) -> None:
+        ...
+
+    @abstractmethod
+    def _victim(self, protect: Optional[_Entry]) -> _Entry:
+        ...
+
+    def _over_limit(self) -> bool:
+        if self.max_entries is not None and self.table.size() > self.max_entries:
+            return True
+        return self.max_weight is not None and self.total_weight > self.max_weight
+
+    def _evict_entry(self, entry: _Entry) -> None:
+        self._unlink(entry)
+        self.table.remove(entry.key)
+        self.total_weight -= entry.weight
+        self.evictions += 1
+        if self.on_evict is not None:
+            self.on_evict(entry.key, entry.value)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        entry = self.table.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._touch(entry)
+        return entry.value
+
+    def peek(self, key: Any, default: Any = None) -> Any:
+        """Look up a value without counting a hit or changing eviction order"""
+        entry = self.table.get(key)
+        return default if entry is None else entry.value
+
+    def put(self, key: Any, value: Any) -> None:
+        weight = self.weigher(key, value) if self.weigher is not None else 1
+        if self.max_weight is not None and weight > self.max_weight:
+            raise ValueError(f"Entry weight {weight} exceeds max_weight {self.max_weight}")
+        entry = self.table.get(key)
+        if entry is not None:
+            self.total_weight += weight - entry.weight
+            entry.value = value
+            entry.weight = weight
+            self._touch(entry)
+            while self._over_limit():
+                self._evict_entry(self._victim(entry))
+            return
+        # The table rejects invalid keys, so it is updated before anything
+        # is linked or evicted.
+        entry = _Entry(key, value, weight)
+        self.table.put(key, entry)
+        self._link(entry)
+        self.total_weight += weight
+        while self._over_limit():
+            self._evict_entry(self._victim(entry))
+
+    def evict(self) -> tuple:
+        """Evict the next victim and return its (key, value)"""
+        if self.table.is_empty():
+            raise RuntimeError("Cache is empty")
+        entry = self._victim(None)
+        self._evict_entry(entry)
+        return entry.key, entry.value
+
+    def remove(self, key: Any) -> Any:
+        entry = self.table.remove(key)
+        if entry is None:
+            return None
+        self._unlink(entry)
+        self.total_weight -= entry.weight
+        return entry.value
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "entries": self.table.size(), "weight": self.total_weight}
+
+    def __contains__(self, key: Any) -> bool:
+        return self.table.contains_key(key)
+
+    def __len__(self) -> int:
+        return self.table.size()
+
+
+class LRUCache(_BoundedCache):
+    """
+    Least-recently-used cache
+
+    Entries sit in a DoublyLinkedList from least to most recently used;
+    every operation is O(1) average through node handles.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None, max_weight: Optional[int] = None,
+                 weigher: Optional[Callable[[Any, Any], int]] = None,
+                 on_evict: Optional[Callable[[Any, Any], None]] = None):
+        super().__init__(max_entries, max_weight, weigher, on_evict)
+        self.order = DoublyLinkedList()
+
+    def _link(self, entry: _Entry) -> None:
+        entry.node = self.order.add_last(entry)
+
+    def _unlink(self, entry: _Entry) -> None:
+        self.order.remove_node(entry.node)
+
+    def _touch(self, entry: _Entry) -> None:
+        self.order.move_to_back(entry.node)
+
+    def _victim(self, protect: Optional[_Entry]) -> _Entry:
+        # The protected entry was just touched, so it is at the back and is
+        # only the victim when it is the sole entry.
+        return self.order.head.data
+
+    def clear(self) -> None:
+        self.table.clear()
+        self.order.clear()
+        self.total_weight = 0
+
+
+class LFUCache(_BoundedCache):
+    """
+    Least-frequently-used cache with O(1) operations
+
+    A DoublyLinkedList of frequency buckets in ascending order, each holding
+    a DoublyLinkedList of its entries from least to most recently used.
+    Ties between equally frequent entries are broken by recency.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None, max_weight: Optional[int] = None,
+                 weigher: Optional[Callable[[Any, Any], int]] = None,
+                 on_evict: Optional[Callable[[Any, Any], None]] = None):
+        super().__init__(max_entries, max_weight, weigher, on_evict)
+        self.buckets = DoublyLinkedList()
+
+    def _place(self, entry: _Entry, bucket_node) -> None:
+        entry.bucket = bucket_node
+        entry.node = bucket_node.data.entries.add_last(entry)
+
+    def _link(self, entry: _Entry) -> None:
+        first = self.buckets.head
+        if first is None or first.data.freq != 1:
+            first = self.buckets.add_first(_FrequencyBucket(1))
+        self._place(entry, first)
+
+    def _unlink(self, entry: _Entry) -> None:
+        bucket = entry.bucket.data
+        bucket.entries.remove_node(entry.node)
+        if bucket.entries.is_empty():
+            self.buckets.remove_node(entry.bucket)
+
+    def _touch(self, entry: _Entry) -> None:
+        current = entry.bucket
+        freq = current.data.freq
+        target = current.next
+        if target is None or target.data.freq != freq + 1:
+            target = self.buckets.insert_after(current, _FrequencyBucket(freq + 1))
+        self._unlink(entry)
+        self._place(entry, target)
+
+    def _victim(self, protect: Optional[_Entry]) -> _Entry:
+        bucket = self.buckets.head
+        victim = bucket.data.entries.head
+        if victim.data is protect and victim.next is not None:
+            return victim.next.data
+        if victim.data is protect and bucket.next is not None:
+            return bucket.next.data.entries.head.data
+        return victim.data
+
+    def frequency(self, key: Any) -> int:
+        entry = self.table.get(key)
+        return 0 if entry is None else entry.bucket.data.freq
+
+    def clear(self) -> None:
+        self.table.clear()
+        self.buckets.clear()
+        self.total_weight = 0
+
+
+def cached(cache: _BoundedCache) -> Callable:
+    """Decorator memoizing a function's results in the given cache"""
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = args + (_KWARGS_MARK,) + tuple(sorted(kwargs.items())) if kwargs else args
+            value = cache.get(key, _MISSING)
+            if value is _MISSING:
+                value = fn(*args, **kwargs)
+                cache.put(key, value)
+            return value
+        wrapper.cache = cache
+        return wrapper
+    return decorator
+
+
+# ==================== BENCHMARK ====================
+
+def benchmark_caches(calls: int = 200_000, keys: int = 2_000, max_entries: int = 1_000) -> None:
+    print(f"Benchmarking memoized lookups ({calls} skewed calls over {keys} keys, {max_entries} entries)...")
+    rng = random.Random(0)
+    pattern = [int(keys * rng.random() ** 3) for _ in range(calls)]
+    variants = (
+        ("functools.lru_cache", lambda fn: functools.lru_cache(maxsize=max_entries)(fn)),
+        ("cached(LRUCache)", lambda fn: cached(LRUCache(max_entries))(fn)),
+        ("cached(LFUCache)", lambda fn: cached(LFUCache(max_entries))(fn)),
+    )
+    for name, wrap in variants:
+        misses = []
+        fn = wrap(lambda x: misses.append(x) or x * x)
+        start = time.perf_counter()
+        for x in pattern:
+            fn(x)
+        elapsed = time.perf_counter() - start
+        print(f"  {name}: {elapsed * 1e9 / calls:.0f} ns/call, hit rate {1 - len(misses) / calls:.1%}")
+    print()
+
+
+# ==================== UNIT TESTS ====================
+
+class TestLRUCache(unittest.TestCase):
+    def test_get_put_and_recency(self):
+        cache = LRUCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+        cache.put("c", 3)
+        self.assertNotIn("b", cache)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("c"), 3)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.stats()["hits"], 3)
+        self.assertEqual(cache.stats()["misses"], 1)
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_peek_does_not_refresh(self):
+        cache = LRUCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.peek("a"), 1)
+        cache.put("c", 3)
+        self.assertNotIn("a", cache)
+        self.assertEqual(cache.hits, 0)
+
+    def test_update_existing_key(self):
+        cache = LRUCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.put("a", 10)
+        cache.put("c", 3)
+        self.assertEqual(cache.peek("a"), 10)
+        self.assertNotIn("b", cache)
+        self.assertEqual(len(cache), 2)
+
+    def test_weight_limit_and_callback(self):
+        evicted = []
+        cache = LRUCache(max_weight=10, weigher=lambda k, v: len(v),
+                         on_evict=lambda k, v: evicted.append(k))
+        cache.put("a", "xxxx")
+        cache.put("b", "xxxx")
+        cache.put("c", "xxxx")
+        self.assertEqual(evicted, ["a"])
+        self.assertEqual(cache.total_weight, 8)
+        cache.put("b", "xxxxxxxx")
+        self.assertEqual(evicted, ["a", "c"])
+        self.assertEqual(cache.total_weight, 8)
+        with self.assertRaises(ValueError):
+            cache.put("d", "x" * 11)
+
+    def test_evict_remove_and_clear(self):
+        cache = LRUCache()
+        for i in range(3):
+            cache.put(i, i * i)
+        self.assertEqual(cache.evict(), (0, 0))
+        self.assertEqual(cache.remove(1), 1)
+        self.assertIsNone(cache.remove(1))
+        self.assertEqual(len(cache), 1)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        with self.assertRaises(RuntimeError):
+            cache.evict()
+
+    def test_invalid_key_leaves_cache_unchanged(self):
+        for cache in (LRUCache(max_entries=2), LFUCache(max_entries=2)):
+            cache.put("a", 1)
+            cache.put("b", 2)
+            with self.assertRaises(ValueError):
+                cache.put(None, 3)
+            self.assertEqual(len(cache), 2)
+            self.assertEqual(cache.evictions, 0)
+            self.assertEqual(cache.evict(), ("a", 1))
+            self.assertEqual(cache.evict(), ("b", 2))
+            with self.assertRaises(RuntimeError):
+                cache.evict()
+
+    def test_base_class_is_abstract(self):
+        with self.assertRaises(TypeError):
+            _BoundedCache()
+
+    def test_invalid_limits(self):
+        with self.assertRaises(ValueError):
+            LRUCache(max_entries=0)
+        with self.assertRaises(ValueError):
+            LFUCache(max_weight=-1)
+
+
+class TestLFUCache(unittest.TestCase):
+    def test_evicts_least_frequent(self):
+        cache = LFUCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.get("a")
+        cache.put("c", 3)
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertEqual(cache.frequency("a"), 3)
+        self.assertEqual(cache.frequency("c"), 1)
+
+    def test_ties_broken_by_recency(self):
+        cache = LFUCache(max_entries=3)
+        for key in "abc":
+            cache.put(key, key)
+        cache.get("a")
+        cache.get("b")
+        cache.put("d", "d")
+        self.assertNotIn("c", cache)
+        cache.put("e", "e")
+        self.assertNotIn("d", cache)
+        self.assertEqual(cache.evict(), ("e", "e"))
+        self.assertEqual(cache.evict(), ("a", "a"))
+
+    def test_update_does_not_evict_itself(self):
+        cache = LFUCache(max_weight=5, weigher=lambda k, v: v)
+        cache.put("a", 2)
+        cache.get("a")
+        cache.get("a")
+        cache.put("b", 2)
+        cache.put("b", 4)
+        self.assertIn("b", cache)
+        self.assertNotIn("a", cache)
+        self.assertEqual(cache.total_weight, 4)
+
+    def test_remove_and_clear(self):
+        cache = LFUCache(max_entries=4)
+        for i in range(4):
+            cache.put(i, i)
+        cache.get(3)
+        self.assertEqual(cache.remove(0), 0)
+        self.assertEqual(cache.evict(), (1, 1))
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertTrue(cache.buckets.is_empty())
+
+
+class TestCachedDecorator(unittest.TestCase):
+    def test_memoizes_calls(self):
+        calls = []
+
+        @cached(LRUCache(max_entries=8))
+        def square(x, offset=0):
+            calls.append(x)
+            return x * x + offset
+
+        self.assertEqual(square(3), 9)
+        self.assertEqual(square(3), 9)
+        self.assertEqual(square(3, offset=1), 10)
+        self.assertEqual(calls, [3, 3])
+        self.assertEqual(square.cache.stats()["hits"], 1)
+        self.assertEqual(square.__name__, "square")
+
+    def test_keyword_call_does_not_collide_with_positional(self):
+        @cached(LRUCache(max_entries=8))
+        def describe(*args, **kwargs):
+            return (args, kwargs)
+
+        self.assertEqual(describe(1, offset=1), ((1,), {"offset": 1}))
+        self.assertEqual(describe((1,), (("offset", 1),)), (((1,), (("offset", 1),)), {}))
+        self.assertEqual(describe(1, offset=1), ((1,), {"offset": 1}))
+
+    def test_caches_none_results(self):
+        calls = []
+
+        @cached(LFUCache(max_entries=2))
+        def nothing(x):
+            calls.append(x)
+            return None
+
+        nothing(1)
+        nothing(1)
+        self.assertEqual(calls, [1])
+
+
+if __name__ == '__main__':
+    benchmark_caches()
+    print("Running Cache Tests...")
+    print("=" * 30)
+    unittest.main(verbosity=2)
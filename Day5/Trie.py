@@ -2,6 +2,8 @@ import unittest
 from typing import Optional
 
 class TrieNode:
+    __slots__ = ("ch", "count", "is_word_ending", "children")
+
     def __init__(self, ch):
         self.ch = ch
         self.count = 0